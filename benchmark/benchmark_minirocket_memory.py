@@ -0,0 +1,70 @@
+import multiprocessing
+import resource
+import sys
+
+import pandas as pd
+import torch
+
+from fedot_ind.core.models.nn.network_impl.mini_rocket import MiniRocketFeatures
+
+
+def _get_PPVs_broadcast(self, C, bias):
+    """Reference PPV computation via comparison of every value of C with every bias."""
+    C = C.unsqueeze(-1)
+    bias = bias.view(1, bias.shape[0], 1, bias.shape[1])
+    return (C > bias).float().mean(2).flatten(1)
+
+
+def _max_rss_mb() -> float:
+    # ru_maxrss is measured in kilobytes on Linux and in bytes on macOS
+    scale = 2 ** 20 if sys.platform == 'darwin' else 2 ** 10
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+def _measure(series_length: int, batch_size: int, num_features: int, broadcast: bool, queue):
+    torch.manual_seed(0)
+    model = MiniRocketFeatures(input_dim=1, seq_len=series_length, num_features=num_features, random_state=0)
+    data = torch.randn(batch_size, 1, series_length)
+    model.fit(data)
+    if broadcast:
+        MiniRocketFeatures._get_PPVs = _get_PPVs_broadcast
+    baseline = _max_rss_mb()
+    with torch.no_grad():
+        features = model(data)
+    queue.put((_max_rss_mb() - baseline, features.numpy()))
+
+
+def run_in_subprocess(*args):
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    process = context.Process(target=_measure, args=(*args, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def ppv_memory_benchmark(series_lengths=(128, 512, 2048, 8192),
+                         batch_size: int = 16,
+                         num_features: int = 10_000) -> pd.DataFrame:
+    """Compares peak memory of MiniRocket feature generation with the sorted PPV kernel and with
+    the reference broadcast comparison. Every measurement runs in a fresh process.
+
+    Returns:
+        dataframe with peak memory increments in MB and the flag of identical features.
+    """
+    report = []
+    for series_length in series_lengths:
+        searchsorted_memory, searchsorted_features = run_in_subprocess(series_length, batch_size,
+                                                                       num_features, False)
+        broadcast_memory, broadcast_features = run_in_subprocess(series_length, batch_size,
+                                                                 num_features, True)
+        report.append({'series_length': series_length,
+                       'broadcast_peak_mb': round(broadcast_memory, 1),
+                       'searchsorted_peak_mb': round(searchsorted_memory, 1),
+                       'identical': bool((broadcast_features == searchsorted_features).all())})
+    return pd.DataFrame(report)
+
+
+if __name__ == "__main__":
+    print(ppv_memory_benchmark())
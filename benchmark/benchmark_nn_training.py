@@ -0,0 +1,91 @@
+import timeit
+
+import pandas as pd
+from fedot.core.data.data import InputData
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+
+from fedot_ind.core.architecture.settings.computational import backend_methods as np
+from fedot_ind.core.models.nn.network_impl.inception import InceptionTimeModel
+from fedot_ind.core.models.nn.network_impl.omni_scale import OmniScaleModel
+from fedot_ind.core.models.nn.network_impl.resnet import ResNetModel
+
+MODELS = {'inception_model': (InceptionTimeModel, {}),
+          'omniscale_model': (OmniScaleModel, {}),
+          'resnet_model': (ResNetModel, {'model_name': 'ResNet18one'})}
+
+TRAINING_MODES = {'default': {},
+                  'performance': {'performance_mode': True, 'batch_size': 'auto'},
+                  'performance_compiled': {'performance_mode': True, 'batch_size': 'auto', 'compile_model': True}}
+
+
+class _EpochCountingLoader:
+    """Loader wrapper which counts passes over the train data, because training can be stopped early.
+    """
+
+    def __init__(self, loader):
+        self.loader = loader
+        self.dataset = loader.dataset
+        self.epochs = 0
+
+    def __len__(self):
+        return len(self.loader)
+
+    def __iter__(self):
+        self.epochs += 1
+        return iter(self.loader)
+
+
+def _count_epochs(model) -> list:
+    loaders = []
+    prepare_data = model._prepare_data
+
+    def prepare_counted_data(*args, **kwargs):
+        train_loader, val_loader = prepare_data(*args, **kwargs)
+        loaders.append(_EpochCountingLoader(train_loader))
+        return loaders[-1], val_loader
+
+    model._prepare_data = prepare_counted_data
+    return loaders
+
+
+def _classification_data(n_samples: int, series_length: int) -> InputData:
+    rng = np.random.default_rng(0)
+    target = np.arange(n_samples) % 2
+    features = rng.normal(size=(n_samples, 1, series_length)) + target[:, None, None]
+    return InputData(idx=np.arange(n_samples), features=features, target=target.reshape(-1, 1),
+                     task=Task(TaskTypesEnum.classification), data_type=DataTypesEnum.image)
+
+
+def training_speed_benchmark(models: tuple = tuple(MODELS),
+                             modes: tuple = tuple(TRAINING_MODES),
+                             n_samples: int = 1024,
+                             series_length: int = 256,
+                             epochs: int = 5) -> pd.DataFrame:
+    """Measures training speed of neural models in the default and performance training modes. Time of
+    compilation of compiled models is included, so they pay off only on long trainings.
+
+    Returns:
+        dataframe with the batch size and the number of epochs per second of each model in each mode.
+    """
+    report = []
+    for model_name in models:
+        for mode in modes:
+            data = _classification_data(n_samples, series_length)
+            model_class, params = MODELS[model_name]
+            model = model_class({'epochs': epochs, **params, **TRAINING_MODES[mode]})
+            loaders = _count_epochs(model)
+            start = timeit.default_timer()
+            model.fit(data)
+            elapsed = timeit.default_timer() - start
+            trained_epochs = sum(loader.epochs for loader in loaders)
+            report.append({'model': model_name,
+                           'mode': mode,
+                           'batch_size': model.batch_size,
+                           'epochs': trained_epochs,
+                           'epochs_per_second': round(trained_epochs / elapsed, 3)})
+    return pd.DataFrame(report)
+
+
+if __name__ == "__main__":
+    print(training_speed_benchmark())
@@ -0,0 +1,48 @@
+import timeit
+
+import pandas as pd
+
+from fedot_ind.core.architecture.settings.computational import backend_methods as np
+from fedot_ind.core.models.base_extractor import BaseExtractor
+from fedot_ind.core.models.topological.topological_extractor import TopologicalExtractor
+
+
+def _per_sample_features(extractor: TopologicalExtractor, samples: np.ndarray) -> np.ndarray:
+    # the previous path which embeds and computes persistence for one series at a time
+    return BaseExtractor._extract_chunk_features(extractor, samples)[0]
+
+
+def _batched_features(extractor: TopologicalExtractor, samples: np.ndarray) -> np.ndarray:
+    return extractor._extract_chunk_features(samples)[0]
+
+
+def topological_throughput_benchmark(series_lengths: tuple = (100, 300, 1000),
+                                     n_samples: int = 50,
+                                     window_size: int = 30,
+                                     n_landmarks: int = 50) -> pd.DataFrame:
+    """Compares throughput of topological feature generation for one chunk of samples by the per-sample path
+    and by the batched topology engine without and with landmark subsampling.
+
+    Returns:
+        dataframe with series per second of each path and the flag of identical features of the batched engine.
+    """
+    rng = np.random.default_rng(0)
+    report = []
+    for series_length in series_lengths:
+        samples = np.cumsum(rng.normal(size=(n_samples, 1, series_length)), axis=2)
+        row = {'series_length': series_length}
+        features = {}
+        for path, params, generate in [('per_sample', {}, _per_sample_features),
+                                       ('batched', {}, _batched_features),
+                                       ('batched_landmarks', {'n_landmarks': n_landmarks}, _batched_features)]:
+            extractor = TopologicalExtractor({'window_size': window_size, **params})
+            start = timeit.default_timer()
+            features[path] = generate(extractor, samples)
+            row[f'{path}_series_per_second'] = round(n_samples / (timeit.default_timer() - start), 1)
+        row['identical'] = bool(np.array_equal(features['per_sample'], features['batched'], equal_nan=True))
+        report.append(row)
+    return pd.DataFrame(report)
+
+
+if __name__ == "__main__":
+    print(topological_throughput_benchmark())
@@ -18,8 +18,10 @@ from fedot_ind.api.utils.checkers_collections import DataCheck
 from fedot_ind.api.utils.industrial_strategy import IndustrialStrategy
 from fedot_ind.api.utils.path_lib import DEFAULT_PATH_RESULTS as default_path_to_save_results
 from fedot_ind.core.architecture.abstraction.decorators import DaskServer
+from fedot_ind.core.architecture.pipelines.frozen_pipeline import FrozenPipeline
 from fedot_ind.core.architecture.preprocessing.data_convertor import ApiConverter
 from fedot_ind.core.architecture.settings.computational import BackendMethods
+from fedot_ind.core.architecture.settings.parallel_backend import WorkerPool
 from fedot_ind.core.operation.transformation.splitter import TSTransformer
 from fedot_ind.core.optimizer.IndustrialEvoOptimizer import IndustrialEvoOptimizer
 from fedot_ind.core.repository.constanst_repository import \
@@ -66,6 +68,14 @@ class FedotIndustrial(Fedot):
             probs = industrial.predict_proba(test_features=test_data[0])
             metric = industrial.get_metrics(target=test_data[1], metric_names=['f1', 'roc_auc'])
 
+        Industrial operations share a pool of ``n_jobs`` worker processes which is started on the first
+        fit and stopped by ``shutdown``. Use the class as a context manager to bound the lifetime of
+        the workers::
+
+            with FedotIndustrial(problem='ts_classification', n_jobs=4) as industrial:
+                industrial.fit(train_data)
+                labels = industrial.predict(test_data)
+
     """
 
     def __init__(self, **kwargs):
@@ -110,9 +120,12 @@ class FedotIndustrial(Fedot):
         self.solver = None
         self.predicted_labels = None
         self.predicted_probs = None
+        self.train_data = None
         self.predict_data = None
         self.target_encoder = None
         self.is_finetuned = False
+        self.dask_client = None
+        self.worker_pool = WorkerPool(n_jobs=kwargs.get('n_jobs', None))
 
         # map Fedot params to Industrial params
         self.config_dict = kwargs
@@ -157,7 +170,15 @@ class FedotIndustrial(Fedot):
         globals()['backend_methods'] = backend_method_current
         globals()['backend_scipy'] = backend_scipy_current
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+
     def __init_solver(self):
+        self.logger.info('Initialising worker pool')
+        self.worker_pool.start()
         self.logger.info('Initialising Industrial Repository')
         self.repo = IndustrialModels().setup_repository()
         self.logger.info('Initialising Dask Server')
@@ -169,8 +190,10 @@ class FedotIndustrial(Fedot):
         self.solver = Fedot(**self.config_dict)
 
     def shutdown(self):
-        self.dask_client.close()
-        del self.dask_client
+        self.worker_pool.shutdown()
+        if self.dask_client is not None:
+            self.dask_client.close()
+            self.dask_client = None
 
     def fit(self,
             input_data: tuple,
@@ -183,9 +206,8 @@ class FedotIndustrial(Fedot):
             **kwargs: additional parameters
 
         """
-        self.train_data = deepcopy(
-            input_data)  # we do not want to make inplace changes
-        input_preproc = DataCheck(input_data=self.train_data, task=self.config_dict['problem'],
+        # input data is not copied, DataCheck shares it read-only and copies only converted or cleaned arrays
+        input_preproc = DataCheck(input_data=input_data, task=self.config_dict['problem'],
                                   task_params=self.task_params, industrial_task_params=self.industrial_strategy_params)
         self.train_data = input_preproc.check_input_data()
         self.target_encoder = input_preproc.get_target_encoder()
@@ -211,9 +233,7 @@ class FedotIndustrial(Fedot):
             the array with prediction values
 
         """
-        self.predict_data = deepcopy(
-            predict_data)  # we do not want to make inplace changes
-        self.predict_data = DataCheck(input_data=self.predict_data,
+        self.predict_data = DataCheck(input_data=predict_data,
                                       task=self.config_dict['problem'],
                                       task_params=self.task_params,
                                       industrial_task_params=self.industrial_strategy_params).check_input_data()
@@ -267,9 +287,7 @@ class FedotIndustrial(Fedot):
             the array with prediction probabilities
 
         """
-        self.predict_data = deepcopy(
-            predict_data)  # we do not want to make inplace changes
-        self.predict_data = DataCheck(input_data=self.predict_data,
+        self.predict_data = DataCheck(input_data=predict_data,
                                       task=self.config_dict['problem'],
                                       task_params=self.task_params,
                                       industrial_task_params=self.industrial_strategy_params).check_input_data()
@@ -471,6 +489,32 @@ class FedotIndustrial(Fedot):
             self.solver.current_pipeline.save(
                 f'./raf_ensemble/ensemble_composed', create_subdir=True)
 
+    def freeze(self, input_shape: tuple = None) -> FrozenPipeline:
+        """Exports fitted or loaded model as a lean predictor which scores numpy arrays without graph traversal
+        and data checks. See :class:`FrozenPipeline` for the latency budget.
+
+        Args:
+            input_shape: shape of one sample ``(channels, length)``. Taken from train data if the model was fitted.
+
+        Returns:
+            frozen pipeline with ``predict`` and ``predict_proba`` methods.
+
+        """
+        if self.condition_check.solver_is_fedot_class(self.solver):
+            pipeline = self.solver.current_pipeline
+        elif self.condition_check.solver_is_pipeline_class(self.solver):
+            pipeline = self.solver
+        else:
+            raise ValueError('Only a single fitted pipeline can be frozen')
+        if input_shape is None:
+            if self.train_data is None:
+                raise ValueError('Input shape is required to freeze a loaded model')
+            input_shape = self.train_data.features.shape[1:]
+        return FrozenPipeline(pipeline,
+                              input_shape=input_shape,
+                              task_type=self.config_dict['problem'],
+                              target_encoder=self.target_encoder)
+
     def explain(self, **kwargs):
         """Explain model's prediction via time series points perturbation
 
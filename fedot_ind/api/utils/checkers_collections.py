@@ -7,7 +7,7 @@ from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.repository.tasks import Task, TsForecastingParams, TaskTypesEnum
 from sklearn.preprocessing import LabelEncoder
 
-from fedot_ind.api.utils.data import check_multivariate_data
+from fedot_ind.api.utils.data import check_multivariate_data, convert_to_float_array, read_only_view
 from fedot_ind.core.architecture.preprocessing.data_convertor import NumpyConverter, DataConverter
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
 from fedot_ind.core.repository.constanst_repository import FEDOT_TASK
@@ -47,18 +47,22 @@ class DataCheck:
         multi_target = len(y.shape) > 1 and y.shape[1] > 2
 
         if multi_features:
-            features = np.array(X.tolist()).astype(float)
+            features = convert_to_float_array(X)
         else:
             features = X
+        if isinstance(features, np.ndarray) and np.may_share_memory(features, X):
+            # features are not copied, so the caller's data is shared read-only
+            features = read_only_view(features)
 
         if isinstance(y, (pd.DataFrame, pd.Series)):
             y = y.values
+        # target is small and is modified in place by the checks below, so it is always copied
         if multi_target:
-            target = y
+            target = np.array(y)
         elif multi_features and not multi_target:
-            target = y.reshape(-1, 1)
+            target = np.array(y).reshape(-1, 1)
         else:
-            target = np.ravel(y).reshape(-1, 1)
+            target = np.array(np.ravel(y)).reshape(-1, 1)
 
         return features, multi_features, target
 
@@ -118,14 +122,13 @@ class DataCheck:
     def _check_input_data_features(self):
         """Checks and preprocesses the features in the input data.
 
-        - Replaces NaN and infinite values with 0.
+        - Replaces NaN and infinite values with 0. Features are copied only if there are such values.
         - Converts features to torch format using NumpyConverter.
 
         """
-        self.input_data.features = np.where(
-            np.isnan(self.input_data.features), 0, self.input_data.features)
-        self.input_data.features = np.where(
-            np.isinf(self.input_data.features), 0, self.input_data.features)
+        is_finite = np.isfinite(self.input_data.features)
+        if not is_finite.all():
+            self.input_data.features = np.where(is_finite, self.input_data.features, 0)
         if self.task != 'ts_forecasting':
             self.input_data.features = NumpyConverter(
                 data=self.input_data.features).convert_to_torch_format()
@@ -24,6 +24,44 @@ def check_multivariate_data(data: pd.DataFrame) -> tuple:
         return isinstance(data.iloc[0, 0], pd.Series), data.values
 
 
+def convert_to_float_array(data: np.ndarray) -> np.ndarray:
+    """
+    Converts features to a float array in one pass. Numeric arrays of float dtype are returned without copying
+    and arrays of nested series (e.g. values of multivariate DataFrame) are written directly into a preallocated
+    array instead of a round-trip through Python lists.
+
+    Args:
+        data: numeric array or array of objects with series of equal length.
+
+    Returns:
+        np.ndarray: float array, nested series form the last axis.
+    """
+    if data.dtype != object:
+        return np.asarray(data, dtype=float)
+    cell_shape = np.shape(data.flat[0])
+    features = np.empty(data.shape + cell_shape, dtype=float)
+    for index, cell in np.ndenumerate(data):
+        features[index] = cell
+    return features
+
+
+def read_only_view(array: np.ndarray) -> np.ndarray:
+    """
+    Returns a view of the array which can not be modified in place. The caller's array stays writable, while
+    operations which try to modify the view raise an error instead of silently changing the caller's data,
+    so they have to work on their own copy.
+
+    Args:
+        array: array to be shared.
+
+    Returns:
+        np.ndarray: read-only view of the array.
+    """
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
 def init_input_data(X: pd.DataFrame,
                     y: Optional[np.ndarray],
                     task: str = 'classification') -> InputData:
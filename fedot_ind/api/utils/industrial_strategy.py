@@ -177,7 +177,8 @@ class IndustrialStrategy:
     def _kernel_predict(self,
                         input_data,
                         mode: str = 'labels'):
-        labels_dict = {k: v.predict(input_data, mode).predict for k, v in self.solver.items()}
+        labels_dict = {k: v.predict(self.kernel_ensembler.generate_features(input_data, k), mode).predict
+                       for k, v in self.solver.items()}
         return labels_dict
 
     def _check_predictions(self, predictions):
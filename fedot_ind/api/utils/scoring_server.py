@@ -0,0 +1,161 @@
+import queue
+import threading
+import timeit
+from collections import deque
+from concurrent.futures import Future
+
+from fedot_ind.api.main import FedotIndustrial
+from fedot_ind.core.architecture.settings.computational import backend_methods as np
+
+# number of the last requests and batches kept for metrics
+METRICS_WINDOW = 10000
+# period of checking the stop flag by idle worker in seconds
+IDLE_POLL_INTERVAL = 0.1
+
+
+class MicroBatchingServer:
+    """Local scoring front-end which collects concurrent single-series requests into micro-batches. A batch is
+    closed when it has ``max_batch_size`` series or when ``max_wait`` seconds have passed since its first request.
+    Each batch is scored by one vectorized call of the model and the results are distributed back to the requests.
+
+    All calls of the model are made from one worker thread, so models which are not thread-safe (e.g.
+    ``FedotIndustrial``, which stores the last predicted data) can be served from many threads.
+
+    Args:
+        model: ``FedotIndustrial`` or any model with ``predict`` and ``predict_proba`` methods taking an array of
+            series, e.g. :class:`FrozenPipeline`.
+        max_batch_size: maximal number of series in a batch.
+        max_wait: maximal time in seconds that the first request of a batch waits for other requests.
+
+    Examples:
+        >>> with MicroBatchingServer(industrial_model, max_batch_size=32, max_wait=0.005) as server:
+        ...     label = server.predict(series)
+        ...     print(server.metrics())
+    """
+
+    def __init__(self, model, max_batch_size: int = 64, max_wait: float = 0.005):
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._requests = queue.Queue()
+        self._stop_event = threading.Event()
+        self._worker = None
+        self._metrics_lock = threading.Lock()
+        self._latencies = deque(maxlen=METRICS_WINDOW)
+        self._batch_sizes = deque(maxlen=METRICS_WINDOW)
+        self._n_requests = 0
+
+    def start(self):
+        """Starts the worker thread.
+        """
+        if self._worker is None:
+            self._stop_event.clear()
+            self._worker = threading.Thread(target=self._serve, name='MicroBatchingServer', daemon=True)
+            self._worker.start()
+        return self
+
+    def shutdown(self):
+        """Scores the requests submitted before the call and stops the worker thread.
+        """
+        if self._worker is not None:
+            self._stop_event.set()
+            self._worker.join()
+            self._worker = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+
+    def submit(self, features: np.ndarray, method: str = 'predict') -> Future:
+        """Submits one series for scoring.
+
+        Args:
+            features: one series of shape ``(length,)`` or ``(channels, length)``.
+            method: ``'predict'`` or ``'predict_proba'``.
+
+        Returns:
+            future with the prediction for the series.
+        """
+        if method not in ('predict', 'predict_proba'):
+            raise ValueError(f'Unknown scoring method {method}')
+        if self._worker is None:
+            raise RuntimeError('Server is not started')
+        future = Future()
+        self._requests.put((method, np.asarray(features), future, timeit.default_timer()))
+        return future
+
+    def predict(self, features: np.ndarray, timeout: float = None):
+        return self.submit(features, 'predict').result(timeout)
+
+    def predict_proba(self, features: np.ndarray, timeout: float = None):
+        return self.submit(features, 'predict_proba').result(timeout)
+
+    def metrics(self) -> dict:
+        """Returns number of scored requests and batches, batch sizes and latency percentiles in seconds over the
+        last ``METRICS_WINDOW`` requests and batches.
+        """
+        with self._metrics_lock:
+            latencies = np.array(self._latencies)
+            batch_sizes = np.array(self._batch_sizes)
+            n_requests = self._n_requests
+        if not len(latencies):
+            return {'requests': 0, 'batches': 0}
+        return {'requests': n_requests,
+                'batches': len(batch_sizes),
+                'mean_batch_size': float(batch_sizes.mean()),
+                'max_batch_size': int(batch_sizes.max()),
+                'latency_p50': float(np.percentile(latencies, 50)),
+                'latency_p95': float(np.percentile(latencies, 95)),
+                'latency_p99': float(np.percentile(latencies, 99))}
+
+    def _collect_batch(self) -> list:
+        try:
+            batch = [self._requests.get(timeout=IDLE_POLL_INTERVAL)]
+        except queue.Empty:
+            return []
+        deadline = timeit.default_timer() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - timeit.default_timer()
+            try:
+                batch.append(self._requests.get(timeout=timeout) if timeout > 0 else self._requests.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _serve(self):
+        while not (self._stop_event.is_set() and self._requests.empty()):
+            batch = self._collect_batch()
+            # series of one batch can be scored together only by the same method and with the same shape
+            groups = {}
+            for request in batch:
+                groups.setdefault((request[0], request[1].shape), []).append(request)
+            for (method, _), requests in groups.items():
+                self._score(method, requests)
+
+    def _call_model(self, method: str, features: np.ndarray) -> np.ndarray:
+        if isinstance(self.model, FedotIndustrial):
+            # FedotIndustrial takes the tuple of features and target, which is not used for scoring
+            return getattr(self.model, method)((features, np.zeros(len(features))))
+        return getattr(self.model, method)(features)
+
+    def _score(self, method: str, requests: list):
+        latencies = []
+        try:
+            prediction = self._call_model(method, np.stack([request[1] for request in requests]))
+            if len(prediction) != len(requests):
+                raise ValueError(f'Model returned {len(prediction)} predictions for {len(requests)} series')
+            for index, (_, _, future, submit_time) in enumerate(requests):
+                future.set_result(prediction[index])
+                latencies.append(timeit.default_timer() - submit_time)
+        except Exception as ex:
+            # the serving thread must survive any failure of a batch, otherwise pending requests never resolve
+            for request in requests:
+                if not request[2].done():
+                    request[2].set_exception(ex)
+            return
+        with self._metrics_lock:
+            self._n_requests += len(requests)
+            self._batch_sizes.append(len(requests))
+            self._latencies.extend(latencies)
@@ -0,0 +1,190 @@
+import timeit
+from typing import Optional
+
+from fedot.core.data.data import InputData, OutputData
+from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+from sklearn.base import BaseEstimator
+
+from fedot_ind.core.architecture.preprocessing.data_convertor import NumpyConverter
+from fedot_ind.core.architecture.settings.computational import backend_methods as np
+from fedot_ind.core.operation.IndustrialCachableOperation import IndustrialCachableOperationImplementation
+from fedot_ind.core.repository.industrial_implementations.abstract import merge_predicts
+
+# per-call latency budget of scoring of one series by a frozen pipeline in seconds
+FROZEN_PIPELINE_LATENCY_BUDGET = 0.01
+
+
+def _unwrap(prediction):
+    return prediction.predict if isinstance(prediction, OutputData) else prediction
+
+
+class FrozenPipeline:
+    """Lean predictor made from a fitted pipeline. Nodes are stored in precomputed order with their fitted
+    operations, input is converted to the fixed dtype and shape once, and operations are called directly
+    without graph traversal, data checks and dispatching of evaluation strategies. Feature caching of
+    operations is disabled.
+
+    Latency budget of scoring of one series is ``FROZEN_PIPELINE_LATENCY_BUDGET`` (10 ms). The frozen path itself
+    adds a fraction of a millisecond per node, so the latency is defined by the fitted operations: pipelines of
+    statistical generators and classical models fit into the budget, while heavy generators (e.g. topological or
+    recurrence extractors on long series) can exceed it on their own. Use :meth:`measure_latency` to check a
+    pipeline against the budget before serving it.
+
+    Args:
+        pipeline: fitted pipeline.
+        input_shape: shape of one sample, ``(channels, length)``.
+        task_type: type of the task, ``'classification'`` or ``'regression'``.
+        dtype: dtype of input features.
+        target_encoder: fitted label encoder of the target, used to decode predicted labels.
+
+    Examples:
+        >>> frozen = FrozenPipeline(fitted_pipeline, input_shape=(1, 100))
+        >>> labels = frozen.predict(series)
+    """
+
+    def __init__(self,
+                 pipeline: Pipeline,
+                 input_shape: tuple,
+                 task_type: str = 'classification',
+                 dtype=np.float64,
+                 target_encoder=None):
+        if task_type not in ('classification', 'regression'):
+            raise ValueError(f'Pipelines for {task_type} task can not be frozen')
+        self.input_shape = tuple(input_shape)
+        self.dtype = np.dtype(dtype)
+        self.task_type = task_type
+        self.target_encoder = target_encoder
+        self.task = Task(TaskTypesEnum(task_type))
+        self.steps = self._freeze_nodes(pipeline)
+
+    def _freeze_nodes(self, pipeline: Pipeline) -> list:
+        # depth-first post-order from the root places every node after all of its parents
+        nodes = []
+
+        def visit(node):
+            if node in nodes:
+                return
+            for parent in node.nodes_from:
+                visit(parent)
+            nodes.append(node)
+
+        for root in pipeline.root_nodes():
+            visit(root)
+        steps = []
+        for node in nodes:
+            operation = node.fitted_operation
+            if operation is None:
+                raise ValueError(f'Node {node.name} is not fitted')
+            parents = [nodes.index(parent) for parent in node.nodes_from]
+            steps.append((node.name, self._get_operation_kind(node.name, operation), operation, parents))
+        return steps
+
+    @staticmethod
+    def _get_operation_kind(name: str, operation) -> str:
+        if isinstance(operation, list):
+            return 'channel_independent'
+        elif isinstance(operation, IndustrialCachableOperationImplementation):
+            return 'industrial_transform'
+        elif isinstance(operation, BaseEstimator) and hasattr(operation, 'predict'):
+            return 'sklearn_model'
+        elif isinstance(operation, BaseEstimator) and hasattr(operation, 'transform'):
+            return 'sklearn_transform'
+        elif hasattr(operation, 'transform'):
+            return 'transform'
+        elif hasattr(operation, 'predict'):
+            return 'predict'
+        raise ValueError(f'Operation {name} of type {type(operation)} can not be frozen')
+
+    def _to_input_data(self, features: np.ndarray) -> InputData:
+        return InputData(idx=np.arange(len(features)),
+                         features=features,
+                         target=None,
+                         task=self.task,
+                         data_type=DataTypesEnum.image)
+
+    def _apply_model(self, model, features: np.ndarray, output_mode: str) -> np.ndarray:
+        features = features.reshape(features.shape[0], -1)
+        if self.task_type != 'classification':
+            return model.predict(features).flatten()
+        elif output_mode == 'labels':
+            return model.predict(features).reshape(-1, 1)
+        probs = model.predict_proba(features)
+        return probs[:, 1] if probs.shape[1] == 2 and output_mode != 'full_probs' else probs
+
+    def _apply_operation(self, kind: str, operation, features: np.ndarray, output_mode: str) -> np.ndarray:
+        if kind == 'channel_independent':
+            channels = features.swapaxes(1, 0)
+            prediction = [self._apply_operation(self._get_operation_kind('channel', channel_operation),
+                                                channel_operation, channel, output_mode)
+                          for channel_operation, channel in zip(operation, channels)]
+            return NumpyConverter(data=np.hstack(prediction)).convert_to_torch_format()
+        elif kind == 'industrial_transform':
+            return _unwrap(operation.transform(self._to_input_data(features), use_cache=False))
+        elif kind == 'sklearn_model':
+            return self._apply_model(operation, features, output_mode)
+        elif kind == 'sklearn_transform':
+            return operation.transform(features)
+        elif kind == 'transform':
+            return _unwrap(operation.transform(self._to_input_data(features)))
+        return _unwrap(operation.predict(self._to_input_data(features), output_mode))
+
+    def _check_features(self, features) -> np.ndarray:
+        features = np.asarray(features, dtype=self.dtype)
+        if features.shape == self.input_shape or features.shape == self.input_shape[1:]:
+            features = features.reshape((1,) + self.input_shape)
+        elif features.ndim == len(self.input_shape) and self.input_shape[0] == 1:
+            features = features.reshape((features.shape[0],) + self.input_shape)
+        if features.shape[1:] != self.input_shape:
+            raise ValueError(f'Expected samples of shape {self.input_shape}, got {features.shape[1:]}')
+        return features
+
+    def _predict(self, features, output_mode: str) -> np.ndarray:
+        features = self._check_features(features)
+        outputs = []
+        for index, (_, kind, operation, parents) in enumerate(self.steps):
+            if not parents:
+                step_input = features
+            elif len(parents) == 1:
+                step_input = outputs[parents[0]]
+            else:
+                step_input = merge_predicts(None, [outputs[parent] for parent in parents])
+            step_output_mode = output_mode if index == len(self.steps) - 1 else 'default'
+            outputs.append(self._apply_operation(kind, operation, step_input, step_output_mode))
+        return outputs[-1]
+
+    def predict(self, features) -> np.ndarray:
+        """Predicts labels for classification or values for regression.
+
+        Args:
+            features: one series of shape ``input_shape`` or a batch of series.
+
+        Returns:
+            array of predictions, one row per series.
+        """
+        prediction = self._predict(features, 'labels')
+        if self.target_encoder is not None:
+            prediction = self.target_encoder.inverse_transform(np.ravel(prediction).astype(int))
+        return prediction
+
+    def predict_proba(self, features) -> np.ndarray:
+        """Predicts probabilities of classes in the same format as ``FedotIndustrial.predict_proba``.
+        """
+        return self._predict(features, 'probs')
+
+    def measure_latency(self, features: Optional[np.ndarray] = None, n_runs: int = 100) -> float:
+        """Returns median latency of scoring of one series in seconds.
+
+        Args:
+            features: series to score, random series of ``input_shape`` by default.
+            n_runs: number of calls.
+        """
+        if features is None:
+            features = np.random.rand(*self.input_shape)
+        latencies = []
+        for _ in range(n_runs):
+            start = timeit.default_timer()
+            self.predict(features)
+            latencies.append(timeit.default_timer() - start)
+        return float(np.median(latencies))
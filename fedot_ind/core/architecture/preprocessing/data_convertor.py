@@ -1,3 +1,4 @@
+from copy import copy
 from functools import partial
 from inspect import signature
 
@@ -18,6 +19,18 @@ from fedot_ind.core.architecture.settings.computational import backend_methods a
 from fedot_ind.core.architecture.settings.computational import default_device
 from fedot_ind.core.repository.constanst_repository import MATRIX, MULTI_ARRAY
 
+# number of samples checked at once for NaN and infinite values, so memory maps are not read into memory entirely
+FINITE_CHECK_CHUNK_SIZE = 4096
+
+
+def all_finite(array: np.ndarray) -> bool:
+    """Checks that array has no NaN or infinite values reading it by chunks of samples.
+    """
+    if np.ndim(array) == 0:
+        return bool(np.isfinite(array))
+    return all(np.isfinite(array[start:start + FINITE_CHECK_CHUNK_SIZE]).all()
+               for start in range(0, len(array), FINITE_CHECK_CHUNK_SIZE))
+
 
 class CustomDatasetTS:
     def __init__(self, ts):
@@ -36,6 +49,11 @@ class CustomDatasetTS:
 class CustomDatasetCLF:
     def __init__(self, ts):
         self.x = torch.from_numpy(ts.features).to(default_device()).float()
+        self.y = self._encode_target(ts).to(default_device())
+        self.n_samples = ts.features.shape[0]
+        self.supplementary_data = ts.supplementary_data
+
+    def _encode_target(self, ts) -> torch.Tensor:
         if ts.task.task_type.value == 'classification':
             label_1 = max(ts.class_labels)
             label_0 = min(ts.class_labels)
@@ -55,19 +73,17 @@ class CustomDatasetCLF:
                 self.label_encoder = None
 
             try:
-                self.y = torch.nn.functional.one_hot(torch.from_numpy(ts.target).long(),
-                                                     num_classes=self.classes).to(default_device()).squeeze(1)
+                y = torch.nn.functional.one_hot(torch.from_numpy(ts.target).long(),
+                                                num_classes=self.classes).squeeze(1)
             except Exception:
-                self.y = torch.nn.functional.one_hot(torch.from_numpy(
-                    ts.target).long()).to(default_device()).squeeze(1)
-                self.classes = self.y.shape[1]
+                y = torch.nn.functional.one_hot(torch.from_numpy(
+                    ts.target).long()).squeeze(1)
+                self.classes = y.shape[1]
         else:
-            self.y = torch.from_numpy(ts.target).to(default_device()).float()
+            y = torch.from_numpy(ts.target).float()
             self.classes = 1
             self.label_encoder = None
-
-        self.n_samples = ts.features.shape[0]
-        self.supplementary_data = ts.supplementary_data
+        return y
 
     def __getitem__(self, index):
         return self.x[index], self.y[index]
@@ -76,6 +92,64 @@ class CustomDatasetCLF:
         return self.n_samples
 
 
+class LazyDatasetCLF(CustomDatasetCLF):
+    """Dataset which keeps features in their storage (e.g. ``np.memmap`` or zarr array) and reads only the samples
+    of a requested batch, converting them to float32 tensors. Targets are encoded once for the whole data and
+    kept on CPU, so batches can be pinned by ``torch.utils.data.DataLoader``. Subsets made by :meth:`subset`
+    share features and targets and differ only by indices of samples.
+
+    Worker processes of the loader get the dataset by fork, which shares the memory map instead of copying it.
+
+    Args:
+        ts: input data with features of shape ``(n_samples, ...)``.
+        indices: indices of samples of the dataset, all samples by default.
+    """
+
+    def __init__(self, ts, indices: np.ndarray = None):
+        self.features = ts.features
+        self.y = self._encode_target(ts)
+        self.indices = np.arange(self.features.shape[0]) if indices is None else np.asarray(indices)
+        self.n_samples = len(self.indices)
+        self.supplementary_data = ts.supplementary_data
+
+    @classmethod
+    def from_features(cls, features) -> 'LazyDatasetCLF':
+        """Creates the dataset of unlabeled samples, e.g. for prediction. Targets of its samples are zeros.
+        """
+        dataset = cls.__new__(cls)
+        dataset.features = features
+        dataset.y = torch.zeros(features.shape[0], 1)
+        dataset.indices = np.arange(features.shape[0])
+        dataset.n_samples = len(dataset.indices)
+        dataset.supplementary_data = None
+        dataset.label_encoder = None
+        return dataset
+
+    def subset(self, indices: np.ndarray) -> 'LazyDatasetCLF':
+        """Returns the dataset of the samples with the given positions in this dataset.
+        """
+        dataset = copy(self)
+        dataset.indices = self.indices[indices]
+        dataset.n_samples = len(dataset.indices)
+        return dataset
+
+    def _read_samples(self, sample_indices: np.ndarray) -> torch.Tensor:
+        # samples are read in the order of storage, so pages of a memory map are read sequentially
+        order = np.argsort(sample_indices)
+        samples = np.empty((len(sample_indices),) + self.features.shape[1:], dtype=np.float32)
+        samples[order] = self.features[sample_indices[order]]
+        return torch.from_numpy(samples)
+
+    def __getitem__(self, index):
+        sample_index = self.indices[index]
+        return self._read_samples(np.array([sample_index]))[0], self.y[sample_index]
+
+    def __getitems__(self, batch_indices: list) -> list:
+        sample_indices = self.indices[batch_indices]
+        samples = self._read_samples(sample_indices)
+        return list(zip(samples, self.y[torch.from_numpy(sample_indices)]))
+
+
 class FedotConverter:
     def __init__(self, data):
         self.input_data = self.convert_to_input_data(data)
@@ -259,10 +333,9 @@ class TensorConverter:
 class NumpyConverter:
     def __init__(self, data):
         self.numpy_data = self.convert_to_array(data)
-        self.numpy_data = np.where(
-            np.isnan(self.numpy_data), 0, self.numpy_data)
-        self.numpy_data = np.where(
-            np.isinf(self.numpy_data), 0, self.numpy_data)
+        # data is copied only if there are NaN or infinite values to replace
+        if not all_finite(self.numpy_data):
+            self.numpy_data = np.where(np.isfinite(self.numpy_data), self.numpy_data, 0)
 
     def convert_to_array(self, data):
         if isinstance(data, tuple):
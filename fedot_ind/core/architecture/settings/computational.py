@@ -86,3 +86,16 @@ def default_device(device_type: str = 'CUDA'):
             return torch.device(torch.cuda.current_device())
         if _has_mps():
             return torch.device("mps")
+
+
+def bf16_supported(device: torch.device) -> bool:
+    """Checks that bfloat16 autocast is supported by the hardware of the device.
+    """
+    if device.type == 'cuda':
+        return torch.cuda.is_bf16_supported()
+    if device.type != 'cpu':
+        return False
+    try:
+        return torch.ops.mkldnn._is_mkldnn_bf16_supported()
+    except (AttributeError, RuntimeError):
+        return False
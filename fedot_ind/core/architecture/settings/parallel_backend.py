@@ -0,0 +1,250 @@
+import importlib
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from multiprocessing import cpu_count
+
+from joblib.externals.loky import get_reusable_executor, ProcessPoolExecutor
+
+from fedot_ind.core.architecture.settings.computational import backend_methods as np
+
+# folder for memory maps shared with worker processes, RAM-backed where available
+SHARED_MEMORY_FOLDER = '/dev/shm' if os.path.isdir('/dev/shm') else None
+# modules imported by workers of WorkerPool on start
+WARM_START_MODULES = ('torch', 'fedot.api.main', 'fedot_ind.core.repository.initializer_industrial_models')
+
+_active_worker_pool = None
+_sequential_execution = False
+
+
+def resolve_n_jobs(n_jobs: int = None) -> int:
+    """Returns number of workers for the given ``n_jobs`` value. None means the default
+    ``CPU_NUMBERS`` and negative values are counted from the number of CPUs as in joblib.
+    """
+    if n_jobs is None:
+        from fedot_ind.core.repository.constanst_repository import CPU_NUMBERS
+        return CPU_NUMBERS
+    if n_jobs < 0:
+        n_jobs = cpu_count() + 1 + n_jobs
+    return max(1, n_jobs)
+
+
+def resolve_intra_op_threads(n_jobs: int = None) -> int:
+    """Returns number of threads for intra-op parallelism of torch. Inside :func:`sequential_execution`,
+    i.e. in workers which are already run in parallel, one thread is used to not oversubscribe CPUs.
+    """
+    return 1 if _sequential_execution else resolve_n_jobs(n_jobs)
+
+
+def _warm_start(modules: tuple):
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            pass
+
+
+def _worker_pid(_):
+    return os.getpid()
+
+
+class WorkerPool:
+    """Process-wide pool of worker processes shared by all industrial operations. While the pool is
+    active, :class:`ProcessBackend` submits chunks to it instead of creating its own workers, so workers
+    are spawned and import heavy modules only once per experiment.
+
+    Args:
+        n_jobs: number of workers, see :func:`resolve_n_jobs`.
+        warm_start_modules: modules imported by each worker on start.
+
+    Examples:
+        >>> with WorkerPool(n_jobs=4):
+        ...     features = QuantileExtractor({}).transform(input_data)
+    """
+
+    def __init__(self, n_jobs: int = None, warm_start_modules: tuple = WARM_START_MODULES):
+        self.n_jobs = resolve_n_jobs(n_jobs)
+        self.warm_start_modules = warm_start_modules
+        self.executor = None
+
+    @property
+    def is_active(self) -> bool:
+        return _active_worker_pool is self
+
+    def start(self):
+        """Spawns workers, waits until all of them finish the warm start and activates the pool.
+        """
+        global _active_worker_pool
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.n_jobs,
+                                                initializer=_warm_start,
+                                                initargs=(self.warm_start_modules,))
+            list(self.executor.map(_worker_pid, range(self.n_jobs)))
+        _active_worker_pool = self
+        return self
+
+    def restart(self):
+        """Kills workers, e.g. to stop tasks which exceeded their time limit, and spawns new ones.
+        """
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, kill_workers=True)
+            self.executor = None
+        return self.start()
+
+    def shutdown(self, wait: bool = True):
+        """Deactivates the pool and stops its workers.
+        """
+        global _active_worker_pool
+        if self.is_active:
+            _active_worker_pool = None
+        if self.executor is not None:
+            self.executor.shutdown(wait=wait)
+            self.executor = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+
+
+def get_worker_pool():
+    """Returns the active :class:`WorkerPool` or None.
+    """
+    return _active_worker_pool
+
+
+def _apply_to_memmap(func: callable, file_path: str, start: int, stop: int):
+    samples = np.load(file_path, mmap_mode='r')
+    return func(samples[start:stop])
+
+
+class SequentialBackend:
+    """Backend which processes all samples in the calling process.
+    """
+
+    def __init__(self, n_jobs: int = 1):
+        self.n_jobs = 1
+
+    def map_chunks(self, func: callable, samples: np.ndarray) -> list:
+        return [func(samples)]
+
+    def map_tasks(self, func: callable, tasks: list) -> list:
+        return [func(task) for task in tasks]
+
+
+class ThreadingBackend:
+    """Backend which processes contiguous chunks of samples in a pool of threads. Suitable for
+    extractors which release the GIL in NumPy or compiled code. Pools are shared between backends
+    with the same number of workers.
+    """
+    _executors = {}
+
+    def __init__(self, n_jobs: int = None):
+        self.n_jobs = resolve_n_jobs(n_jobs)
+
+    def _get_executor(self):
+        if self.n_jobs not in self._executors:
+            self._executors[self.n_jobs] = ThreadPoolExecutor(max_workers=self.n_jobs)
+        return self._executors[self.n_jobs]
+
+    def _chunk_bounds(self, n_samples: int) -> list:
+        bounds = np.linspace(0, n_samples, min(self.n_jobs, n_samples) + 1).astype(int)
+        return list(zip(bounds[:-1], bounds[1:]))
+
+    def map_chunks(self, func: callable, samples: np.ndarray) -> list:
+        """Applies ``func`` to contiguous chunks of ``samples``, one chunk per worker.
+
+        Args:
+            func: function which takes an array of samples and returns a result for them.
+            samples: array of samples, the first axis is split into chunks.
+
+        Returns:
+            list of results for chunks in order of samples.
+        """
+        if self.n_jobs == 1 or len(samples) < 2:
+            return [func(samples)]
+        executor = self._get_executor()
+        futures = [executor.submit(func, samples[start:stop]) for start, stop in self._chunk_bounds(len(samples))]
+        return [future.result() for future in futures]
+
+    def map_tasks(self, func: callable, tasks: list) -> list:
+        """Applies ``func`` to each of independent tasks, e.g. to fit several models at once. Unlike
+        :meth:`map_chunks`, tasks and their results are sent to workers as they are.
+
+        Returns:
+            list of results in order of tasks.
+        """
+        if self.n_jobs == 1 or len(tasks) < 2:
+            return [func(task) for task in tasks]
+        executor = self._get_executor()
+        futures = [executor.submit(func, task) for task in tasks]
+        return [future.result() for future in futures]
+
+
+class ProcessBackend(ThreadingBackend):
+    """Backend which processes contiguous chunks of samples in the active :class:`WorkerPool` or, if there
+    is none, in the reusable pool of loky worker processes. Samples are written once to a memory map in shared
+    memory, workers read their chunks from it without pickling, and only the results of chunks are sent back.
+    """
+
+    def _get_executor(self):
+        if _active_worker_pool is not None:
+            return _active_worker_pool.executor
+        # loky returns the same executor while the number of workers is unchanged
+        return get_reusable_executor(max_workers=self.n_jobs)
+
+    def map_chunks(self, func: callable, samples: np.ndarray) -> list:
+        if self.n_jobs == 1 or len(samples) < 2:
+            return [func(samples)]
+        samples = np.asarray(samples)
+        if samples.dtype.hasobject:
+            # arrays of objects can not be memory mapped, so chunks are pickled
+            return super().map_chunks(func, samples)
+        file_descriptor, file_path = tempfile.mkstemp(dir=SHARED_MEMORY_FOLDER, suffix='.npy')
+        try:
+            with os.fdopen(file_descriptor, 'wb') as shared_file:
+                np.save(shared_file, samples)
+            executor = self._get_executor()
+            futures = [executor.submit(_apply_to_memmap, func, file_path, start, stop)
+                       for start, stop in self._chunk_bounds(len(samples))]
+            return [future.result() for future in futures]
+        finally:
+            os.remove(file_path)
+
+
+PARALLEL_BACKENDS = {'sequential': SequentialBackend,
+                     'threading': ThreadingBackend,
+                     'loky': ProcessBackend}
+
+
+@contextmanager
+def sequential_execution():
+    """Makes :func:`get_parallel_backend` return the sequential backend inside the context. Used in workers
+    which are already run in parallel, e.g. evaluating pipelines during composition.
+    """
+    global _sequential_execution
+    previous_state, _sequential_execution = _sequential_execution, True
+    try:
+        yield
+    finally:
+        _sequential_execution = previous_state
+
+
+def get_parallel_backend(backend: str = 'loky', n_jobs: int = None):
+    """Returns parallel backend by its name. Inside :func:`sequential_execution` context the sequential
+    backend is always returned.
+
+    Args:
+        backend: one of ``'loky'`` (worker processes), ``'threading'`` or ``'sequential'``.
+        n_jobs: number of workers, see :func:`resolve_n_jobs`.
+
+    Returns:
+        backend object with ``map_chunks`` method.
+    """
+    if backend not in PARALLEL_BACKENDS:
+        raise ValueError(f'Unknown parallel backend {backend}. Available: {list(PARALLEL_BACKENDS)}')
+    if _sequential_execution:
+        return SequentialBackend()
+    return PARALLEL_BACKENDS[backend](n_jobs)
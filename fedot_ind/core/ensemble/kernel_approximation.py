@@ -0,0 +1,67 @@
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+from fedot_ind.core.architecture.settings.computational import backend_methods as np
+from fedot_ind.core.repository.constanst_repository import KERNEL_APPROXIMATION, KERNEL_APPROXIMATION_RANK
+
+
+def kernel_factors(features: np.ndarray,
+                   approximation: str = 'nystroem',
+                   n_components: int = KERNEL_APPROXIMATION_RANK,
+                   random_state: int = 0) -> np.ndarray:
+    """Approximates the RBF Gram matrix of standardized features by the low-rank factor ``F`` such that
+    ``K ≈ F @ F.T``. The factor takes ``O(n * n_components)`` memory instead of ``O(n ** 2)`` of the exact matrix.
+
+    Args:
+        features: feature matrix of shape ``(n_samples, n_features)``.
+        approximation: ``'nystroem'`` for the Nyström method or ``'random_features'`` for random Fourier features.
+        n_components: rank of the factor, it is limited by the number of samples for the Nyström method.
+        random_state: seed of landmarks or random features.
+
+    Returns:
+        factor of shape ``(n_samples, n_components)``.
+
+    """
+    features = np.nan_to_num(StandardScaler().fit_transform(features))
+    if approximation == 'nystroem':
+        n_components = min(n_components, features.shape[0])
+    approximator = KERNEL_APPROXIMATION[approximation](gamma=1. / features.shape[1],
+                                                       n_components=n_components,
+                                                       random_state=random_state)
+    return approximator.fit_transform(features)
+
+
+def _centered_alignment_weights(centered_factors: list, target: np.ndarray) -> np.ndarray:
+    # <Kc, yy^T> = ||Fc^T y||^2 and <Kc_i, Kc_j> = ||Fc_i^T Fc_j||^2 never materialize n x n matrices
+    alignments = np.array([np.sum((factor.T @ target) ** 2) for factor in centered_factors])
+    n_kernels = len(centered_factors)
+    products = np.zeros((n_kernels, n_kernels))
+    for i in range(n_kernels):
+        for j in range(i + 1):
+            products[i, j] = products[j, i] = np.sum((centered_factors[i].T @ centered_factors[j]) ** 2)
+    weights = np.linalg.inv(products) @ alignments
+    return weights / np.linalg.norm(weights)
+
+
+def centered_alignment_weights(factors: list, target: np.ndarray) -> pd.DataFrame:
+    """Computes weights of kernels by centered kernel alignment (as ``MKLpy.algorithms.CKA``) from low-rank
+    factors of kernels. Multiclass targets are split one-vs-rest.
+
+    Args:
+        factors: list of kernel factors of shape ``(n_samples, rank)``.
+        target: class labels of samples.
+
+    Returns:
+        dataframe of absolute kernel weights, one row per class or a single row for a binary target.
+
+    """
+    target = np.asarray(target).flatten()
+    centered_factors = [factor - factor.mean(axis=0) for factor in factors]
+    classes = np.unique(target)
+    if len(classes) == 2:
+        tasks = [classes[:1]]
+    else:
+        tasks = classes
+    weights = [abs(_centered_alignment_weights(centered_factors, np.where(target == label, 1., -1.)))
+               for label in tasks]
+    return pd.DataFrame(weights)
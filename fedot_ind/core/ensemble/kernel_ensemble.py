@@ -8,22 +8,45 @@ from MKLpy.scheduler import ReduceOnWorsening
 from fedot.core.data.data import InputData
 from fedot.core.operations.operation_parameters import OperationParameters
 from fedot.core.pipelines.pipeline_builder import PipelineBuilder
+from fedot.core.repository.dataset_types import DataTypesEnum
 from scipy.spatial.distance import pdist, squareform
 from sklearn.svm import SVC
 
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
+from fedot_ind.core.architecture.settings.parallel_backend import get_parallel_backend, sequential_execution
+from fedot_ind.core.ensemble.kernel_approximation import centered_alignment_weights, kernel_factors
 from fedot_ind.core.models.base_extractor import BaseExtractor
-from fedot_ind.core.repository.constanst_repository import KERNEL_ALGO, KERNEL_BASELINE_FEATURE_GENERATORS, \
-    KERNEL_BASELINE_NODE_LIST
+from fedot_ind.core.repository.constanst_repository import KERNEL_ALGO, KERNEL_APPROXIMATION_RANK, \
+    KERNEL_BASELINE_FEATURE_GENERATORS
 from fedot_ind.core.repository.initializer_industrial_models import IndustrialModels
 from itertools import chain
 
 
+def _fit_feature_generator(task: tuple) -> tuple:
+    generator_name, input_data = task
+    # workers of the process backend start with the default repository of operations
+    IndustrialModels().setup_repository()
+    generator = KERNEL_BASELINE_FEATURE_GENERATORS[generator_name].build()
+    with sequential_execution():
+        features = generator.fit(input_data).predict
+    return generator, features.reshape(features.shape[0], -1)
+
+
 class KernelEnsembler(BaseExtractor):
+    """Selects the best feature generators for classes by multiple kernel learning on kernels of their features.
+
+    Generators are fitted in parallel by the backend of ``parallel_backend`` and ``n_jobs`` parameters and their
+    feature matrices are reused to train models of the ensemble. If ``kernel_approximation`` is ``'nystroem'`` or
+    ``'random_features'``, each kernel is a low-rank RBF approximation of rank ``n_components`` instead of the dense
+    distance matrix, so memory grows linearly with the number of samples. In this mode ``distance_metric`` does not
+    apply. Only the ``'one_step_cka'`` strategy works on low-rank factors, other strategies of MKLpy require dense
+    kernels, so factors are expanded back to ``n x n`` matrices for them.
+    """
+
     def __init__(self, params: Optional[OperationParameters] = None):
         super().__init__(params)
         self.distance_metric = params.get('distance_metric', 'cosine')
-        self.kernel_strategy = params.get('kernel_strategy ', 'one_step_cka')
+        self.kernel_strategy = params.get('kernel_strategy', 'one_step_cka')
         self.feature_extractor = params.get('feature_extractor', list(
             KERNEL_BASELINE_FEATURE_GENERATORS.keys()))
         self._mapping_dict = {k: v for k,
@@ -32,6 +55,14 @@ class KernelEnsembler(BaseExtractor):
         self.patience = params.get('patience', 5)
         self.epoch = params.get('epoch', 500)
         self.optimisation_metric = params.get('optimisation_metric', 'roc_auc')
+        self.kernel_approximation = params.get('kernel_approximation', None)
+        self.n_components = params.get('n_components', KERNEL_APPROXIMATION_RANK)
+        if self.kernel_approximation is not None:
+            self.logger.warning(f'Kernels are approximated by {self.kernel_approximation} RBF kernels, '
+                                f'distance_metric {self.distance_metric} is not used')
+            if self.kernel_strategy != 'one_step_cka':
+                self.logger.warning(f'Strategy {self.kernel_strategy} requires dense kernels, approximated kernels '
+                                    f'are expanded to n x n matrices and memory grows quadratically')
 
         self.algo_impl_dict = {'one_step': self.__one_stage_kernel,
                                'two_step': self.__two_stage_kernel
@@ -40,6 +71,7 @@ class KernelEnsembler(BaseExtractor):
         self.repo = IndustrialModels().setup_repository()
         self.feature_matrix_train = []
         self.feature_matrix_test = []
+        self.generator_models = {}
 
     def __convert_weights(self, kernel_model):
         kernels_weights_by_class = []
@@ -100,13 +132,11 @@ class KernelEnsembler(BaseExtractor):
                 entry=train_fold.target, mapper_dict=self.mapper_dict[gen])
             train_fold.target[not_described_idx] = max(
                 list(self.mapper_dict[gen].values()))+1
-            basis, generator = KERNEL_BASELINE_NODE_LIST[gen]
-            if basis is None:
-                kernel_ensemble.update(
-                    {gen: PipelineBuilder().add_node(generator).add_node('xgboost').build()})
-            else:
-                kernel_ensemble.update(
-                    {gen: PipelineBuilder().add_node(basis).add_node(generator).add_node('xgboost').build()})
+            # features of the fitted generator are reused, so only the head model is trained
+            train_fold.features = self.feature_matrix_train[self.feature_extractor.index(gen)]
+            train_fold.data_type = DataTypesEnum.table
+            kernel_ensemble.update(
+                {gen: PipelineBuilder().add_node('xgboost').build()})
             kernel_data.update({gen: train_fold})
         return kernel_ensemble, kernel_data
 
@@ -116,7 +146,10 @@ class KernelEnsembler(BaseExtractor):
         """
         self.__multiclass_check(input_data.target)
         grammian_list = self.generate_grammian(input_data)
-        if self.kernel_strategy.__contains__('one'):
+        if self.kernel_approximation is not None and self.kernel_strategy == 'one_step_cka':
+            kernel_weight_matrix = centered_alignment_weights(
+                grammian_list, input_data.target)
+        elif self.kernel_strategy.__contains__('one'):
             kernel_weight_matrix = self.__one_stage_kernel(
                 grammian_list, input_data.target)
         else:
@@ -129,15 +162,39 @@ class KernelEnsembler(BaseExtractor):
         return self.predict
 
     def generate_grammian(self, input_data) -> list[Any]:
-        for model in self.feature_extractor:
-            model = KERNEL_BASELINE_FEATURE_GENERATORS[model].build()
-            self.feature_matrix_train.append(model.fit(input_data).predict)
-        self.feature_matrix_train = [x.reshape(x.shape[0], x.shape[1] * x.shape[2])
-                                     for x in self.feature_matrix_train]
-        KLtr = [squareform(pdist(X=feature, metric=self.distance_metric))
+        """Fits feature generators and computes kernels of their features.
+
+        Returns:
+            list of dense kernels or, if ``kernel_approximation`` is set and the strategy is ``'one_step_cka'``,
+            list of their low-rank factors.
+
+        """
+        backend = get_parallel_backend(self.parallel_backend, self.n_processes)
+        fitted_generators = backend.map_tasks(_fit_feature_generator,
+                                              [(model, input_data) for model in self.feature_extractor])
+        self.generator_models = {model: generator for model, (generator, _) in
+                                 zip(self.feature_extractor, fitted_generators)}
+        self.feature_matrix_train = [features for _, features in fitted_generators]
+        if self.kernel_approximation is None:
+            return [squareform(pdist(X=feature, metric=self.distance_metric))
+                    for feature in self.feature_matrix_train]
+        KLtr = [kernel_factors(feature, self.kernel_approximation, self.n_components)
                 for feature in self.feature_matrix_train]
+        if self.kernel_strategy != 'one_step_cka':
+            # other algorithms of MKLpy require kernel matrices
+            KLtr = [factor @ factor.T for factor in KLtr]
         return KLtr
 
+    def generate_features(self, input_data: InputData, generator: str) -> InputData:
+        """Generates features of new samples by the fitted generator for models of the ensemble.
+        """
+        features = self.generator_models[generator].predict(input_data).predict
+        return InputData(idx=input_data.idx,
+                         features=features.reshape(features.shape[0], -1),
+                         target=input_data.target,
+                         task=input_data.task,
+                         data_type=DataTypesEnum.table)
+
     def __one_stage_kernel(self, grammian_list, target):
         mkl = KERNEL_ALGO[self.kernel_strategy](
             multiclass_strategy=self.multiclass_strategy).fit(grammian_list, target)
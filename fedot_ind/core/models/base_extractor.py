@@ -1,33 +1,36 @@
 import logging
-import math
 from itertools import chain
-from multiprocessing import cpu_count
 
 from fedot.core.data.data import InputData
 from fedot.core.operations.operation_parameters import OperationParameters
 from fedot.core.repository.dataset_types import DataTypesEnum
-from joblib import delayed, Parallel
 from typing import Optional
 
 from fedot_ind.api.utils.data import init_input_data
 from fedot_ind.core.architecture.abstraction.decorators import convert_to_input_data
+from fedot_ind.core.architecture.settings.parallel_backend import get_parallel_backend, resolve_n_jobs
 from fedot_ind.core.metrics.metrics_implementation import *
 from fedot_ind.core.operation.IndustrialCachableOperation import IndustrialCachableOperationImplementation
-from fedot_ind.core.operation.transformation.data.hankel import HankelMatrix
 from fedot_ind.core.repository.constanst_repository import STAT_METHODS, STAT_METHODS_GLOBAL
 
 
 class BaseExtractor(IndustrialCachableOperationImplementation):
     """
     Abstract class responsible for feature generator.
+
+    Samples are processed in contiguous chunks by a parallel backend, which is configured with
+    ``n_jobs`` (number of workers, ``CPU_NUMBERS`` by default) and ``parallel_backend``
+    (``'loky'``, ``'threading'`` or ``'sequential'``) parameters.
     """
 
     def __init__(self, params: Optional[OperationParameters] = None):
         super().__init__(params)
         self.current_window = None
         self.stride = 3
-        self.n_processes = math.ceil(
-            cpu_count() * 0.7) if cpu_count() > 1 else 1
+        self.n_processes = resolve_n_jobs(
+            params.get('n_jobs', None) if params is not None else None)
+        self.parallel_backend = params.get(
+            'parallel_backend', 'loky') if params is not None else 'loky'
         self.data_type = DataTypesEnum.table
         self.use_cache = params.get(
             'use_cache', False) if params is not None else False
@@ -55,22 +58,32 @@ class BaseExtractor(IndustrialCachableOperationImplementation):
         Method for feature generation for all series
         """
 
-        parallel = Parallel(n_jobs=self.n_processes,
-                            verbose=0, pre_dispatch="2*n_jobs")
-        feature_matrix = parallel(delayed(self.generate_features_from_ts)(
-            sample) for sample in input_data.features)
+        # results of the previous call are not needed by workers
+        self.predict = None
+        backend = get_parallel_backend(self.parallel_backend, self.n_processes)
+        chunk_results = backend.map_chunks(self._extract_chunk_features, input_data.features)
 
-        if len(feature_matrix[0].features.shape) > 1:
-            stacked_data = np.stack([ts.features for ts in feature_matrix])
-            self.predict = self._clean_predict(stacked_data)
-        else:
-            stacked_data = np.array([ts.features for ts in feature_matrix])
-            self.predict = self._clean_predict(stacked_data)
+        stacked_data = np.concatenate([features for features, _ in chunk_results])
+        feature_names, is_multidimensional = chunk_results[0][1]
+        self.predict = self._clean_predict(stacked_data)
+        if not is_multidimensional:
             self.predict = self.predict.reshape(self.predict.shape[0], -1)
 
-        self.relevant_features = feature_matrix[0].supplementary_data['feature_name']
+        self.relevant_features = feature_names
         return self.predict
 
+    def _extract_chunk_features(self, samples: np.array) -> tuple:
+        """Generates features for a chunk of samples.
+
+        Returns:
+            tuple of stacked features of samples and a tuple of feature names with the flag
+            whether features of one sample are multidimensional
+        """
+        feature_matrix = [self.generate_features_from_ts(sample) for sample in samples]
+        is_multidimensional = len(feature_matrix[0].features.shape) > 1
+        stacked_data = np.stack([ts.features for ts in feature_matrix])
+        return stacked_data, (feature_matrix[0].supplementary_data['feature_name'], is_multidimensional)
+
     def _clean_predict(self, predict: np.array):
         """Clean predict from nan, inf and reshape data for Fedot appropriate form
         """
@@ -112,29 +125,43 @@ class BaseExtractor(IndustrialCachableOperationImplementation):
             names.append(method[0])
         return features, names
 
-    @convert_to_input_data
-    def apply_window_for_stat_feature(self, ts_data: np.array,
-                                      feature_generator: callable,
-                                      window_size: int = None) -> tuple:
+    def _get_window_geometry(self, ts_length: int, window_size: int = None) -> tuple:
+        """Method for defining the windows used for windowed statistical features.
+
+        Args:
+            ts_length: length of time series
+            window_size: size of window in percents of time series length
 
+        Returns:
+            tuple of window length, start positions of windows and window size used in feature names
+
+        """
         if window_size is None:
             # 10% of time series length by default
-            window_size = round(ts_data.shape[0] / 10)
+            window_size = round(ts_length / 10)
         else:
-            window_size = round(ts_data.shape[0] * (window_size / 100))
-
-        features = []
-        names = []
+            window_size = round(ts_length * (window_size / 100))
         window_size = max(window_size, 5)
 
         if self.stride > 1:
-            trajectory_transformer = HankelMatrix(time_series=ts_data,
-                                                  window_size=window_size,
-                                                  strides=self.stride)
-            subseq_set = trajectory_transformer.trajectory_matrix
+            # the same windows as columns of strided HankelMatrix
+            window_length = round(window_size - 1)
+            if not 2 <= window_length <= ts_length / 2:
+                window_length = int(ts_length / 3)
+            starts = np.arange(0, ts_length - window_length + 1, self.stride)
         else:
-            subseq_set = np.lib.stride_tricks.sliding_window_view(ts_data,
-                                                                  ts_data.shape[0] - window_size)
+            window_length = window_size + 1
+            starts = np.arange(ts_length - window_size)
+        return window_length, starts, window_size
+
+    @convert_to_input_data
+    def apply_window_for_stat_feature(self, ts_data: np.array,
+                                      feature_generator: callable,
+                                      window_size: int = None) -> tuple:
+        features = []
+        names = []
+        window_length, starts, window_size = self._get_window_geometry(ts_data.shape[0], window_size)
+        subseq_set = np.lib.stride_tricks.sliding_window_view(ts_data, window_length)[starts].T
 
         for i in range(0, subseq_set.shape[1]):
             slice_ts = subseq_set[:, i]
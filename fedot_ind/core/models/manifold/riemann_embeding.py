@@ -3,18 +3,19 @@ from typing import Optional
 import numpy as np
 from fedot.core.data.data import InputData
 from fedot.core.operations.operation_parameters import OperationParameters
-from pyriemann.estimation import Covariances, Shrinkage
-from pyriemann.tangentspace import TangentSpace
-from pyriemann.utils import mean_covariance
-from pyriemann.utils.distance import distance
 from sklearn.utils.extmath import softmax
 
 from fedot_ind.core.models.base_extractor import BaseExtractor
+from fedot_ind.core.models.manifold.riemann_engine import RiemannFeatureEngine
 
 
 class RiemannExtractor(BaseExtractor):
     """Class responsible for riemann tangent space features generator.
 
+    Covariances, the reference mean of the tangent space and class centroids are computed by
+    :class:`RiemannFeatureEngine`. Means are fitted on the first transformation and stored on the operation, so
+    prediction costs one covariance and one projection per sample.
+
     Attributes:
         estimator (str): estimator for covariance matrix, 'corr', 'cov', 'lwf', 'mcd', 'hub'
         distance_metric (str): metric for tangent space, 'riemann', 'logeuclid', 'euclid'
@@ -52,11 +53,12 @@ class RiemannExtractor(BaseExtractor):
         self.extraction_strategy = params.get(
             'extraction_strategy ', 'ensemble')
 
-        self.covariance_transformer = params.get('SPD_space', None)
-        self.tangent_projector = params.get('tangent_space', None)
-        if np.any([self.covariance_transformer, self.tangent_projector]) is None:
-            self._init_spaces()
-            self.fit_stage = True
+        self.shrinkage = params.get('shrinkage', 0.1)
+        self.riemann_engine = RiemannFeatureEngine(estimator=self.estimator,
+                                                   shrinkage=self.shrinkage,
+                                                   mean_metric=self.covariance_metric,
+                                                   tangent_metric=self.distance_metric)
+        self.fit_stage = True
         self.extraction_func = extraction_dict[self.extraction_strategy]
 
         self.logging_params.update({
@@ -64,49 +66,23 @@ class RiemannExtractor(BaseExtractor):
             'tangent_space_metric': self.distance_metric,
             'SPD_space_metric': self.covariance_metric})
 
-    def _init_spaces(self):
-        self.covariance_transformer = Covariances(estimator='scm')
-        self.tangent_projector = TangentSpace(metric=self.distance_metric)
-        self.shrinkage = Shrinkage()
-
-    def extract_riemann_features(self, input_data: InputData) -> InputData:
-        if not self.fit_stage:
-            SPD = self.covariance_transformer.transform(input_data.features)
-            SPD = self.shrinkage.transform(SPD)
-            ref_point = self.tangent_projector.transform(SPD)
-        else:
-            SPD = self.covariance_transformer.fit_transform(
-                input_data.features, input_data.target)
-            SPD = self.shrinkage.fit_transform(SPD)
-            ref_point = self.tangent_projector.fit_transform(SPD)
-            self.fit_stage = False
-            self.classes_ = np.unique(input_data.target)
-        return ref_point
-
-    def extract_centroid_distance(self, input_data: InputData):
-        input_data.target = input_data.target.astype(int)
-        if self.fit_stage:
-            SPD = self.covariance_transformer.fit_transform(
-                input_data.features, input_data.target)
-            SPD = self.shrinkage.transform(SPD)
-
-        else:
-            SPD = self.covariance_transformer.transform(input_data.features)
-            SPD = self.shrinkage.fit_transform(SPD)
+    def extract_riemann_features(self, SPD: np.ndarray) -> np.ndarray:
+        return self.riemann_engine.tangent_features(SPD)
 
-        self.covmeans_ = [mean_covariance(SPD[np.array(input_data.target == ll).flatten()],
-                                          metric=self.covariance_metric) for ll in self.classes_]
-
-        n_centroids = len(self.covmeans_)
-        dist = [distance(SPD, self.covmeans_[m], self.distance_metric)
-                for m in range(n_centroids)]
-        dist = np.concatenate(dist, axis=1)
+    def extract_centroid_distance(self, SPD: np.ndarray) -> np.ndarray:
+        dist = self.riemann_engine.centroid_distances(SPD)
         feature_matrix = softmax(-dist ** 2)
         return feature_matrix
 
-    def _ensemble_features(self, input_data: InputData):
-        tangent_features = self.extract_riemann_features(input_data)
-        dist_features = self.extract_centroid_distance(input_data)
+    def partial_fit(self, input_data: InputData):
+        """Updates the reference mean and class centroids by new labelled samples without refitting.
+        """
+        SPD = self.riemann_engine.covariances(input_data.features)
+        self.riemann_engine.partial_fit(SPD, input_data.target)
+
+    def _ensemble_features(self, SPD: np.ndarray) -> np.ndarray:
+        tangent_features = self.extract_riemann_features(SPD)
+        dist_features = self.extract_centroid_distance(SPD)
         feature_matrix = np.concatenate(
             [tangent_features, dist_features], axis=1)
         return feature_matrix
@@ -116,6 +92,11 @@ class RiemannExtractor(BaseExtractor):
         Method for feature generation for all series
         """
 
-        feature_matrix = self.extraction_func(input_data)
+        SPD = self.riemann_engine.covariances(input_data.features)
+        if self.fit_stage:
+            self.riemann_engine.fit(SPD, input_data.target)
+            self.classes_ = self.riemann_engine.classes_
+            self.fit_stage = False
+        feature_matrix = self.extraction_func(SPD)
         self.predict = self._clean_predict(feature_matrix)
         return self.predict
@@ -0,0 +1,145 @@
+from pyriemann.utils import mean_covariance
+from pyriemann.utils.base import invsqrtm, logm
+from pyriemann.utils.covariance import covariances
+from pyriemann.utils.distance import distance
+from pyriemann.utils.geodesic import geodesic
+from pyriemann.utils.tangentspace import upper
+
+from fedot_ind.core.architecture.settings.computational import backend_methods as np
+
+
+class RiemannFeatureEngine:
+    """Riemannian features of multi-channel series with reference means fitted once. Covariances of all samples
+    are estimated by batched matrix products, while the reference mean of the tangent space, class centroids and
+    operators derived from them are stored on fit. Thus, features of new samples cost one covariance and one
+    projection per sample.
+
+    Args:
+        estimator: covariance estimator, ``'scm'`` is computed in batch, others are estimated by ``pyriemann``.
+        shrinkage: shrinkage coefficient of covariances, as in ``pyriemann.estimation.Shrinkage``.
+        mean_metric: metric of class centroids.
+        tangent_metric: metric of the tangent space and of distances to class centroids.
+
+    Attributes:
+        reference_: reference mean of the tangent space.
+        centroids_: class centroids of shape ``(n_classes, n_channels, n_channels)``.
+        classes_: classes of centroids.
+        n_samples_: number of samples in the reference mean.
+        class_counts_: number of samples in each class centroid.
+
+    """
+
+    def __init__(self, estimator: str = 'scm', shrinkage: float = 0.1,
+                 mean_metric: str = 'riemann', tangent_metric: str = 'riemann'):
+        self.estimator = estimator
+        self.shrinkage = shrinkage
+        self.mean_metric = mean_metric
+        self.tangent_metric = tangent_metric
+        self.reference_ = None
+        self.centroids_ = None
+        self.classes_ = None
+        self.n_samples_ = 0
+        self.class_counts_ = None
+        self.__reference_operator = None
+        self.__centroid_operators = None
+
+    def covariances(self, time_series: np.ndarray) -> np.ndarray:
+        """Estimates shrunk covariances of multi-channel series.
+
+        Args:
+            time_series: array of shape ``(n_samples, n_channels, n_times)``.
+
+        Returns:
+            array of covariances of shape ``(n_samples, n_channels, n_channels)``.
+
+        """
+        time_series = np.asarray(time_series, dtype=float)
+        if self.estimator == 'scm':
+            centered = time_series - time_series.mean(axis=2, keepdims=True)
+            covmats = centered @ centered.transpose(0, 2, 1) / time_series.shape[2]
+        else:
+            covmats = covariances(time_series, estimator=self.estimator)
+        n_channels = covmats.shape[1]
+        shrunk = (1. - self.shrinkage) * covmats
+        diagonal = np.arange(n_channels)
+        shrunk[:, diagonal, diagonal] += self.shrinkage * np.trace(covmats, axis1=1, axis2=2)[:, None] / n_channels
+        return shrunk
+
+    def fit(self, covmats: np.ndarray, target: np.ndarray):
+        """Fits the reference mean and class centroids of covariances."""
+        target = np.asarray(target).flatten()
+        self.classes_ = np.unique(target)
+        self.reference_ = mean_covariance(covmats, metric=self.tangent_metric)
+        self.centroids_ = np.stack([mean_covariance(covmats[target == label], metric=self.mean_metric)
+                                    for label in self.classes_])
+        self.n_samples_ = len(covmats)
+        self.class_counts_ = np.array([np.sum(target == label) for label in self.classes_])
+        self.__init_operators()
+        return self
+
+    def partial_fit(self, covmats: np.ndarray, target: np.ndarray):
+        """Updates the reference mean and class centroids by new covariances without refitting. Each new matrix
+        moves a mean along the geodesic towards it by the step of ``1 / n``, where ``n`` is the number of
+        matrices of the mean, so the update is exact for the Euclidean and log-Euclidean metrics and approximates
+        the Riemannian mean. Samples of classes unknown on fit are ignored.
+        """
+        target = np.asarray(target).flatten()
+        for covmat, label in zip(covmats, target):
+            self.n_samples_ += 1
+            self.reference_ = self.__update_mean(self.reference_, covmat, self.n_samples_, self.tangent_metric)
+            class_index = np.flatnonzero(self.classes_ == label)
+            if len(class_index):
+                class_index = class_index[0]
+                self.class_counts_[class_index] += 1
+                self.centroids_[class_index] = self.__update_mean(self.centroids_[class_index], covmat,
+                                                                  self.class_counts_[class_index], self.mean_metric)
+        self.__init_operators()
+        return self
+
+    def tangent_features(self, covmats: np.ndarray) -> np.ndarray:
+        """Projects covariances to the tangent space at the reference mean.
+
+        Returns:
+            array of shape ``(n_samples, n_channels * (n_channels + 1) / 2)``.
+
+        """
+        if self.tangent_metric == 'riemann':
+            tangent_vectors = logm(self.__reference_operator @ covmats @ self.__reference_operator)
+        elif self.tangent_metric == 'logeuclid':
+            tangent_vectors = logm(covmats) - self.__reference_operator
+        else:
+            tangent_vectors = covmats - self.reference_
+        return upper(tangent_vectors)
+
+    def centroid_distances(self, covmats: np.ndarray) -> np.ndarray:
+        """Computes distances from covariances to class centroids.
+
+        Returns:
+            array of shape ``(n_samples, n_classes)``.
+
+        """
+        if self.tangent_metric == 'riemann':
+            # eigenvalues of whitened matrices are the generalized eigenvalues of a matrix and a centroid
+            return np.stack([np.sqrt(np.sum(np.log(np.linalg.eigvalsh(operator @ covmats @ operator)) ** 2, axis=-1))
+                             for operator in self.__centroid_operators], axis=1)
+        if self.tangent_metric == 'logeuclid':
+            log_covmats = logm(covmats)
+            return np.stack([np.linalg.norm(log_covmats - operator, ord='fro', axis=(-2, -1))
+                             for operator in self.__centroid_operators], axis=1)
+        if self.tangent_metric == 'euclid':
+            return np.stack([np.linalg.norm(covmats - centroid, ord='fro', axis=(-2, -1))
+                             for centroid in self.centroids_], axis=1)
+        return np.concatenate([distance(covmats, centroid, self.tangent_metric) for centroid in self.centroids_],
+                              axis=1)
+
+    def __init_operators(self):
+        operators = {'riemann': invsqrtm, 'logeuclid': logm}
+        operator = operators.get(self.tangent_metric)
+        self.__reference_operator = None if operator is None else operator(self.reference_)
+        self.__centroid_operators = None if operator is None else operator(self.centroids_)
+
+    @staticmethod
+    def __update_mean(mean: np.ndarray, covmat: np.ndarray, n_samples: int, metric: str) -> np.ndarray:
+        if metric == 'identity':
+            return mean
+        return geodesic(mean, covmat, 1. / n_samples, metric=metric)
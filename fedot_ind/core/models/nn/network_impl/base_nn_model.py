@@ -1,6 +1,6 @@
-import copy
-import os
+from contextlib import contextmanager
 
+import psutil
 import torch
 import torch.nn.functional as F
 from fedot.core.data.data import InputData, OutputData
@@ -8,18 +8,32 @@ from fedot.core.data.data_split import train_test_data_setup
 from fedot.core.operations.operation_parameters import OperationParameters
 from fedot.core.repository.dataset_types import DataTypesEnum
 from torch import Tensor
+from sklearn.model_selection import train_test_split
 from torch.optim import lr_scheduler
 from typing import Optional
 
 from fedot_ind.core.architecture.abstraction.decorators import convert_inputdata_to_torch_dataset, \
     convert_to_4d_torch_array, fedot_data_type
+from fedot_ind.core.architecture.preprocessing.data_convertor import LazyDatasetCLF
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
-from fedot_ind.core.models.nn.network_modules.layers.special import adjust_learning_rate, EarlyStopping
+from fedot_ind.core.architecture.settings.computational import bf16_supported, default_device
+from fedot_ind.core.architecture.settings.parallel_backend import resolve_intra_op_threads
+from fedot_ind.core.models.nn.network_modules.layers.special import adjust_learning_rate, EarlyStopping, \
+    ModelCheckpoint
+from fedot_ind.core.repository.constanst_repository import NN_ACTIVATION_MEMORY_RATIO, NN_AUTO_BATCH_SIZE_BOUNDS, \
+    NN_BATCH_MEMORY_SHARE
 
 
 class BaseNeuralModel:
     """Class responsible for NN model implementation.
 
+    Training performance is controlled by the following parameters, shared by all neural models:
+    ``performance_mode`` turns on ``use_amp`` and ``channels_last``; ``use_amp`` trains in bfloat16 autocast where
+    the hardware supports it; ``channels_last`` keeps 4D inputs and weights in channels-last memory format;
+    ``compile_model`` trains the backbone compiled by ``torch.compile``; ``n_jobs`` sets the number of intra-op
+    threads of torch (one thread inside parallel evaluation of pipelines); ``batch_size='auto'`` scales the batch
+    to available memory.
+
     Attributes:
         self.num_features: int, the number of features.
 
@@ -44,6 +58,10 @@ class BaseNeuralModel:
         self.epochs = params.get('epochs', 100)
         self.batch_size = params.get('batch_size', 16)
         self.activation = params.get('activation', 'ReLU')
+        self.lazy_loading = params.get('lazy_loading', False)
+        self.num_workers = params.get('num_workers', 0)
+        self.checkpoint_path = params.get('checkpoint_path', None)
+        self._init_performance_params(params)
         self.learning_rate = 0.001
 
         self.label_encoder = None
@@ -57,9 +75,52 @@ class BaseNeuralModel:
         self.target = input_data.target
         self.task_type = input_data.task
 
-        self._fit_model(input_data)
+        self._resolve_batch_size(input_data)
+        with self._training_threads():
+            self._fit_model(input_data)
         self._save_and_clear_cache()
 
+    def _init_performance_params(self, params: dict):
+        performance_mode = params.get('performance_mode', False)
+        self.use_amp = params.get('use_amp', performance_mode)
+        self.channels_last = params.get('channels_last', performance_mode)
+        self.compile_model = params.get('compile_model', False)
+        self.n_jobs = params.get('n_jobs', None)
+
+    def _resolve_batch_size(self, input_data: InputData):
+        """Replaces ``batch_size='auto'`` with the largest power of two which fits the share of available memory
+        and leaves at least four batches per epoch.
+        """
+        if self.batch_size != 'auto':
+            return
+        min_batch_size, max_batch_size = NN_AUTO_BATCH_SIZE_BOUNDS
+        n_samples = input_data.features.shape[0]
+        sample_memory = np.prod(input_data.features.shape[1:]) * torch.finfo(torch.float32).bits // 8
+        batch_memory = psutil.virtual_memory().available * NN_BATCH_MEMORY_SHARE
+        batch_size = min(batch_memory // (sample_memory * NN_ACTIVATION_MEMORY_RATIO), max_batch_size, n_samples // 4)
+        self.batch_size = int(max(min_batch_size, 2 ** int(np.log2(max(batch_size, 1)))))
+
+    @contextmanager
+    def _training_threads(self):
+        num_threads = torch.get_num_threads()
+        torch.set_num_threads(resolve_intra_op_threads(self.n_jobs))
+        try:
+            yield
+        finally:
+            torch.set_num_threads(num_threads)
+
+    def _autocast(self):
+        return torch.autocast(self._device.type, dtype=torch.bfloat16,
+                              enabled=self.use_amp and bf16_supported(self._device))
+
+    def _get_forward_model(self):
+        """Prepares the model for training and returns the module to call in the training loop. The compiled
+        module shares parameters with the model, so checkpoints are taken from the model itself.
+        """
+        if self.channels_last:
+            self.model = self.model.to(memory_format=torch.channels_last)
+        return torch.compile(self.model) if self.compile_model else self.model
+
     @convert_to_4d_torch_array
     def _fit_model(self, ts: InputData):
 
@@ -77,6 +138,8 @@ class BaseNeuralModel:
         NotImplementedError()
 
     def _prepare_data(self, ts, split_data: bool = True):
+        if self.lazy_loading or self._is_memory_mapped(ts.features):
+            return self._prepare_lazy_data(ts, split_data)
 
         if split_data:
             train_data, val_data = train_test_data_setup(
@@ -99,6 +162,40 @@ class BaseNeuralModel:
         self.label_encoder = train_dataset.label_encoder
         return train_loader, val_loader
 
+    def _prepare_lazy_data(self, ts, split_data: bool = True):
+        """Prepares loaders which read batches of samples from features storage (e.g. ``np.memmap``) on demand,
+        so features are never loaded into memory entirely. Data is split into train and validation parts by indices
+        of samples, batches are prefetched by ``num_workers`` worker processes and pinned for transfer to GPU.
+        """
+        dataset = LazyDatasetCLF(ts)
+        if split_data:
+            train_indices, val_indices = self._split_indices(ts)
+            train_dataset, val_dataset = dataset.subset(train_indices), dataset.subset(val_indices)
+        else:
+            train_dataset, val_dataset = dataset, None
+
+        loader_params = dict(batch_size=self.batch_size,
+                             num_workers=self.num_workers,
+                             pin_memory=torch.cuda.is_available())
+        if self.num_workers > 0:
+            loader_params.update(persistent_workers=True, prefetch_factor=2)
+        train_loader = torch.utils.data.DataLoader(train_dataset, shuffle=True, **loader_params)
+        val_loader = None if val_dataset is None else torch.utils.data.DataLoader(val_dataset, **loader_params)
+
+        self.label_encoder = dataset.label_encoder
+        return train_loader, val_loader
+
+    @staticmethod
+    def _split_indices(ts, split_ratio: float = 0.7, random_seed: int = 42) -> tuple:
+        indices = np.arange(ts.features.shape[0])
+        stratify = np.ravel(ts.target) if ts.task.task_type.value == 'classification' else None
+        try:
+            return train_test_split(indices, train_size=split_ratio, shuffle=True,
+                                    stratify=stratify, random_state=random_seed)
+        except ValueError:
+            # classes with a single sample can not be stratified
+            return train_test_split(indices, train_size=split_ratio, shuffle=True, random_state=random_seed)
+
     def _train_loop(self, train_loader, val_loader, loss_fn, optimizer):
         early_stopping = EarlyStopping()
         scheduler = lr_scheduler.OneCycleLR(optimizer=optimizer,
@@ -108,7 +205,8 @@ class BaseNeuralModel:
         if val_loader is None:
             print('Not enough class samples for validation')
 
-        best_model = None
+        checkpoint = ModelCheckpoint(self.checkpoint_path)
+        forward_model = self._get_forward_model()
         best_val_loss = float('inf')
         val_interval = self.get_validation_frequency(
             self.epochs, self.learning_rate)
@@ -121,9 +219,10 @@ class BaseNeuralModel:
             correct = 0
             for batch in train_loader:
                 optimizer.zero_grad()
-                inputs, targets = batch
-                output = self.model(inputs)
-                loss = loss_fn(output, targets.float())
+                inputs, targets = self._to_device(batch)
+                with self._autocast():
+                    output = forward_model(inputs)
+                    loss = loss_fn(output, targets.float())
                 loss.backward()
                 optimizer.step()
                 training_loss += loss.data.item() * inputs.size(0)
@@ -141,10 +240,10 @@ class BaseNeuralModel:
                 total = 0
                 correct = 0
                 for batch in val_loader:
-                    inputs, targets = batch
-                    output = self.model(inputs)
-
-                    loss = loss_fn(output, targets.float())
+                    inputs, targets = self._to_device(batch)
+                    with self._autocast():
+                        output = forward_model(inputs)
+                        loss = loss_fn(output, targets.float())
 
                     valid_loss += loss.data.item() * inputs.size(0)
                     total += targets.size(0)
@@ -152,9 +251,9 @@ class BaseNeuralModel:
                                 torch.argmax(targets, 1)).sum().item()
                 if valid_loss < best_val_loss:
                     best_val_loss = valid_loss
-                    best_model = copy.deepcopy(self.model)
+                    checkpoint.snapshot(self.model)
 
-            early_stopping(training_loss, self.model, './')
+            early_stopping(training_loss, self.model)
             adjust_learning_rate(optimizer, scheduler,
                                  epoch + 1, self.learning_rate, printout=False)
             scheduler.step()
@@ -163,8 +262,14 @@ class BaseNeuralModel:
                 print("Early stopping")
                 break
 
-        if best_model is not None:
-            self.model = best_model
+        checkpoint.restore(self.model)
+
+    def _to_device(self, batch) -> tuple:
+        # batches of lazy datasets are read on CPU, batches of in-memory datasets are already on the device
+        inputs, targets = (tensor.to(default_device(), non_blocking=True) for tensor in batch)
+        if self.channels_last and inputs.ndim == 4:
+            inputs = inputs.contiguous(memory_format=torch.channels_last)
+        return inputs, targets
 
     @fedot_data_type
     def predict(self,
@@ -172,7 +277,7 @@ class BaseNeuralModel:
         """
         Method for feature generation for all series
         """
-        return self._predict_model(input_data, output_mode)
+        return self._predict(input_data, output_mode)
 
     @fedot_data_type
     def predict_for_fit(self,
@@ -180,7 +285,32 @@ class BaseNeuralModel:
         """
         Method for feature generation for all series
         """
-        return self._predict_model(input_data, output_mode)
+        return self._predict(input_data, output_mode)
+
+    def _predict(self, x_test, output_mode: str = 'default'):
+        if self.lazy_loading or self._is_memory_mapped(x_test):
+            return self._predict_lazy(x_test, output_mode)
+        return self._predict_model(x_test, output_mode)
+
+    @staticmethod
+    def _is_memory_mapped(features) -> bool:
+        # views of memory maps, e.g. squeezed features, are plain arrays with a memory map base
+        while isinstance(features, np.ndarray):
+            if isinstance(features, np.memmap):
+                return True
+            features = features.base
+        return False
+
+    def _predict_lazy(self, x_test, output_mode: str = 'default'):
+        """Predicts by batches of samples which are read from features storage (e.g. ``np.memmap``) on demand,
+        so features are never loaded into memory entirely and the model runs on one batch at a time.
+        """
+        loader = torch.utils.data.DataLoader(LazyDatasetCLF.from_features(x_test),
+                                             batch_size=self.batch_size,
+                                             num_workers=self.num_workers)
+        with torch.no_grad():
+            probabilities = [self._predict_model(samples.numpy(), 'probs').predict for samples, _ in loader]
+        return self._convert_probabilities(torch.from_numpy(np.concatenate(probabilities)), output_mode)
 
     @convert_to_4d_torch_array
     def _predict_model(self, x_test, output_mode: str = 'default'):
@@ -191,8 +321,9 @@ class BaseNeuralModel:
         return self._convert_predict(pred, output_mode)
 
     def _convert_predict(self, pred, output_mode: str = 'labels'):
-        pred = F.softmax(pred, dim=1)
+        return self._convert_probabilities(F.softmax(pred, dim=1), output_mode)
 
+    def _convert_probabilities(self, pred, output_mode: str = 'labels'):
         if output_mode == 'labels':
             y_pred = torch.argmax(pred, dim=1).cpu().detach().numpy()
         else:
@@ -210,18 +341,16 @@ class BaseNeuralModel:
         return predict
 
     def _save_and_clear_cache(self):
-        prefix = f'model_{self.__repr__()}_activation_{self.activation}_epochs_{self.epochs}_bs_{self.batch_size}.pt'
-        torch.save(self.model.state_dict(), prefix)
+        if self.__repr__().startswith('Res'):
+            model = self.model_for_inference.model.to(torch.device('cpu'))
+        else:
+            model = self.model_for_inference.to(torch.device('cpu'))
+        # weights are copied to the CPU model directly, without saving them to a file
+        model.load_state_dict(self.model.state_dict())
         del self.model
         with torch.no_grad():
             torch.cuda.empty_cache()
-        if self.__repr__().startswith('Res'):
-            self.model = self.model_for_inference.model.to(torch.device('cpu'))
-        else:
-            self.model = self.model_for_inference.to(torch.device('cpu'))
-        self.model.load_state_dict(torch.load(
-            prefix, map_location=torch.device('cpu')))
-        os.remove(prefix)
+        self.model = model
 
     @convert_inputdata_to_torch_dataset
     def _create_dataset(self, ts: InputData):
@@ -8,10 +8,14 @@ from fedot.core.operations.operation_parameters import OperationParameters
 from fedot.core.repository.dataset_types import DataTypesEnum
 from typing import Optional
 
+from fedot_ind.core.architecture.preprocessing.data_convertor import NumpyConverter
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
 from fedot_ind.core.architecture.settings.computational import default_device
 from fedot_ind.core.models.base_extractor import BaseExtractor
 
+# memory budget of one chunk of samples transformed by MiniRocketExtractor
+MINIROCKET_MEMORY_LIMIT = 2 ** 28
+
 
 class MiniRocketFeatures(nn.Module):
     """This is a Pytorch implementation of MiniRocket developed by Malcolm McLean and Ignacio Oguiza
@@ -126,9 +130,12 @@ class MiniRocketFeatures(nn.Module):
         return torch.cat(_features, dim=1)
 
     def _get_PPVs(self, C, bias):
-        C = C.unsqueeze(-1)
-        bias = bias.view(1, bias.shape[0], 1, bias.shape[1])
-        return (C > bias).float().mean(2).flatten(1)
+        # proportion of positive values of C - bias is the share of C values above the bias. It is found by
+        # binary search of biases in sorted C instead of comparing every value of C with every bias
+        sorted_C = torch.sort(C, dim=-1).values
+        bias = bias.unsqueeze(0).expand(C.shape[0], -1, -1).contiguous()
+        n_not_above = torch.searchsorted(sorted_C, bias, right=True)
+        return ((C.shape[-1] - n_not_above).float() / C.shape[-1]).flatten(1)
 
     def _set_dilations(self, input_length):
         num_features_per_kernel = self.num_features // self.num_kernels
@@ -191,17 +198,37 @@ def get_minirocket_features(data,
                             model,
                             chunksize=1024,
                             use_cuda=None,
-                            convert_to_numpy=True):
-    """Function used to split a large dataset into chunks, avoiding OOM error."""
+                            convert_to_numpy=True,
+                            out=None):
+    """Function used to split a large dataset into chunks, avoiding OOM error.
+
+    Args:
+        data: array or tensor of shape ``(n_samples, input_dim, seq_len)``.
+        model: fitted ``MiniRocketFeatures``.
+        chunksize: number of samples transformed at once.
+        use_cuda: whether to use CUDA. If None, it is used when available.
+        convert_to_numpy: whether to return numpy array or tensor.
+        out: optional preallocated array of shape ``(n_samples, num_features)``. If given, features of chunks
+            are written into it as soon as they are computed and it is returned.
+
+    """
     use = torch.cuda.is_available() if use_cuda is None else use_cuda
     device = torch.device(torch.cuda.current_device()
                           ) if use else torch.device('cpu')
     model = model.to(device)
-    if isinstance(data, np.ndarray):
-        data = torch.from_numpy(data).float().to(device)
     _features = []
-    for oi in torch.split(data, chunksize):
-        _features.append(model(oi))
+    with torch.no_grad():
+        for start in range(0, data.shape[0], chunksize):
+            oi = data[start:start + chunksize]
+            if isinstance(oi, np.ndarray):
+                oi = torch.from_numpy(oi)
+            chunk_features = model(oi.float().to(device))
+            if out is None:
+                _features.append(chunk_features)
+            else:
+                out[start:start + oi.shape[0]] = chunk_features.cpu().numpy()
+    if out is not None:
+        return out
     features = torch.cat(_features).unsqueeze(-1)
     if convert_to_numpy:
         return features.cpu().numpy()
@@ -296,47 +323,64 @@ class MiniRocketExtractor(BaseExtractor):
     def __init__(self, params: Optional[OperationParameters] = None):
         super().__init__(params)
         self.num_features = params.get('num_features', 10000)
+        self.chunk_size = params.get('chunk_size', None)
+        self.mode = params.get('mode', 'multivariate')
+        self.feature_models = None
 
     def __repr__(self):
         return 'LargeFeatureSpace'
 
-    def _save_and_clear_cache(self, model_list):
-        del model_list
+    def _save_and_clear_cache(self):
         with torch.no_grad():
             torch.cuda.empty_cache()
 
-    def _generate_features_from_ts(self, ts: np.array, mode: str = 'multivariate'):
-
-        if ts.shape[1] > 1 and mode == 'chanel_independent':
-            mrf = MiniRocketFeatures(input_dim=1,
-                                     seq_len=ts.shape[2],
-                                     num_features=self.num_features).to(default_device())
+    def _split_channels(self, ts: np.array) -> list:
+        if ts.shape[1] > 1 and self.mode == 'chanel_independent':
+            return [ts[:, i:i + 1, :] for i in range(ts.shape[1])]
+        return [ts]
 
-            n_dim = range(ts.shape[1])
-            ts_converted = [ts[:, i, :] for i in n_dim]
-            ts_converted = [x.reshape(x.shape[0], 1, x.shape[1])
-                            for x in ts_converted]
-            model_list = [mrf for i in n_dim]
-        else:
-            mrf = MiniRocketFeatures(input_dim=ts.shape[1],
-                                     seq_len=ts.shape[2],
-                                     num_features=self.num_features).to(default_device())
-
-            ts_converted = [ts]
-            model_list = [mrf]
-
-        fitted_model = [model.fit(data)
-                        for model, data in zip(model_list, ts_converted)]
-        features = [get_minirocket_features(
-            data, model) for model, data in zip(fitted_model, ts_converted)]
-        minirocket_features = [feature_by_dim.swapaxes(
-            1, 2) for feature_by_dim in features]
-        minirocket_features = np.concatenate(minirocket_features, axis=1)
+    def fit(self, input_data: InputData):
+        """Fits kernels, dilations and biases of MiniRocket on train data. Fitted models are kept
+        on the operation and reused by every following transform.
+        """
+        self._fit_models(input_data.features)
+
+    def _fit_models(self, ts: np.array):
+        ts = NumpyConverter(data=ts).convert_to_torch_format()
+        self.feature_models = nn.ModuleList()
+        for data in self._split_channels(ts):
+            model = MiniRocketFeatures(input_dim=data.shape[1],
+                                       seq_len=data.shape[2],
+                                       num_features=self.num_features).to(default_device())
+            self.feature_models.append(model.fit(data))
+        self._save_and_clear_cache()
+
+    def _get_chunk_size(self, ts: np.array) -> int:
+        if self.chunk_size is not None:
+            return self.chunk_size
+        model = self.feature_models[0]
+        # float32 convolution output of all channels and its product with channel combinations, then the
+        # float32 values and int64 indices of the sorted convolution for PPVs of one sample
+        convolution_bytes = 2 * 4 * model.input_dim * model.num_kernels * ts.shape[2]
+        sort_bytes = (4 + 8) * model.num_kernels * ts.shape[2]
+        sample_bytes = convolution_bytes + sort_bytes
+        return int(np.clip(MINIROCKET_MEMORY_LIMIT // sample_bytes, 1, 1024))
+
+    def _generate_features_from_ts(self, ts: np.array):
+        if self.feature_models is None:
+            self._fit_models(ts)
+        ts = NumpyConverter(data=ts).convert_to_torch_format()
+        channels = self._split_channels(ts)
+        chunk_size = self._get_chunk_size(ts)
+        minirocket_features = np.empty((ts.shape[0], len(channels), self.feature_models[0].num_features),
+                                       dtype=np.float32)
+        for index, (model, data) in enumerate(zip(self.feature_models, channels)):
+            get_minirocket_features(data, model, chunksize=chunk_size, out=minirocket_features[:, index, :])
         minirocket_features = OutputData(idx=np.arange(minirocket_features.shape[2]),
                                          task=self.task,
                                          predict=minirocket_features,
                                          data_type=DataTypesEnum.image)
-        self._save_and_clear_cache(model_list)
+        self._save_and_clear_cache()
         return minirocket_features
 
     def generate_minirocket_features(self, ts: np.array) -> InputData:
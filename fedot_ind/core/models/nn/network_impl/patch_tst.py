@@ -125,7 +125,7 @@ class PatchTSTModel(BaseNeuralModel):
         self.batch_size = params.get('batch_size', 16)
         self.activation = params.get('activation', 'GELU')
         self.learning_rate = params.get('learning_rate', 0.001)
-        self.use_amp = params.get('use_amp', False)
+        self._init_performance_params(params)
         self.horizon = params.get('forecast_length', None)
         self.patch_len = params.get('patch_len', None)
         self.output_attention = params.get('output_attention', False)
@@ -197,7 +197,9 @@ class PatchTSTModel(BaseNeuralModel):
         Method for feature generation for all series
         """
         input_data = self.__preprocess_for_fedot(input_data)
-        self._fit_model(input_data)
+        self._resolve_batch_size(input_data)
+        with self._training_threads():
+            self._fit_model(input_data)
 
     def split_data(self, input_data):
 
@@ -259,6 +261,7 @@ class PatchTSTModel(BaseNeuralModel):
                                             epochs=self.epochs,
                                             max_lr=self.learning_rate)
         args = {'lradj': 'type2'}
+        forward_model = torch.compile(model) if self.compile_model else model
 
         for epoch in range(self.epochs):
             iter_count = 0
@@ -276,8 +279,9 @@ class PatchTSTModel(BaseNeuralModel):
                 dec_inp = torch.zeros_like(batch_y).float()
                 dec_inp = torch.cat([batch_y, dec_inp],
                                     dim=1).float().to(default_device())
-                outputs = model(batch_x)
-                loss = loss_fn(outputs, batch_y)
+                with self._autocast():
+                    outputs = forward_model(batch_x)
+                    loss = loss_fn(outputs, batch_y)
                 train_loss.append(loss.item())
                 loss.backward()
                 model.float()
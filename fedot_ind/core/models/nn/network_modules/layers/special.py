@@ -26,7 +26,7 @@ class EarlyStopping:
         self.val_loss_min = np.Inf
         self.delta = delta
 
-    def __call__(self, val_loss, model, path):
+    def __call__(self, val_loss, model, path: Optional[str] = None):
         score = -val_loss
         if self.best_score is None:
             self.best_score = score
@@ -46,10 +46,43 @@ class EarlyStopping:
         if self.verbose:
             print(
                 f'Validation loss decreased ({self.val_loss_min:.6f} --> {val_loss:.6f}).  Saving model ...')
-        torch.save(model.state_dict(), path + '/' + 'checkpoint.pth')
+        if path is not None:
+            torch.save(model.state_dict(), path + '/' + 'checkpoint.pth')
         self.val_loss_min = val_loss
 
 
+class ModelCheckpoint:
+    """Keeps a snapshot of the best weights of the model in memory. Tensors of the state dict are copied into
+    buffers which are allocated on the first snapshot and reused by the following ones, so a snapshot costs one
+    tensor copy per parameter without building a new model.
+
+    Args:
+        path: path of the file to save snapshots to, snapshots are kept only in memory by default.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.state = None
+
+    def snapshot(self, model: nn.Module):
+        with torch.no_grad():
+            if self.state is None:
+                self.state = {name: tensor.detach().clone() for name, tensor in model.state_dict().items()}
+            else:
+                for name, tensor in model.state_dict().items():
+                    self.state[name].copy_(tensor)
+        if self.path is not None:
+            torch.save(self.state, self.path)
+
+    def restore(self, model: nn.Module) -> bool:
+        """Loads the snapshot into the model. Returns False if there is no snapshot.
+        """
+        if self.state is None:
+            return False
+        model.load_state_dict(self.state)
+        return True
+
+
 def adjust_learning_rate(optimizer, scheduler, epoch, learning_rate, printout=True, lradj='3'):
     # lr = args.learning_rate * (0.2 ** (epoch // 2))
     if lradj == 'type1':
@@ -0,0 +1,375 @@
+"""Axis-aware versions of the statistical features from ``stat_features`` module.
+
+Every function takes a 2d array of shape ``(n_series, series_length)`` and returns a 1d array
+of shape ``(n_series,)`` with the same values as its per-series counterpart applied row by row.
+They are used by :class:`QuantileExtractor` to compute the whole feature table in one pass
+instead of dispatching every series to a separate worker.
+"""
+
+from functools import lru_cache
+
+from fedot_ind.core.architecture.settings.computational import backend_methods as np
+
+# number of float64 values allowed in a temporary array while processing one chunk of series
+BATCH_MEMORY_LIMIT = 2 ** 24
+
+
+def _zero_out_fperr(array: np.array) -> np.array:
+    return np.where(np.abs(array) < 1e-14, 0, array)
+
+
+def _row_corrcoef(x: np.array, y: np.array) -> np.array:
+    x_centered = x - x.mean(axis=1, keepdims=True)
+    y_centered = y - y.mean(axis=1, keepdims=True)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.sum(x_centered * y_centered, axis=1) / np.sqrt(np.sum(x_centered ** 2, axis=1) *
+                                                                 np.sum(y_centered ** 2, axis=1))
+
+
+def _local_maxima(array: np.array) -> tuple:
+    """Vectorized equivalent of ``scipy.signal.find_peaks`` without conditions. Returns mask of
+    the peak positions (midpoints of flat peaks) with the same shape as ``array``.
+    """
+    n_series, length = array.shape
+    peaks = np.zeros(array.shape, dtype=bool)
+    if length < 3:
+        return peaks
+    signs = np.sign(np.diff(array, axis=1))
+    positions = np.arange(length - 1)
+    last_nonzero = np.maximum.accumulate(np.where(signs != 0, positions, -1), axis=1)
+    previous_nonzero = np.concatenate([np.full((n_series, 1), -1), last_nonzero[:, :-1]], axis=1)
+    previous_sign = np.take_along_axis(signs, np.clip(previous_nonzero, 0, None), axis=1)
+    is_peak_end = (signs == -1) & (previous_nonzero >= 0) & (previous_sign == 1)
+    rows, right_edge = np.nonzero(is_peak_end)
+    left_edge = previous_nonzero[rows, right_edge] + 1
+    peaks[rows, (left_edge + right_edge) // 2] = True
+    return peaks
+
+
+def mean(array: np.array) -> np.array:
+    return np.mean(array, axis=1)
+
+
+def median(array: np.array) -> np.array:
+    return np.median(array, axis=1)
+
+
+def std(array: np.array) -> np.array:
+    return np.std(array, axis=1)
+
+
+def maximum(array: np.array) -> np.array:
+    return np.max(array, axis=1)
+
+
+def minimum(array: np.array) -> np.array:
+    return np.min(array, axis=1)
+
+
+def q5(array: np.array) -> np.array:
+    return np.quantile(array, 0.05, axis=1)
+
+
+def q25(array: np.array) -> np.array:
+    return np.quantile(array, 0.25, axis=1)
+
+
+def q75(array: np.array) -> np.array:
+    return np.quantile(array, 0.75, axis=1)
+
+
+def q95(array: np.array) -> np.array:
+    return np.quantile(array, 0.95, axis=1)
+
+
+def skewness(array: np.array) -> np.array:
+    """Bias corrected skewness, the same as ``pd.Series.skew``.
+    """
+    count = array.shape[1]
+    adjusted = array - array.mean(axis=1, keepdims=True)
+    adjusted2 = adjusted ** 2
+    m2 = _zero_out_fperr(adjusted2.sum(axis=1))
+    m3 = _zero_out_fperr((adjusted2 * adjusted).sum(axis=1))
+    if count < 3:
+        return np.full(array.shape[0], np.nan)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        result = (count * (count - 1) ** 0.5 / (count - 2)) * (m3 / m2 ** 1.5)
+    return np.where(m2 == 0, 0, result)
+
+
+def kurtosis(array: np.array) -> np.array:
+    """Unbiased excess kurtosis, the same as ``pd.Series.kurtosis``.
+    """
+    count = array.shape[1]
+    if count < 4:
+        return np.full(array.shape[0], np.nan)
+    adjusted2 = (array - array.mean(axis=1, keepdims=True)) ** 2
+    m2 = adjusted2.sum(axis=1)
+    m4 = (adjusted2 ** 2).sum(axis=1)
+    adj = 3 * (count - 1) ** 2 / ((count - 2) * (count - 3))
+    numerator = _zero_out_fperr(count * (count + 1) * (count - 1) * m4)
+    denominator = _zero_out_fperr((count - 2) * (count - 3) * m2 ** 2)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        result = numerator / denominator - adj
+    return np.where(denominator == 0, 0, result)
+
+
+def n_peaks(array: np.array) -> np.array:
+    return _local_maxima(array).sum(axis=1)
+
+
+def mean_ptp_distance(array: np.array) -> np.array:
+    peaks = _local_maxima(array)
+    count = peaks.sum(axis=1)
+    positions = np.arange(array.shape[1])
+    first = np.where(peaks, positions, array.shape[1]).min(axis=1)
+    last = np.where(peaks, positions, -1).max(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(count > 1, (last - first) / (count - 1), np.nan)
+
+
+def slope(array: np.array) -> np.array:
+    time = np.arange(array.shape[1], dtype=float)
+    time = time - time.mean()
+    centered = array - array.mean(axis=1, keepdims=True)
+    return centered @ time / np.sum(time ** 2)
+
+
+def ben_corr(array: np.array) -> np.array:
+    """Correlation of the first digit distribution with the Newcomb-Benford's Law distribution. First digits
+    are taken from the shortest decimal representation of the values, as it is done in ``stat_features.ben_corr``.
+    """
+    length = array.shape[1]
+    representation = np.abs(np.nan_to_num(array)).astype('S32', order='C').view(np.uint8).reshape(array.shape + (32,))
+    is_digit = (representation >= ord('1')) & (representation <= ord('9'))
+    first_digit_position = np.argmax(is_digit, axis=2)
+    first_digit = np.take_along_axis(representation, first_digit_position[..., None], axis=2)[..., 0]
+    first_digit = np.where(is_digit.any(axis=2), first_digit - ord('0'), 0)
+
+    benford_distribution = np.log10(1 + 1 / np.arange(1, 10))
+    data_distribution = np.stack([(first_digit == n).sum(axis=1) / length for n in range(1, 10)], axis=1)
+    return _row_corrcoef(np.broadcast_to(benford_distribution, data_distribution.shape), data_distribution)
+
+
+def interquartile_range(array: np.array) -> np.array:
+    return q75(array) - q25(array)
+
+
+def energy(array: np.array) -> np.array:
+    return np.sum(np.power(array, 2), axis=1) / array.shape[1]
+
+
+def autocorrelation(array: np.array) -> np.array:
+    return _row_corrcoef(array, np.roll(array, 1, axis=1))
+
+
+def zero_crossing_rate(array: np.array) -> np.array:
+    """Rate of sign-changes of the series scaled to [-1, 1] the same way as ``MinMaxScaler`` does.
+    """
+    array = array.astype(float)
+    data_min = np.min(array, axis=1, keepdims=True)
+    data_range = np.max(array, axis=1, keepdims=True) - data_min
+    data_range[data_range < 10 * np.finfo(data_range.dtype).eps] = 1.0
+    scale = 2 / data_range
+    scaled_array = array * scale + (-1 - data_min * scale)
+    signs = np.sign(scaled_array)
+    signs[signs == 0] = -1
+    return np.sum((signs[:, 1:] - signs[:, :-1]) != 0, axis=1) / array.shape[1]
+
+
+def shannon_entropy(array: np.array) -> np.array:
+    n_series, length = array.shape
+    sorted_array = np.sort(array, axis=1)
+    is_new_value = np.ones(array.shape, dtype=bool)
+    is_new_value[:, 1:] = (sorted_array[:, 1:] != sorted_array[:, :-1]) & \
+        ~(np.isnan(sorted_array[:, 1:]) & np.isnan(sorted_array[:, :-1]))
+    starts = np.flatnonzero(is_new_value)
+    counts = np.diff(np.append(starts, n_series * length))
+    p = counts / length
+    return -np.bincount(starts // length, weights=p * np.log2(p), minlength=n_series)
+
+
+def ptp_amp(array: np.array) -> np.array:
+    return np.ptp(array, axis=1)
+
+
+def crest_factor(array: np.array) -> np.array:
+    return np.max(np.abs(array), axis=1) / np.sqrt(np.mean(np.square(array), axis=1))
+
+
+def _span(length: int) -> int:
+    span = int(length / 10)
+    return 2 if span in [0, 1] else span
+
+
+def mean_ema(array: np.array) -> np.array:
+    """Last value of the adjusted exponential moving average, the same as ``pd.Series.ewm(span).mean()``.
+    """
+    alpha = 2 / (_span(array.shape[1]) + 1)
+    weights = (1 - alpha) ** np.arange(array.shape[1] - 1, -1, -1)
+    return array @ weights / weights.sum()
+
+
+def mean_moving_median(array: np.array) -> np.array:
+    span = _span(array.shape[1])
+    if span > array.shape[1]:
+        return np.full(array.shape[0], np.nan)
+    windows = np.lib.stride_tricks.sliding_window_view(array, span, axis=1)
+    return np.median(windows, axis=2).mean(axis=1)
+
+
+def hjorth_mobility(array: np.array) -> np.array:
+    diff_sequence = np.diff(array, axis=1)
+    M2 = np.sum(np.power(diff_sequence, 2), axis=1) / diff_sequence.shape[1]
+    TP = np.sum(np.power(array, 2), axis=1) / array.shape[1]
+    return np.sqrt(M2 / TP)
+
+
+def hjorth_complexity(array: np.array) -> np.array:
+    diff_sequence = np.diff(array, axis=1)
+    M2 = np.sum(np.power(diff_sequence, 2), axis=1) / diff_sequence.shape[1]
+    TP = np.sum(np.power(array, 2), axis=1) / array.shape[1]
+    M4 = np.sum(np.diff(diff_sequence, axis=1) ** 2, axis=1) / diff_sequence.shape[1]
+    return np.sqrt((M4 * TP) / (M2 * M2))
+
+
+def hurst_exponent(array: np.array) -> np.array:
+    """Hurst exponent computed with rescaled range analysis. The loop goes over the prefix length,
+    so the number of python calls depends on the series length only, not on the number of series.
+    """
+    n_series, length = array.shape
+    T = np.arange(1, length + 1)
+    Y = np.cumsum(array, axis=1)
+    Ave_T = Y / T
+
+    S_T = np.zeros(array.shape)
+    R_T = np.zeros(array.shape)
+    for i in range(length):
+        S_T[:, i] = np.std(array[:, :i + 1], axis=1)
+        X_T = Y[:, :i + 1] - T[:i + 1] * Ave_T[:, i:i + 1]
+        R_T[:, i] = np.ptp(X_T, axis=1)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        R_S = np.log(R_T / S_T)[:, 1:]
+    n = np.log(T)[1:]
+    n_centered = n - n.mean()
+    return (R_S - R_S.mean(axis=1, keepdims=True)) @ n_centered / np.sum(n_centered ** 2)
+
+
+def pfd(array: np.array) -> np.array:
+    """Petrosian fractal dimension of the series.
+    """
+    D = np.diff(array, axis=1)
+    N_delta = np.sum(D[:, 1:] * D[:, :-1] < 0, axis=1)
+    n = array.shape[1]
+    return np.log10(n) / (np.log10(n) + np.log10(n / n + 0.4 * N_delta))
+
+
+def get_batch_statistical_features(time_series: np.array,
+                                   methods: dict,
+                                   chunk_size: int = None) -> np.array:
+    """Applies every method from ``methods`` to the last axis of ``time_series``.
+
+    Args:
+        time_series: array of shape ``(..., series_length)``
+        methods: dict of feature names and batch functions from this module
+        chunk_size: max number of series processed at once. If None, it is chosen to bound
+            the size of temporary arrays by ``BATCH_MEMORY_LIMIT``
+
+    Returns:
+        array of shape ``(..., len(methods))``
+
+    """
+    batch_shape, length = time_series.shape[:-1], time_series.shape[-1]
+    series = time_series.reshape(-1, length)
+    if chunk_size is None:
+        chunk_size = max(1, BATCH_MEMORY_LIMIT // (length * max(_span(length), 32)))
+
+    features = np.empty((series.shape[0], len(methods)))
+    for start in range(0, series.shape[0], chunk_size):
+        chunk = series[start:start + chunk_size]
+        for index, method in enumerate(methods.values()):
+            features[start:start + chunk_size, index] = method(chunk)
+    return features.reshape(batch_shape + (len(methods),))
+
+
+def _sorted_quantile(sorted_windows: np.array, q: float) -> np.array:
+    """Linear interpolation quantile of already sorted windows, the same as ``np.quantile``.
+    """
+    virtual_index = q * (sorted_windows.shape[-1] - 1)
+    previous_index = int(np.floor(virtual_index))
+    next_index = min(previous_index + 1, sorted_windows.shape[-1] - 1)
+    gamma = virtual_index - previous_index
+    previous_value, next_value = sorted_windows[..., previous_index], sorted_windows[..., next_index]
+    diff_b_a = next_value - previous_value
+    if gamma >= 0.5:
+        return next_value - diff_b_a * (1 - gamma)
+    return previous_value + diff_b_a * gamma
+
+
+def _window_statistics(series: np.array, starts: np.array, window_length: int) -> dict:
+    """Computes local statistics of all windows of all series. Mean and deviation are taken from
+    running sums of centered series, order statistics are taken from a single sort of every window.
+    """
+    series_mean = series.mean(axis=1, keepdims=True)
+    centered = series - series_mean
+    running_sum = np.zeros((series.shape[0], series.shape[1] + 1))
+    running_sq_sum = np.zeros((series.shape[0], series.shape[1] + 1))
+    np.cumsum(centered, axis=1, out=running_sum[:, 1:])
+    np.cumsum(centered ** 2, axis=1, out=running_sq_sum[:, 1:])
+    window_sum = running_sum[:, starts + window_length] - running_sum[:, starts]
+    window_sq_sum = running_sq_sum[:, starts + window_length] - running_sq_sum[:, starts]
+    window_mean = window_sum / window_length
+
+    windows = np.lib.stride_tricks.sliding_window_view(series, window_length, axis=1)[:, starts]
+    sorted_windows = np.sort(windows, axis=2)
+    middle = sorted_windows[..., (window_length - 1) // 2], sorted_windows[..., window_length // 2]
+    return {'mean_': window_mean + series_mean,
+            'median_': (middle[0] + middle[1]) / 2,
+            'std_': np.sqrt(np.clip(window_sq_sum / window_length - window_mean ** 2, 0, None)),
+            'max_': sorted_windows[..., -1],
+            'min_': sorted_windows[..., 0],
+            'q5_': _sorted_quantile(sorted_windows, 0.05),
+            'q25_': _sorted_quantile(sorted_windows, 0.25),
+            'q75_': _sorted_quantile(sorted_windows, 0.75),
+            'q95_': _sorted_quantile(sorted_windows, 0.95)}
+
+
+def get_window_statistical_features(time_series: np.array,
+                                    methods: dict,
+                                    window_length: int,
+                                    starts: np.array,
+                                    chunk_size: int = None) -> np.array:
+    """Computes local statistics for every window of every series in one pass over strided views.
+
+    Args:
+        time_series: array of shape ``(..., series_length)``
+        methods: dict of local feature names, only the keys of ``BATCH_STAT_METHODS`` are supported
+        window_length: length of every window
+        starts: start positions of the windows
+        chunk_size: max number of series processed at once. If None, it is chosen to bound
+            the size of sorted windows by ``BATCH_MEMORY_LIMIT``
+
+    Returns:
+        array of shape ``(..., len(starts) * len(methods))`` ordered window by window
+
+    """
+    batch_shape, length = time_series.shape[:-1], time_series.shape[-1]
+    series = time_series.reshape(-1, length).astype(float)
+    if chunk_size is None:
+        chunk_size = max(1, BATCH_MEMORY_LIMIT // (len(starts) * window_length))
+
+    features = np.empty((series.shape[0], len(starts), len(methods)))
+    for start in range(0, series.shape[0], chunk_size):
+        statistics = _window_statistics(series[start:start + chunk_size], starts, window_length)
+        for index, name in enumerate(methods):
+            features[start:start + chunk_size, :, index] = statistics[name]
+    return features.reshape(batch_shape + (len(starts) * len(methods),))
+
+
+@lru_cache(maxsize=128)
+def window_feature_names(names: tuple, n_windows: int, window_size: int) -> tuple:
+    """Names of window features, built once per windowing configuration.
+    """
+    return tuple(name + f'_on_interval: {i + 1} - {i + 1 + window_size}'
+                 for i in range(n_windows) for name in names)
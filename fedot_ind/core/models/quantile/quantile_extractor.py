@@ -6,6 +6,9 @@ from fedot.core.operations.operation_parameters import OperationParameters
 
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
 from fedot_ind.core.models.base_extractor import BaseExtractor
+from fedot_ind.core.models.quantile.batch_stat_features import get_batch_statistical_features, \
+    get_window_statistical_features, window_feature_names
+from fedot_ind.core.repository.constanst_repository import BATCH_STAT_METHODS, BATCH_STAT_METHODS_GLOBAL
 
 
 class QuantileExtractor(BaseExtractor):
@@ -15,6 +18,8 @@ class QuantileExtractor(BaseExtractor):
         window_size (int): size of window
         stride (int): stride for window
         var_threshold (float): threshold for variance
+        batch_mode (bool): if True, features for the whole dataset are computed at once with vectorized
+            kernels instead of per-sample parallel dispatch
 
     Example:
         To use this class you need to import it and call needed methods::
@@ -41,9 +46,11 @@ class QuantileExtractor(BaseExtractor):
         self.window_size = params.get('window_size', 0)
         self.stride = params.get('stride', 1)
         self.var_threshold = 0.1
+        self.batch_mode = params.get('batch_mode', True)
         self.logging_params.update({'Wsize': self.window_size,
                                     'Stride': self.stride,
-                                    'VarTh': self.var_threshold})
+                                    'VarTh': self.var_threshold,
+                                    'Batch': self.batch_mode})
 
     def _concatenate_global_and_local_feature(self, global_features: InputData,
                                               window_stat_features: InputData) -> InputData:
@@ -76,6 +83,39 @@ class QuantileExtractor(BaseExtractor):
             window_stat_features = self.get_statistical_features(ts)
         return self._concatenate_global_and_local_feature(global_features, window_stat_features)
 
+    def extract_stats_features_batch(self, ts: np.array) -> tuple:
+        """Computes global and local statistical features for all series at once.
+
+        Args:
+            ts: array of shape ``(n_samples, length)`` or ``(n_samples, n_channels, length)``
+
+        Returns:
+            tuple of feature matrix and feature names in the same format as per-sample extraction
+
+        """
+        global_features = get_batch_statistical_features(ts, BATCH_STAT_METHODS_GLOBAL)
+        if self.window_size != 0:
+            window_length, starts, window_size = self._get_window_geometry(ts.shape[-1], self.window_size)
+            local_features = get_window_statistical_features(ts, BATCH_STAT_METHODS, window_length, starts)
+            local_names = window_feature_names(tuple(BATCH_STAT_METHODS), len(starts), window_size)
+        else:
+            local_features = get_batch_statistical_features(ts, BATCH_STAT_METHODS)
+            local_names = BATCH_STAT_METHODS.keys()
+        features = np.nan_to_num(np.concatenate([global_features, local_features], axis=-1))
+        if len(ts.shape) == 2:
+            names = list(chain(BATCH_STAT_METHODS_GLOBAL.keys(), local_names))
+        else:
+            names = [f'component {index}' for index in range(ts.shape[1])]
+        return features, names
+
+    def _transform(self, input_data: InputData) -> np.array:
+        features = np.asarray(input_data.features)
+        if not self.batch_mode or len(features.shape) not in (2, 3):
+            return super()._transform(input_data)
+        stacked_data, self.relevant_features = self.extract_stats_features_batch(features)
+        self.predict = self._clean_predict(stacked_data)
+        return self.predict
+
     def generate_features_from_ts(self,
                                   ts: np.array,
                                   window_length: int = None) -> InputData:
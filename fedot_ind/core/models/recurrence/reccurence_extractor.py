@@ -63,9 +63,9 @@ class RecurrenceExtractor(BaseExtractor):
                                    rec_metric=self.rec_metric)
 
         if not self.image_mode:
-            feature_df = specter.ts_to_recurrence_matrix()
+            feature_df = specter.ts_to_recurrence_matrix(output='packed')
             feature_df = self.extractor(
-                recurrence_matrix=feature_df).quantification_analysis()
+                recurrence_matrix=feature_df, packed=True).quantification_analysis()
             features = np.nan_to_num(
                 np.array(list(feature_df.values())), posinf=0, neginf=0)
             col_names = {'feature_name': list(feature_df.keys())}
@@ -1,24 +1,112 @@
 from __future__ import division, print_function
 
+from scipy import sparse
+
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
 
 
+# number of matrix elements processed at once by the line length engine
+LINE_BLOCK_SIZE = 2 ** 22
+
+
+def pack_recurrence_matrix(recurrence_matrix: np.ndarray) -> np.ndarray:
+    """Packs recurrent points of each row of the recurrence matrix into bits.
+
+    Args:
+        recurrence_matrix: square recurrence matrix.
+
+    Returns:
+        array of shape ``(n_vectors, ceil(n_vectors / 8))`` of ``uint8`` type.
+    """
+    return np.packbits(recurrence_matrix == 1, axis=1)
+
+
+def _run_lengths(mask: np.ndarray) -> np.ndarray:
+    """Returns lengths of all runs of True values along the rows of a boolean matrix."""
+    padded = np.zeros((mask.shape[0], mask.shape[1] + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    edges = np.diff(padded, axis=1)
+    # starts and ends of the runs of one row share the row offset, so flat positions can be subtracted
+    return np.flatnonzero(edges == -1) - np.flatnonzero(edges == 1)
+
+
+def line_length_histograms(recurrence_matrix: np.ndarray,
+                           n_vectors: int = None,
+                           packed: bool = False,
+                           block_size: int = LINE_BLOCK_SIZE) -> tuple:
+    """Calculates frequency distributions of diagonal, vertical and white vertical line lengths of
+    the recurrence matrix in one pass over its rows.
+
+    Vertical lines are found by run-length encoding of blocks of rows. Diagonal lines are tracked with
+    a vector of current run lengths of all ``2 * n_vectors - 1`` diagonals which is updated row by row,
+    so no intermediate array larger than a block of rows is allocated.
+
+    Args:
+        recurrence_matrix: square dense or sparse recurrence matrix or its bit-packed rows if ``packed`` is True.
+        n_vectors: number of vectors of the recurrence matrix. Required for bit-packed matrices.
+        packed: whether rows of the recurrence matrix are packed with :func:`pack_recurrence_matrix`.
+        block_size: number of matrix elements processed at once.
+
+    Returns:
+        tuple of diagonal, vertical and white vertical frequency distributions of length ``n_vectors + 1``.
+    """
+    if n_vectors is None:
+        n_vectors = recurrence_matrix.shape[0]
+    rows_per_block = max(1, block_size // max(n_vectors, 1))
+
+    vertical_lengths, white_lengths, diagonal_lengths = [], [], []
+    diagonal_runs = np.zeros(2 * n_vectors - 1, dtype=np.int64)
+    for block_start in range(0, n_vectors, rows_per_block):
+        block = recurrence_matrix[block_start:block_start + rows_per_block]
+        if sparse.issparse(block):
+            block = block.toarray()
+        if packed:
+            recurrent = np.unpackbits(block, axis=1, count=n_vectors).astype(bool)
+            white = ~recurrent
+        else:
+            recurrent = block == 1
+            white = block == 0
+        vertical_lengths.append(_run_lengths(recurrent))
+        white_lengths.append(_run_lengths(white))
+
+        for row_index, row in enumerate(recurrent, start=block_start):
+            # diagonals crossing the row in order of columns
+            runs = diagonal_runs[n_vectors - 1 - row_index:2 * n_vectors - 1 - row_index]
+            interrupted = runs[~row]
+            diagonal_lengths.append(interrupted[interrupted != 0])
+            runs += 1
+            runs *= row
+    diagonal_lengths.append(diagonal_runs[diagonal_runs != 0])
+
+    return tuple(np.bincount(np.concatenate(lengths), minlength=n_vectors + 1).astype(float)
+                 for lengths in (diagonal_lengths, vertical_lengths, white_lengths))
+
+
 class RecurrenceFeatureExtractor:
-    def __init__(self, recurrence_matrix: np.ndarray = None):
+    """Class responsible for recurrence quantification analysis of a recurrence matrix.
+
+    Args:
+        recurrence_matrix: square recurrence matrix or, if ``packed`` is True, its bit-packed rows
+            obtained with :func:`pack_recurrence_matrix`.
+        packed: whether the recurrence matrix is bit-packed.
+    """
+
+    def __init__(self, recurrence_matrix: np.ndarray = None, packed: bool = False):
         self.recurrence_matrix = recurrence_matrix
+        self.packed = packed
 
     def quantification_analysis(self, MDL: int = 3, MVL: int = 3, MWVL: int = 2):
 
         n_vectors = self.recurrence_matrix.shape[0]
-        recurrence_rate = float(
-            np.sum(self.recurrence_matrix)) / np.power(n_vectors, 2)
+        diagonal_frequency_dist, vertical_frequency_dist, white_vertical_frequency_dist = \
+            self.calculate_line_frequencies(number_of_vectors=n_vectors)
 
-        diagonal_frequency_dist = self.calculate_diagonal_frequency(
-            number_of_vectors=n_vectors)
-        vertical_frequency_dist = self.calculate_vertical_frequency(
-            number_of_vectors=n_vectors, not_white=1)
-        white_vertical_frequency_dist = self.calculate_vertical_frequency(number_of_vectors=n_vectors,
-                                                                          not_white=0)
+        if self.packed:
+            # every recurrent point belongs to exactly one vertical line
+            recurrent_points = np.dot(np.arange(n_vectors + 1), vertical_frequency_dist)
+        else:
+            recurrent_points = np.sum(self.recurrence_matrix)
+        recurrence_rate = float(recurrent_points) / np.power(n_vectors, 2)
 
         determinism = self.laminarity_or_determinism(
             MDL, n_vectors, diagonal_frequency_dist, lam=False)
@@ -54,48 +142,29 @@ class RecurrenceFeatureExtractor:
                 'EWLL': entropy_white_vertical_lines, 'RDRR': determinism / recurrence_rate,
                 'RLD': laminarity / determinism}
 
+    def calculate_line_frequencies(self, number_of_vectors):
+        """Calculates frequency distributions of diagonal, vertical and white vertical line lengths
+        in one pass over the recurrence matrix.
+
+        Args:
+            number_of_vectors: number of vectors (rows) of the recurrence matrix.
+
+        Returns:
+            tuple of diagonal, vertical and white vertical frequency distributions.
+        """
+        return line_length_histograms(self.recurrence_matrix,
+                                      n_vectors=number_of_vectors,
+                                      packed=self.packed)
+
     def calculate_vertical_frequency(self, number_of_vectors, not_white: int):
-        vertical_frequency_distribution = np.zeros(number_of_vectors + 1)
-        for i in range(number_of_vectors):
-            vertical_line_length = 0
-            for j in range(number_of_vectors):
-                if self.recurrence_matrix[i, j] == not_white:
-                    vertical_line_length += 1
-                    if j == (number_of_vectors - 1):
-                        vertical_frequency_distribution[vertical_line_length] += 1.0
-                else:
-                    if vertical_line_length != 0:
-                        vertical_frequency_distribution[vertical_line_length] += 1.0
-                        vertical_line_length = 0
-        return vertical_frequency_distribution
+        _, vertical_frequency_distribution, white_vertical_frequency_distribution = \
+            self.calculate_line_frequencies(number_of_vectors)
+        if not_white:
+            return vertical_frequency_distribution
+        return white_vertical_frequency_distribution
 
     def calculate_diagonal_frequency(self, number_of_vectors):
-        diagonal_frequency_distribution = np.zeros(number_of_vectors + 1)
-        for i in range(number_of_vectors - 1, -1, -1):
-            diagonal_line_length = 0
-            for j in range(0, number_of_vectors - i):
-                if self.recurrence_matrix[i + j, j] == 1:
-                    diagonal_line_length += 1
-                    if j == (number_of_vectors - i - 1):
-                        diagonal_frequency_distribution[diagonal_line_length] += 1.0
-                else:
-                    if diagonal_line_length != 0:
-                        diagonal_frequency_distribution[diagonal_line_length] += 1.0
-                        diagonal_line_length = 0
-
-        for k in range(1, number_of_vectors):
-            diagonal_line_length = 0
-            for i in range(number_of_vectors - k):
-                j = i + k
-                if self.recurrence_matrix[i, j] == 1:
-                    diagonal_line_length += 1
-                    if j == (number_of_vectors - 1):
-                        diagonal_frequency_distribution[diagonal_line_length] += 1.0
-                else:
-                    if diagonal_line_length != 0:
-                        diagonal_frequency_distribution[diagonal_line_length] += 1.0
-                        diagonal_line_length = 0
-        return diagonal_frequency_distribution
+        return self.calculate_line_frequencies(number_of_vectors)[0]
 
     def entropy_lines(self, factor, number_of_vectors, distribution, diag: bool):
         if diag:
@@ -4,10 +4,114 @@ from multiprocessing.dummy import Pool as ThreadPool
 import pandas as pd
 from gtda.diagrams import BettiCurve, Filtering, PersistenceEntropy, PersistenceLandscape, Scaler
 from gtda.homology import VietorisRipsPersistence
+from scipy.special import entr
 
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
 
 
+# largest number of elements of intermediate arrays built for a part of a batch of diagrams
+BATCH_ELEMENTS_LIMIT = 2 ** 24
+
+
+def _batch_linspace(start: np.ndarray, stop: np.ndarray, num: int) -> np.ndarray:
+    # evaluates np.linspace for arrays of bounds with the same rounding as for each pair of bounds
+    delta = (stop - start)[..., None]
+    samplings = np.arange(num, dtype=float)
+    if num > 1:
+        step = delta / (num - 1)
+        samplings = np.where(step == 0, samplings / (num - 1) * delta, samplings * step)
+    else:
+        samplings = samplings * delta
+    samplings += start[..., None]
+    if num > 1:
+        samplings[..., -1] = stop
+    return samplings
+
+
+class PersistenceDiagramsBatch:
+    """Padded batch of persistence diagrams for vectorized computation of diagram features. Points of each
+    homology dimension of a diagram are kept in their original order and padded with zeros up to the largest
+    number of points of a dimension in the batch.
+
+    Args:
+        persistence_diagrams: list of persistence diagrams of triples ``[birth, death, dimension]``, each of them
+            contains points of all homology dimensions of the batch.
+
+    Attributes:
+        births: array of births of shape ``(n_diagrams, n_dims, n_points)``.
+        deaths: array of deaths of the same shape.
+        mask: boolean array of the same shape, which is True for points of the diagrams.
+        n_points: array of numbers of points of each homology dimension of shape ``(n_diagrams, n_dims)``.
+
+    """
+
+    def __init__(self, persistence_diagrams: list):
+        self.diagrams = persistence_diagrams
+        self.n_diagrams = len(persistence_diagrams)
+        self.n_dims = int(max(np.max(diagram[:, 2]) for diagram in persistence_diagrams)) + 1
+        subdiagrams = [diagram[diagram[:, 2] == dim, :2]
+                       for diagram in persistence_diagrams for dim in range(self.n_dims)]
+        self.n_points = np.array([len(subdiagram) for subdiagram in subdiagrams]).reshape(self.n_diagrams,
+                                                                                          self.n_dims)
+        self.mask = np.arange(max(self.n_points.max(), 1)) < self.n_points[..., None]
+        points = np.zeros(self.mask.shape + (2,))
+        points[self.mask] = np.concatenate(subdiagrams)
+        self.births, self.deaths = points[..., 0], points[..., 1]
+        self.lifetimes = self.deaths - self.births
+        self.__samplings = {}
+        self.__betti_curves = {}
+
+    def slices(self, elements_per_diagram: int) -> list:
+        """Splits the batch into parts, so intermediate arrays of a part do not exceed ``BATCH_ELEMENTS_LIMIT``."""
+        step = max(1, BATCH_ELEMENTS_LIMIT // max(elements_per_diagram, 1))
+        return [slice(start, start + step) for start in range(0, self.n_diagrams, step)]
+
+    @staticmethod
+    def sequential_sum(values: np.ndarray) -> np.ndarray:
+        """Sums values of points one by one in the order of points, as a loop over a diagram does."""
+        return np.cumsum(values, axis=-1)[..., -1]
+
+    def pairwise_sum(self, values: np.ndarray) -> np.ndarray:
+        """Sums values of points of each homology dimension as numpy sums an array of these points only."""
+        sums = np.zeros(values.shape[:2])
+        for n_points in np.unique(self.n_points):
+            diagrams, dims = np.nonzero(self.n_points == n_points)
+            sums[diagrams, dims] = np.sum(values[diagrams, dims, :n_points], axis=-1)
+        return sums
+
+    def samplings(self, n_bins: int = 100) -> np.ndarray:
+        """Filtration values of each homology dimension of each diagram as chosen by ``gtda`` for Betti curves
+        and persistence landscapes of one diagram.
+
+        Returns:
+            array of shape ``(n_diagrams, n_dims, n_bins)``.
+        """
+        if n_bins not in self.__samplings:
+            min_values = np.minimum(np.min(np.where(self.mask, self.births, np.inf), axis=-1),
+                                    np.min(np.where(self.mask, self.deaths, np.inf), axis=-1))
+            max_values = np.maximum(np.max(np.where(self.mask, self.births, -np.inf), axis=-1),
+                                    np.max(np.where(self.mask, self.deaths, -np.inf), axis=-1))
+            max_values = np.where(max_values != min_values, max_values, np.max(max_values, axis=1, keepdims=True))
+            self.__samplings[n_bins] = _batch_linspace(min_values, max_values, n_bins)
+        return self.__samplings[n_bins]
+
+    def betti_curves(self, n_bins: int = 100) -> np.ndarray:
+        """Betti curves of each homology dimension of each diagram.
+
+        Returns:
+            array of shape ``(n_diagrams, n_dims, n_bins)``.
+        """
+        if n_bins not in self.__betti_curves:
+            samplings = self.samplings(n_bins)[..., None]
+            curves = np.zeros(samplings.shape[:3], dtype=int)
+            for part in self.slices(samplings[0].size * self.mask.shape[2]):
+                alive = (samplings[part] >= self.births[part, :, None]) & \
+                    (samplings[part] < self.deaths[part, :, None]) & self.mask[part, :, None]
+                curves[part] = np.sum(alive, axis=-1)
+            self.__betti_curves[n_bins] = curves
+        return self.__betti_curves[n_bins]
+
+
 class PersistenceDiagramFeatureExtractor(ABC):
     """Abstract class persistence diagrams features extractor.
 
@@ -16,9 +120,20 @@ class PersistenceDiagramFeatureExtractor(ABC):
     def extract_feature_(self, persistence_diagram):
         pass
 
+    def extract_batch_feature_(self, diagrams_batch: PersistenceDiagramsBatch) -> np.ndarray:
+        return np.stack([self.extract_feature_(diagram) for diagram in diagrams_batch.diagrams])
+
     def fit_transform(self, x_pd):
         return self.extract_feature_(x_pd)
 
+    def fit_transform_batch(self, diagrams_batch: PersistenceDiagramsBatch) -> np.ndarray:
+        """Computes the feature of each diagram of the batch.
+
+        Returns:
+            array of shape ``(n_diagrams, n_features)``, rows are equal to :meth:`fit_transform` of the diagrams.
+        """
+        return self.extract_batch_feature_(diagrams_batch)
+
 
 class PersistenceDiagramsExtractor:
     """Class to extract persistence diagrams from time series.
@@ -74,6 +189,37 @@ class PersistenceDiagramsExtractor:
         x_persistence_diagrams = self.persistence_diagrams_(x_embeddings)
         return x_persistence_diagrams
 
+    def transform_batch(self, point_clouds) -> list:
+        """Computes persistence diagrams of many point clouds by one call of Vietoris-Rips persistence. Each
+        diagram is the same as :meth:`transform` returns for its point cloud: padding of the batch is removed
+        and the diagram is scaled by its own amplitude.
+
+        Args:
+            point_clouds: array of point clouds of shape ``(n_clouds, n_points, dimension)`` or a list of them.
+
+        Returns:
+            list of persistence diagrams.
+        """
+        vr = VietorisRipsPersistence(metric='euclidean', homology_dimensions=self.homology_dimensions_,
+                                     n_jobs=self.n_job)
+        return [self._postprocess_batch_diagram_(diagram) for diagram in vr.fit_transform(point_clouds)]
+
+    def _postprocess_batch_diagram_(self, diagram):
+        # padding triples of a batch have equal birth and death; a diagram of one point cloud has
+        # a single padding triple at zero only in empty homology dimensions
+        subdiagrams = []
+        for dim in sorted(self.homology_dimensions_):
+            subdiagram = diagram[(diagram[:, 2] == dim) & (diagram[:, 0] < diagram[:, 1])]
+            subdiagrams.append(subdiagram if len(subdiagram) else np.array([[0.0, 0.0, dim]]))
+        diagram = np.concatenate(subdiagrams)
+        # the same scale as fitted by Scaler with bottleneck amplitude on one diagram
+        diagram[:, :2] /= np.max(np.abs(diagram[:, 1] - diagram[:, 0]) / 2.)
+        if self.filtering_:
+            diagram_filter = Filtering(
+                epsilon=0.1, homology_dimensions=self.filtering_dimensions_)
+            diagram = diagram_filter.fit_transform(diagram[None])[0]
+        return diagram
+
 
 class TopologicalFeaturesExtractor:
     def __init__(self, persistence_diagram_extractor, persistence_diagram_features):
@@ -81,8 +227,34 @@ class TopologicalFeaturesExtractor:
         self.persistence_diagram_features_ = persistence_diagram_features
 
     def transform(self, x):
-
         x_pers_diag = self.persistence_diagram_extractor_.transform(x)
+        return self.diagram_features_(x_pers_diag)
+
+    def transform_batch(self, point_clouds) -> pd.DataFrame:
+        """Computes topological features of many point clouds, persistence diagrams of all of them are computed
+        by one call of the persistence diagram extractor and their features by vectorized feature extractors.
+
+        Returns:
+            dataframe with a row of features for each point cloud.
+        """
+        diagrams = self.persistence_diagram_extractor_.transform_batch(point_clouds)
+        return self.batch_features_(PersistenceDiagramsBatch(diagrams))
+
+    def batch_features_(self, diagrams_batch: PersistenceDiagramsBatch) -> pd.DataFrame:
+        feature_list = []
+        column_list = []
+        for feature_name, feature_model in self.persistence_diagram_features_.items():
+            try:
+                x_features = feature_model.fit_transform_batch(diagrams_batch)
+            except Exception:
+                # zeros for each homology dimension as in diagram_features_
+                x_features = np.zeros((diagrams_batch.n_diagrams, diagrams_batch.n_dims), dtype=int)
+            feature_list.append(x_features)
+            for dim in range(x_features.shape[1]):
+                column_list.append('{}_{}'.format(feature_name, dim))
+        return pd.DataFrame(data=np.hstack(feature_list), columns=column_list)
+
+    def diagram_features_(self, x_pers_diag):
         feature_list = []
         column_list = []
         for feature_name, feature_model in self.persistence_diagram_features_.items():
@@ -92,8 +264,8 @@ class TopologicalFeaturesExtractor:
                 for dim in range(len(x_features)):
                     column_list.append('{}_{}'.format(feature_name, dim))
             except Exception:
-                feature_list.append(
-                    np.array([0 for i in range(len(x_features))]))
+                x_features = np.zeros(int(np.max(x_pers_diag[:, 2])) + 1, dtype=int)
+                feature_list.append(x_features)
                 for dim in range(len(x_features)):
                     column_list.append('{}_{}'.format(feature_name, dim))
                 continue
@@ -113,6 +285,9 @@ class HolesNumberFeature(PersistenceDiagramFeatureExtractor):
                 feature[int(hole[2])] += 1.0
         return feature
 
+    def extract_batch_feature_(self, diagrams_batch):
+        return np.sum(diagrams_batch.lifetimes > 0, axis=-1).astype(float)
+
 
 class MaxHoleLifeTimeFeature(PersistenceDiagramFeatureExtractor):
     def __init__(self):
@@ -126,6 +301,9 @@ class MaxHoleLifeTimeFeature(PersistenceDiagramFeatureExtractor):
                 feature[int(hole[2])] = lifetime
         return feature
 
+    def extract_batch_feature_(self, diagrams_batch):
+        return np.maximum(np.max(diagrams_batch.lifetimes, axis=-1), 0.0)
+
 
 class RelevantHolesNumber(PersistenceDiagramFeatureExtractor):
     def __init__(self, ratio=0.7):
@@ -149,6 +327,12 @@ class RelevantHolesNumber(PersistenceDiagramFeatureExtractor):
 
         return feature
 
+    def extract_batch_feature_(self, diagrams_batch):
+        lifetimes = diagrams_batch.lifetimes
+        max_lifetimes = np.maximum(np.max(lifetimes, axis=-1), 0.0)
+        relevant = np.equal(lifetimes, self.ratio_ * max_lifetimes[..., None]) & diagrams_batch.mask
+        return np.sum(relevant, axis=-1).astype(float)
+
 
 class AverageHoleLifetimeFeature(PersistenceDiagramFeatureExtractor):
     def __init__(self):
@@ -170,6 +354,12 @@ class AverageHoleLifetimeFeature(PersistenceDiagramFeatureExtractor):
 
         return feature
 
+    def extract_batch_feature_(self, diagrams_batch):
+        lifetimes = diagrams_batch.lifetimes
+        n_holes = np.sum(lifetimes > 0, axis=-1).astype(float)
+        feature = diagrams_batch.sequential_sum(np.where(lifetimes > 0, lifetimes, 0.0))
+        return np.divide(feature, n_holes, out=np.zeros_like(feature), where=n_holes != 0)
+
 
 class SumHoleLifetimeFeature(PersistenceDiagramFeatureExtractor):
     def __init__(self):
@@ -181,6 +371,9 @@ class SumHoleLifetimeFeature(PersistenceDiagramFeatureExtractor):
             feature[int(hole[2])] += hole[1] - hole[0]
         return feature
 
+    def extract_batch_feature_(self, diagrams_batch):
+        return diagrams_batch.sequential_sum(diagrams_batch.lifetimes)
+
 
 class PersistenceEntropyFeature(PersistenceDiagramFeatureExtractor):
     def __init__(self):
@@ -190,6 +383,15 @@ class PersistenceEntropyFeature(PersistenceDiagramFeatureExtractor):
         persistence_entropy = PersistenceEntropy(n_jobs=-1)
         return persistence_entropy.fit_transform([persistence_diagram])[0]
 
+    def extract_batch_feature_(self, diagrams_batch):
+        # the same computation as scipy.stats.entropy with base 2 used by PersistenceEntropy
+        lifetimes = diagrams_batch.lifetimes
+        with np.errstate(invalid='ignore', divide='ignore'):
+            probabilities = 1.0 * lifetimes / diagrams_batch.pairwise_sum(lifetimes)[..., None]
+            entropy = diagrams_batch.pairwise_sum(np.where(diagrams_batch.mask, entr(probabilities), 0.0))
+        entropy /= np.log(2)
+        return np.nan_to_num(entropy, nan=-1)
+
 
 class SimultaneousAliveHolesFeature(PersistenceDiagramFeatureExtractor):
     def __init__(self):
@@ -236,6 +438,28 @@ class SimultaneousAliveHolesFeature(PersistenceDiagramFeatureExtractor):
 
         return feature
 
+    def extract_batch_feature_(self, diagrams_batch):
+        holes = diagrams_batch.mask & (diagrams_batch.lifetimes != 0.0)
+        starts = np.where(holes, diagrams_batch.births, np.inf)
+        ends = np.where(holes, diagrams_batch.deaths, np.inf)
+        order = np.lexsort((starts, ends), axis=-1)
+        starts = np.take_along_axis(starts, order, axis=-1)
+        ends = np.take_along_axis(ends, order, axis=-1)
+        n_holes = np.sum(holes, axis=-1)
+        n_points = starts.shape[-1]
+        positions = np.arange(n_points)
+        later = positions[None, :] > positions[:, None]
+
+        intersections = np.zeros(n_holes.shape, dtype=int)
+        for part in diagrams_batch.slices(diagrams_batch.n_dims * n_points ** 2):
+            # a hole is followed by holes starting while it is alive until the first one which is not
+            start, end = starts[part, :, :, None], ends[part, :, :, None]
+            stops = later & ~((start <= starts[part, :, None]) & (starts[part, :, None] <= end))
+            first_stop = np.where(stops.any(axis=-1), np.argmax(stops, axis=-1), n_points)
+            counts = np.where(positions < n_holes[part, :, None], first_stop - positions, 0)
+            intersections[part] = np.sum(counts, axis=-1)
+        return np.divide(intersections, n_holes, out=np.zeros(n_holes.shape), where=n_holes != 0)
+
 
 class AveragePersistenceLandscapeFeature(PersistenceDiagramFeatureExtractor):
     def __init__(self):
@@ -257,6 +481,9 @@ class BettiNumbersSumFeature(PersistenceDiagramFeatureExtractor):
             n_jobs=-1).fit_transform([persistence_diagram])[0]
         return np.array([np.sum(betti_curve[i, :]) for i in range(int(np.max(persistence_diagram[:, 2])) + 1)])
 
+    def extract_batch_feature_(self, diagrams_batch):
+        return np.sum(diagrams_batch.betti_curves(), axis=-1)
+
 
 class RadiusAtMaxBNFeature(PersistenceDiagramFeatureExtractor):
     def __init__(self):
@@ -270,3 +497,6 @@ class RadiusAtMaxBNFeature(PersistenceDiagramFeatureExtractor):
                                for i in range(max_dim)])
         return np.array(
             [np.where(betti_curve[i, :] == max_bettis[i])[0][0] / (n_bins * max_dim) for i in range(max_dim)])
+
+    def extract_batch_feature_(self, diagrams_batch, n_bins=100):
+        return np.argmax(diagrams_batch.betti_curves(n_bins), axis=-1) / (n_bins * diagrams_batch.n_dims)
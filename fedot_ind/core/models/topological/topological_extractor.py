@@ -23,6 +23,11 @@ sys.setrecursionlimit(1000000000)
 class TopologicalExtractor(BaseExtractor):
     """Class for extracting topological features from time series data.
 
+    Chunks of samples are processed by the batched topology engine: point clouds of all series of a chunk are
+    built at once with the embedding window found once per dataset, and their persistence diagrams are computed
+    by one call of Vietoris-Rips persistence. With ``n_landmarks`` parameter persistence is computed on landmark
+    points of each point cloud, so the cost of long series does not grow with the number of points.
+
     Args:
         params: parameters for operation
 
@@ -49,6 +54,7 @@ class TopologicalExtractor(BaseExtractor):
         super().__init__(params)
         self.window_size = params.get('window_size', 10)
         self.stride = params.get('stride', 1)
+        self.n_landmarks = params.get('n_landmarks', None)
         self.feature_extractor = TopologicalFeaturesExtractor(
             persistence_diagram_extractor=PERSISTENCE_DIAGRAM_EXTRACTOR,
             persistence_diagram_features=PERSISTENCE_DIAGRAM_FEATURES)
@@ -69,12 +75,33 @@ class TopologicalExtractor(BaseExtractor):
                 persistence_diagram_extractor=persistence_diagram_extractor,
                 persistence_diagram_features=PERSISTENCE_DIAGRAM_FEATURES)
 
-    def _generate_features_from_ts(self, ts_data: np.array,
-                                   persistence_params: dict) -> InputData:
+    def _init_data_transformer(self, ts_length: int, persistence_params: dict = None):
         if self.data_transformer is None:
             self.data_transformer = TopologicalTransformation(
                 persistence_params=persistence_params,
-                window_length=round(ts_data.shape[0] * 0.01 * self.window_size))
+                window_length=round(ts_length * 0.01 * self.window_size))
+
+    def _extract_chunk_features(self, samples: np.array) -> tuple:
+        """Generates features for a chunk of samples by the batched topology engine. Features are the same as
+        generated by :meth:`generate_features_from_ts` for each sample if ``n_landmarks`` is not set.
+        """
+        samples = np.asarray(samples)
+        series = samples.reshape(-1, samples.shape[-1])
+        self._init_data_transformer(series.shape[1])
+        point_clouds = self.data_transformer.time_series_to_point_clouds(series)
+        # contiguous points are required for fast computation of distances
+        point_clouds = np.ascontiguousarray(self.data_transformer.select_landmarks(point_clouds, self.n_landmarks))
+        topological_features = self.feature_extractor.transform_batch(point_clouds)
+        if samples.ndim > 2:
+            feature_names = [f'component {index}' for index in range(samples.shape[1])]
+        else:
+            feature_names = topological_features.columns
+        stacked_data = topological_features.values.reshape(len(samples), -1, topological_features.shape[1])
+        return stacked_data, (feature_names, True)
+
+    def _generate_features_from_ts(self, ts_data: np.array,
+                                   persistence_params: dict) -> InputData:
+        self._init_data_transformer(ts_data.shape[0], persistence_params)
 
         point_cloud = self.data_transformer.time_series_to_point_cloud(
             input_data=ts_data)
@@ -7,6 +7,7 @@ from fedot.core.operations.operation_parameters import OperationParameters
 from fedot.core.pipelines.pipeline_builder import PipelineBuilder
 from golem.core.tuning.simultaneous import SimultaneousTuner
 from pymonad.either import Either
+from scipy.optimize import linear_sum_assignment
 
 from fedot_ind.core.architecture.preprocessing.data_convertor import FedotConverter
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
@@ -24,6 +25,12 @@ class SSAForecasterImplementation(ModelImplementation):
     that reconstruct basis. Note that we use only few components to reconstruct basis. Other
     components considered as error (we just sample them).
 
+    In incremental mode (``incremental`` parameter) the decomposition and the tuned component models are
+    fitted once in ``fit``. Each ``predict`` on a continuation of the fitted series slides the kept singular
+    subspace by a rank-one update and downdate for every new point, so it describes the last
+    ``history_lookback`` points as on fit, and forecasts by the frozen component models. Thus rolling origin
+    forecasts need neither a full SVD nor tuning.
+
     Attributes:
         window_size_method: str, method for estimating window size for SSA forecaster
 
@@ -63,6 +70,7 @@ class SSAForecasterImplementation(ModelImplementation):
         self.tuning_params = params.get('tuning_params', tuning_params)
         self.component_model = params.get('component_model', 'topological')
         self.mode = params.get('mode', 'channel_independent')
+        self.incremental = params.get('incremental', False)
         self.component_model = component_mode_dict[self.component_model]
         self.trend_model = PipelineBuilder().add_node('lagged').add_node('ridge')
         self.trend_model = self.component_model
@@ -71,6 +79,10 @@ class SSAForecasterImplementation(ModelImplementation):
         self._window_size = None
         self.horizon = None
         self.preprocess_to_lagged = False
+        self._subspace = None
+        self._fit_length = None
+        self._series_length = None
+        self._last_window = None
 
     def _tune_component_model(self, model_to_tune, component):
         self.tuning_params['metric'] = FEDOT_TUNING_METRICS['regression']
@@ -101,6 +113,8 @@ class SSAForecasterImplementation(ModelImplementation):
         return current_dynamics
 
     def predict(self, input_data: InputData) -> OutputData:
+        if self.incremental and self._subspace is not None:
+            return self._predict_incremental(input_data)
         hankel_matrix = HankelMatrix(time_series=input_data.features,
                                      window_size=self._decomposer.window_size).trajectory_matrix
         U, s, VT = np.linalg.svd(hankel_matrix)
@@ -140,7 +154,112 @@ class SSAForecasterImplementation(ModelImplementation):
         return predict_data
 
     def fit(self, input_data: InputData):
-        pass
+        if self.incremental:
+            self._fit_incremental(input_data)
+
+    def _fit_incremental(self, input_data: InputData):
+        self.horizon = input_data.task.task_params.forecast_length
+        fit_data = deepcopy(input_data)
+        # predict_for_fit resets the lookback for short series, which are then used in full
+        fit_data.features = np.asarray(input_data.features).squeeze()[-(self.history_lookback or 0):]
+        self._decomposer = EigenBasisImplementation({'low_rank_approximation': self.low_rank_approximation,
+                                                     'rank_regularization': 'explained_dispersion'})
+        self.__predict_for_fit(fit_data)
+        self._fit_subspace(fit_data.features)
+        self._fit_length = fit_data.features.shape[0]
+        self._series_length = np.asarray(input_data.features).squeeze().shape[0]
+
+        n_components = max(2, len(self._rank_thr))
+        U, s, VT = self._subspace
+        current_dynamics = self._combine_trajectory(U, VT, n_components)
+        # component models are tuned once and only used for forecasting after fit
+        if self.mode == 'one_dimensional':
+            fit_data.features = self._reconstruct(current_dynamics, s, fit_data.features.shape[0])
+            fit_data.target, fit_data.idx = fit_data.features, np.arange(fit_data.features.shape[0])
+            _, self.model_by_channel = self._tune_component_model(self.trend_model.build(), fit_data)
+        else:
+            _, self.model_by_channel = self._predict_channel(fit_data, current_dynamics, self.horizon)
+
+    def _fit_subspace(self, series: np.ndarray):
+        hankel_matrix = HankelMatrix(time_series=series,
+                                     window_size=self._decomposer.window_size).trajectory_matrix
+        U, s, VT = np.linalg.svd(hankel_matrix, full_matrices=False)
+        # components combined by _combine_trajectory
+        rank = min(max(2, len(self._rank_thr) + 1), s.shape[0])
+        self._subspace = U[:, :rank], s[:rank], VT[:rank, :]
+        self._last_window = series[-U.shape[0]:]
+
+    def _update_subspace(self, column: np.ndarray):
+        """Slides the truncated SVD of the trajectory matrix by a new column. The column is added by Brand's
+        rank-one update and the oldest column is removed within the kept subspace, so the subspace describes
+        the same number of last points as on fit. Components are matched to the previous ones by their
+        directions, so every frozen component model gets its component even if singular values change order.
+        """
+        previous_U, s, VT = self._subspace
+        rank = VT.shape[0]
+        projection = previous_U.T @ column
+        residual = column - previous_U @ projection
+        residual_norm = np.linalg.norm(residual)
+        core = np.zeros((rank + 1, rank + 1))
+        core[:rank, :rank] = np.diag(s)
+        core[:rank, rank] = projection
+        core[rank, rank] = residual_norm
+        core_U, core_s, core_VT = np.linalg.svd(core)
+        direction = residual / residual_norm if residual_norm > 0 else residual
+        U = np.column_stack([previous_U, direction]) @ core_U[:, :rank]
+        VT = np.column_stack([core_VT[:rank, :rank] @ VT, core_VT[:rank, rank]])
+        # downdate by the oldest column
+        window_U, s, VT = np.linalg.svd(core_s[:rank, None] * VT[:, 1:], full_matrices=False)
+        U = U @ window_U
+        similarity = previous_U.T @ U
+        _, order = linear_sum_assignment(-np.abs(similarity))
+        signs = np.where(similarity[np.arange(rank), order] < 0, -1.0, 1.0)
+        self._subspace = U[:, order] * signs, s[order], VT[order] * signs[:, None]
+
+    def _reconstruct(self, dynamics: np.ndarray, s: np.ndarray, ts_length: int) -> np.ndarray:
+        # the last points of the series depend only on the last columns of the dynamics
+        n_columns = ts_length - self.PCT.shape[0] + 1
+        basis = reconstruct_basis(U=self.PCT,
+                                  Sigma=s[:self.PCT.shape[1]],
+                                  VT=dynamics[:, -n_columns:],
+                                  ts_length=ts_length)
+        return np.array(basis).sum(axis=1)
+
+    def _predict_incremental(self, input_data: InputData) -> OutputData:
+        series = np.asarray(input_data.features).squeeze()
+        window_length = self._subspace[0].shape[0]
+        is_continuation = series.shape[0] >= self._series_length and np.array_equal(
+            series[self._series_length - window_length:self._series_length], self._last_window)
+        if is_continuation:
+            for end in range(self._series_length + 1, series.shape[0] + 1):
+                self._update_subspace(series[end - window_length:end])
+            self._last_window = series[-window_length:]
+        else:
+            # the series is not a continuation of the fitted one, only its subspace is refitted
+            self._fit_subspace(series[-self._fit_length:])
+        self._series_length = series.shape[0]
+
+        U, s, VT = self._subspace
+        n_components = max(2, len(self._rank_thr))
+        current_dynamics = self._combine_trajectory(U, VT, n_components)
+        n_columns = self._fit_length - window_length + 1
+        comp = deepcopy(input_data)
+        if self.mode == 'one_dimensional':
+            comp.features = self._reconstruct(current_dynamics, s, min(self._fit_length, series.shape[0]))
+            comp.target, comp.idx = comp.features, np.arange(comp.features.shape[0])
+            prediction = self.model_by_channel.predict(comp).predict[-self.horizon:]
+        else:
+            forecast_by_channel = []
+            for index, ts_comp in enumerate(current_dynamics[:, -n_columns:]):
+                comp.features, comp.target, comp.idx = ts_comp, ts_comp, np.arange(ts_comp.shape[0])
+                forecast_by_channel.append(
+                    self.model_by_channel[f'{index}_channel'].predict(comp).predict[-self.horizon:])
+            forecasted_dynamics = np.concatenate([current_dynamics, np.vstack(forecast_by_channel)], axis=1)
+            prediction = self._reconstruct(forecasted_dynamics, s, window_length + self.horizon +
+                                           min(n_columns, current_dynamics.shape[1]) - 1)[-self.horizon:]
+        return FedotConverter(input_data).convert_to_output_data(prediction=prediction,
+                                                                 predict_data=input_data,
+                                                                 output_data_type=input_data.data_type)
 
     def __predict_for_fit(self, ts):
         basis = self._decomposer.transform(ts)
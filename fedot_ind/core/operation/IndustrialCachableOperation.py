@@ -1,4 +1,5 @@
 import os
+from functools import wraps
 from typing import Optional
 
 from fedot.core.data.data import InputData, OutputData
@@ -9,16 +10,35 @@ from fedot.core.repository.dataset_types import DataTypesEnum
 
 from fedot_ind.api.utils.path_lib import PROJECT_PATH
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
-from fedot_ind.core.operation.caching import DataCacher
+from fedot_ind.core.operation.caching import DEFAULT_CACHE_MAX_BYTES, DataCacher, state_digest
+
+
+def _resets_fitted_state(fit):
+    @wraps(fit)
+    def wrapper(self, *args, **kwargs):
+        result = fit(self, *args, **kwargs)
+        self._fitted_state_digest = None
+        return result
+
+    return wrapper
 
 
 class IndustrialCachableOperationImplementation(DataOperationImplementation):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # the digest of fitted state is computed once after every fit instead of on every transform
+        if 'fit' in cls.__dict__:
+            cls.fit = _resets_fitted_state(cls.__dict__['fit'])
+
     def __init__(self, params: Optional[OperationParameters] = None):
         super().__init__(params)
         cache_folder = os.path.join(PROJECT_PATH, 'cache')
         os.makedirs(cache_folder, exist_ok=True)
+        max_size_bytes = params.get('cache_max_bytes', DEFAULT_CACHE_MAX_BYTES) \
+            if params is not None else DEFAULT_CACHE_MAX_BYTES
         self.cacher = DataCacher(data_type_prefix='Features of basis',
-                                 cache_folder=cache_folder)
+                                 cache_folder=cache_folder,
+                                 max_size_bytes=max_size_bytes)
 
         self.data_type = DataTypesEnum.image
 
@@ -55,42 +75,62 @@ class IndustrialCachableOperationImplementation(DataOperationImplementation):
         predict = self.cacher.load_data_from_cache(hashed_info=hashed_info)
         return predict
 
-    def transform(self, input_data: InputData, use_cache: bool = False) -> OutputData:
+    def _get_operation_info(self) -> dict:
+        """Canonical description of the operation used as a part of the cache key. Parameters of simple types
+        are taken as they are, while fitted state (e.g. learned kernels of models) is taken by the digest of its
+        content, which is computed once per fit. Runtime objects and transformation results are skipped.
+
+        Returns:
+            dict of operation info or None if the fitted state can not be digested.
+        """
+        excluded_attributes = ['cacher', 'data_type', 'params', 'n_processes', 'parallel_backend', 'logging_params',
+                               'logger', 'relevant_features', 'predict', 'use_cache', '_fitted_state_digest']
+        simple_types = (int, float, str, bool, type(None), np.ndarray, np.generic)
+        operation_info = {'operation': self.__class__.__name__}
+        fitted_state = {}
+        for name, value in self.__dict__.items():
+            if name in excluded_attributes:
+                continue
+            if isinstance(value, simple_types):
+                operation_info[name] = value
+            else:
+                fitted_state[name] = value
+        if getattr(self, '_fitted_state_digest', None) is None:
+            self._fitted_state_digest = state_digest(fitted_state)
+        if self._fitted_state_digest is None:
+            return None
+        operation_info['fitted_state'] = self._fitted_state_digest
+        return operation_info
+
+    def transform(self, input_data: InputData, use_cache: bool = None) -> OutputData:
         """Method firstly tries to load result from cache. If unsuccessful, it starts to generate features
 
         Args:
             input_data: InputData - data to transform
-            use_cache: bool - whether to use cache or not
+            use_cache: bool - whether to use cache or not. If None, ``use_cache`` parameter of operation is used
 
         Returns:
             OutputData - transformed data
 
         """
-        if use_cache:
-            class_params = {k: v for k, v in self.__dict__.items() if k not in ['cacher',
-                                                                                'data_type',
-                                                                                'params',
-                                                                                'n_processes',
-                                                                                'logging_params',
-                                                                                'logger',
-                                                                                'relevant_features']}
-
-            hashed_info = self.cacher.hash_info(data=input_data.features,
-                                                operation_info=class_params.__repr__())
+        if use_cache is None:
+            use_cache = getattr(self, 'use_cache', False)
+        operation_info = self._get_operation_info() if use_cache else None
+        if operation_info is not None:
+            hashed_info = self.cacher.hash_info(data=input_data.features, **operation_info)
             try:
-                predict = self.try_load_from_cache(hashed_info)
+                transformed_features = self.try_load_from_cache(hashed_info)
             except FileNotFoundError:
-                predict = self._transform(input_data)
-                self.cacher.cache_data(hashed_info, predict)
-
-            predict = self._convert_to_output(
-                input_data, predict, data_type=self.data_type)
-            return predict
+                transformed_features = self._transform(input_data)
+                # only the array of features can be cached and loaded as a memory map
+                if isinstance(transformed_features, OutputData):
+                    transformed_features = transformed_features.predict
+                self.cacher.cache_data(hashed_info, transformed_features)
         else:
             transformed_features = self._transform(input_data)
-            predict = self._convert_to_fedot_datatype(
-                input_data, transformed_features)
-            return predict
+        predict = self._convert_to_fedot_datatype(
+            input_data, transformed_features)
+        return predict
 
     def _transform(self, input_data):
         pass
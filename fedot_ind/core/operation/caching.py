@@ -1,31 +1,97 @@
+import glob
 import hashlib
+import logging
 import os
+import pickle
+import tempfile
 import timeit
 
-from fedot_ind.core.architecture.settings.computational import backend_methods as np
 import pandas as pd
-import logging
 
 from fedot_ind.api.utils.path_lib import PROJECT_PATH
+from fedot_ind.core.architecture.settings.computational import backend_methods as np
+
+# default byte budget of the feature cache folder
+DEFAULT_CACHE_MAX_BYTES = 2 ** 32
+
+
+def state_digest(value):
+    """Computes a digest of the content of a fitted object, e.g. learned arrays, torch modules or sklearn
+    estimators, so objects with equal state have equal digests regardless of their identity.
+
+    Args:
+        value: object to digest.
+
+    Returns:
+        Hashed string or None if the object can not be represented by its content.
+    """
+    hasher = hashlib.blake2b(digest_size=10)
+    try:
+        _update_state_hash(hasher, value)
+    except Exception:
+        return None
+    return hasher.hexdigest()
+
+
+def _update_state_hash(hasher, value):
+    hasher.update(type(value).__name__.encode('utf8'))
+    if hasattr(value, 'state_dict'):
+        # parameters and buffers of torch modules
+        value = value.state_dict()
+    elif hasattr(value, 'detach'):
+        value = value.detach().cpu().numpy()
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        value = value.to_numpy()
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        hasher.update(f'{value.dtype.str}{value.shape}'.encode('utf8'))
+        hasher.update(np.ascontiguousarray(value).data)
+    elif isinstance(value, (list, tuple, np.ndarray)):
+        for item in value:
+            _update_state_hash(hasher, item)
+    elif isinstance(value, dict):
+        for key in sorted(value, key=repr):
+            hasher.update(repr(key).encode('utf8'))
+            _update_state_hash(hasher, value[key])
+    elif isinstance(value, (int, float, str, bool, type(None), np.generic)):
+        hasher.update(repr(value).encode('utf8'))
+    else:
+        hasher.update(pickle.dumps(value))
 
 
 class DataCacher:
-    """Class responsible for caching data of ``pd.DataFrame`` type in pickle format.
+    """Class responsible for caching arrays in ``.npy`` format.
+
+    Cache entries are addressed by a digest of the raw data buffer and the canonical representation of
+    the operation parameters. Entries are written atomically, so concurrent workers can share one cache
+    folder, and loaded as memory maps. When the total size of the entries exceeds ``max_size_bytes``, the
+    least recently used entries are evicted.
+
     Args:
         data_type_prefix: a string prefix related to the data to be cached. For example, if data is related to
         modelling results, then the prefix can be 'ModellingResults'. Default prefix is 'Data'.
         cache_folder: path to the folder where data is going to be cached.
+        max_size_bytes: byte budget of the cache folder. If None, the cache size is not limited.
+        mmap_mode: mode of memory mapping of loaded entries, see ``np.load``. Default ``'c'`` (copy-on-write)
+        gives writable arrays without copying the file content until it is modified.
+
     Examples:
         >>> your_data = pd.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]})
         >>> data_cacher = DataCacher(data_type_prefix='data', cache_folder='your_path')
-        >>> hashed_info = data_cacher.hash_info(dict(name='data', data=your_data))
+        >>> hashed_info = data_cacher.hash_info(data=your_data, name='data')
         >>> data_cacher.cache_data(hashed_info, your_data)
         >>> data_cacher.load_data_from_cache(hashed_info)
     """
 
-    def __init__(self, data_type_prefix: str = 'Data', cache_folder: str = None):
+    def __init__(self,
+                 data_type_prefix: str = 'Data',
+                 cache_folder: str = None,
+                 max_size_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+                 mmap_mode: str = 'c'):
         self.data_type = data_type_prefix
         self.cache_folder = self._init_cache_folder(cache_folder)
+        self.max_size_bytes = max_size_bytes
+        self.mmap_mode = mmap_mode
+        self.stats = {'hits': 0, 'misses': 0, 'bytes_read': 0, 'bytes_written': 0, 'evictions': 0}
 
         self.logger = logging.getLogger('DataCacher')
 
@@ -38,57 +104,117 @@ class DataCacher:
         os.makedirs(cache_folder, exist_ok=True)
         return cache_folder
 
+    @staticmethod
+    def _update_hash(hasher, value):
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            value = value.to_numpy()
+        if isinstance(value, np.ndarray) and value.dtype != object:
+            hasher.update(f'{value.dtype.str}{value.shape}'.encode('utf8'))
+            hasher.update(np.ascontiguousarray(value).data)
+        elif isinstance(value, np.ndarray):
+            hasher.update(pickle.dumps(value.tolist()))
+        else:
+            hasher.update(repr(value).encode('utf8'))
+
     def hash_info(self, data, **kwargs) -> str:
         """Method responsible for hashing distinct information about the data that is going to be cached.
-        It utilizes md5 hashing algorithm.
+        It utilizes blake2b hashing of the raw data buffer, so the whole array takes part in the key.
+
         Args:
+            data: array or dataframe to be cached.
             kwargs: a set of keyword arguments to be used as distinct info about data.
+
         Returns:
             Hashed string.
         """
-        # key = ''.join([repr(arg) for arg in kwargs.values()]).encode('utf8')
-        # key += data.__str__().encode('utf8')
-        # hsh = hashlib.md5(key).hexdigest()[:10]
-
-        key_info = ''.join([repr(arg)
-                            for arg in kwargs.values()]).encode('utf8')
-        key_data = data.__str__()
+        hasher = hashlib.blake2b(digest_size=10)
+        for name in sorted(kwargs):
+            hasher.update(name.encode('utf8'))
+            self._update_hash(hasher, kwargs[name])
+        self._update_hash(hasher, data)
+        return hasher.hexdigest()
 
-        key = key_info + key_data.encode('utf8')
-        hsh = hashlib.md5(key).hexdigest()[:20]
-
-        return hsh
+    def _entry_path(self, hashed_info: str) -> str:
+        return os.path.join(self.cache_folder, hashed_info + '.npy')
 
     def load_data_from_cache(self, hashed_info: str):
-        """Method responsible for loading cached data.
+        """Method responsible for loading cached data as a memory map.
+
         Args:
             hashed_info: hashed string of needed info about the data.
         """
         self.logger.info('Trying to load features from cache')
 
         start = timeit.default_timer()
-        file_path = os.path.join(self.cache_folder, hashed_info + '.npy')
+        file_path = self._entry_path(hashed_info)
         try:
-            data = np.load(file_path)
+            data = np.load(file_path, mmap_mode=self.mmap_mode)
+            # mark entry as recently used for LRU eviction
+            os.utime(file_path)
         except FileNotFoundError:
+            self.stats['misses'] += 1
             self.logger.info('Cache not found')
             raise FileNotFoundError(f'File {file_path} was not found')
+        self.stats['hits'] += 1
+        self.stats['bytes_read'] += data.nbytes
         elapsed_time = round(timeit.default_timer() - start, 5)
-        print(
-            f'{self.data_type} of {type(data)} type is loaded from cache in {elapsed_time} sec')
+        self.logger.info(f'{self.data_type} of {type(data)} type is loaded from cache in {elapsed_time} sec')
         return data
 
     def cache_data(self, hashed_info: str, data: pd.DataFrame):
-        """Method responsible for saving cached data. It utilizes pickle format for saving data.
+        """Method responsible for saving cached data. The entry is written to a temporary file first and then
+        atomically moved to its place, so readers never see partially written entries.
+
         Args:
             hashed_info: hashed string.
-            data: pd.DataFrame.
+            data: array or pd.DataFrame.
         """
         self.logger.info('Caching features')
-        cache_file = os.path.join(self.cache_folder, hashed_info)
+        if isinstance(data, (pd.DataFrame, pd.Series)):
+            data = data.to_numpy()
 
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.cache_folder, suffix='.tmp')
         try:
-            np.save(cache_file, data)
-
+            with os.fdopen(file_descriptor, 'wb') as temp_file:
+                np.save(temp_file, data)
+            os.replace(temp_path, self._entry_path(hashed_info))
         except Exception as ex:
-            print(f'Data was not cached due to error { ex }')
+            self.logger.warning(f'Data was not cached due to error {ex}')
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return
+        self.stats['bytes_written'] += os.path.getsize(self._entry_path(hashed_info))
+        self.evict()
+
+    def cache_size(self) -> int:
+        """Returns total size of cache entries in bytes.
+        """
+        return sum(size for _, size, _ in self._list_entries())
+
+    def _list_entries(self) -> list:
+        entries = []
+        for path in glob.glob(os.path.join(self.cache_folder, '*.npy')):
+            try:
+                entry_stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((path, entry_stat.st_size, entry_stat.st_mtime))
+        return entries
+
+    def evict(self):
+        """Removes least recently used entries until the cache fits into ``max_size_bytes``.
+        """
+        if self.max_size_bytes is None:
+            return
+        entries = self._list_entries()
+        total_size = sum(size for _, size, _ in entries)
+        for path, size, _ in sorted(entries, key=lambda entry: entry[2]):
+            if total_size <= self.max_size_bytes:
+                break
+            try:
+                os.remove(path)
+                self.stats['evictions'] += 1
+            except OSError:
+                # entry is already removed by another worker or is still mapped on Windows
+                pass
+            total_size -= size
@@ -45,12 +45,17 @@ class RSVDDecomposition:
                 Ut, block, tensor, rank) for rank in list_of_rank]
             fro_norms = [abs(np.linalg.norm(tensor - reconstr_m, 'fro') / np.linalg.norm(tensor) * 100)
                          for reconstr_m in reconstr_matrix]
-            regularized_rank = _detect_knee_point(
-                values=fro_norms, indices=list(range(len(fro_norms))))
-            regularized_rank = len(regularized_rank)
-            # deriviate_of_error = abs(np.diff(fro_norms))
-            # regularized_rank = len(
-            #     deriviate_of_error[deriviate_of_error > 1]) + 1
+            regularized_rank = self._rank_from_approximation_error(fro_norms)
+        return regularized_rank
+
+    @staticmethod
+    def _rank_from_approximation_error(fro_norms):
+        regularized_rank = _detect_knee_point(
+            values=fro_norms, indices=list(range(len(fro_norms))))
+        regularized_rank = len(regularized_rank)
+        # deriviate_of_error = abs(np.diff(fro_norms))
+        # regularized_rank = len(
+        #     deriviate_of_error[deriviate_of_error > 1]) + 1
         return regularized_rank
 
     def rsvd(self,
@@ -113,3 +118,78 @@ class RSVDDecomposition:
             U_, S_, V_ = np.linalg.svd(reconstr_tensor, full_matrices=False)
 
             return [U_, S_, V_]
+
+    def _batch_matrix_approx_regularization(self, low_ranks, projection, tensor):
+        """Chooses rank of approximation for every matrix of the stack. The error of the rank ``k``
+        approximation is taken from the norms of the rows of ``projection``, as the approximation is an
+        orthogonal projection of ``tensor`` on the first ``k`` basis vectors.
+        """
+        tensor_norm = np.sum(tensor ** 2, axis=(1, 2))
+        explained_norm = np.cumsum(np.sum(projection ** 2, axis=2), axis=1)
+        fro_norms = np.sqrt(np.clip(tensor_norm[:, None] - explained_norm, 0, None)) / \
+            np.sqrt(tensor_norm)[:, None] * 100
+        return np.array([low_rank if low_rank == 1 else self._rank_from_approximation_error(list(errors[:low_rank]))
+                         for low_rank, errors in zip(low_ranks, fro_norms)])
+
+    def rsvd_batch(self,
+                   tensor: np.array,
+                   approximation: bool = False,
+                   regularized_rank: int = None,
+                   reg_type: str = 'hard_thresholding') -> list:
+        """Batched version of ``rsvd`` for a stack of matrices of equal shape. Range finder, QR and SVD are
+        computed with stacked ``np.linalg`` operations, rank is thresholded for every matrix separately.
+
+        Args:
+            tensor: stack of matrices to decompose with shape ``(n_matrices, n_rows, n_columns)``
+            approximation: if True, the randomized matrix approximation will be computed
+            regularized_rank: rank of the matrix approximation. If None, it is chosen for every matrix
+            reg_type: type of regularization. 'hard_thresholding' or 'explained_dispersion'
+
+        Returns:
+            u, s, vt: stacked decompositions, padded with zeros up to the max rank of the stack
+
+        """
+        n_matrices = tensor.shape[0]
+        if not approximation:
+            Ut, St, Vt = np.linalg.svd(tensor, full_matrices=False)
+            if regularized_rank is None:
+                ranks = np.array([self._spectrum_regularization(spectrum, reg_type=reg_type) for spectrum in St])
+            else:
+                ranks = np.full(n_matrices, regularized_rank)
+            ranks = np.minimum(ranks, St.shape[1])
+            components = np.arange(St.shape[1]) < ranks[:, None]
+            max_rank = ranks.max()
+            return [(Ut * components[:, None, :])[:, :, :max_rank],
+                    (St * components)[:, :max_rank],
+                    (Vt * components[:, :, None])[:, :max_rank, :]]
+
+        projection_rank = math.ceil(min(tensor.shape[1:]) / 1.5)
+        self.poly_deg = 3
+        self.random_projection = np.random.randn(n_matrices, tensor.shape[2], projection_rank)
+        AAT = tensor @ np.swapaxes(tensor, 1, 2)
+        sampled_tensor = np.linalg.matrix_power(AAT, self.poly_deg) @ tensor @ self.random_projection
+        sampled_tensor_orto, _ = np.linalg.qr(sampled_tensor, mode='reduced')
+        M = np.swapaxes(sampled_tensor_orto, 1, 2) @ AAT @ sampled_tensor_orto
+        Ut, St, _ = np.linalg.svd(M, full_matrices=False)
+        # orthonormal basis of the approximation and projection of initial matrices on it
+        basis = sampled_tensor_orto @ Ut
+        projection = np.swapaxes(basis, 1, 2) @ tensor
+        if regularized_rank is None:
+            low_ranks = [self._spectrum_regularization(spectrum, reg_type=reg_type) for spectrum in St]
+            ranks = self._batch_matrix_approx_regularization(low_ranks, projection, tensor)
+        else:
+            ranks = np.full(n_matrices, regularized_rank)
+        ranks = np.minimum(ranks, projection_rank)
+
+        # svd of rank r approximation is obtained from the svd of its small r x n_columns projection
+        max_rank = ranks.max()
+        U_ = np.zeros((n_matrices, tensor.shape[1], max_rank))
+        S_ = np.zeros((n_matrices, max_rank))
+        V_ = np.zeros((n_matrices, max_rank, tensor.shape[2]))
+        for rank in np.unique(ranks):
+            samples = ranks == rank
+            u, s, v = np.linalg.svd(projection[samples, :rank], full_matrices=False)
+            U_[samples, :, :rank] = basis[samples, :, :rank] @ u
+            S_[samples, :rank] = s
+            V_[samples, :rank] = v
+        return [U_, S_, V_]
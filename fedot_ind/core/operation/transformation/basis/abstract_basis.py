@@ -1,16 +1,17 @@
+from itertools import chain
 from typing import Optional, Union
 
 import pandas as pd
 from fedot.core.data.data import InputData
 from fedot.core.operations.operation_parameters import OperationParameters
-from joblib import delayed, Parallel
 from pymonad.either import Either
 from pymonad.list import ListMonad
 
 from fedot_ind.core.architecture.preprocessing.data_convertor import DataConverter, NumpyConverter
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
+from fedot_ind.core.architecture.settings.parallel_backend import get_parallel_backend, resolve_n_jobs
 from fedot_ind.core.operation.IndustrialCachableOperation import IndustrialCachableOperationImplementation
-from fedot_ind.core.repository.constanst_repository import CPU_NUMBERS, MULTI_ARRAY
+from fedot_ind.core.repository.constanst_repository import MULTI_ARRAY
 
 
 class BasisDecompositionImplementation(IndustrialCachableOperationImplementation):
@@ -20,7 +21,7 @@ class BasisDecompositionImplementation(IndustrialCachableOperationImplementation
 
     def __init__(self, params: Optional[OperationParameters] = None):
         super().__init__(params)
-        self.n_processes = CPU_NUMBERS
+        self.n_processes = resolve_n_jobs(params.get('n_jobs', None))
         self.n_components = params.get('n_components', 2)
         self.basis = None
         self.data_type = MULTI_ARRAY
@@ -72,13 +73,14 @@ class BasisDecompositionImplementation(IndustrialCachableOperationImplementation
 
         """
         features = DataConverter(data=input_data).convert_to_monad_data()
-        parallel = Parallel(n_jobs=self.n_processes,
-                            verbose=0, pre_dispatch="2*n_jobs")
-        v = parallel(delayed(self._transform_one_sample)(sample)
-                     for sample in features)
+        backend = get_parallel_backend(n_jobs=self.n_processes)
+        v = list(chain.from_iterable(backend.map_chunks(self._transform_chunk, features)))
         predict = NumpyConverter(data=np.array(v)).convert_to_torch_format()
         return predict
 
+    def _transform_chunk(self, samples: np.array) -> list:
+        return [self._transform_one_sample(sample) for sample in samples]
+
     def _get_multidim_basis(self, input_data):
         def decompose(multidim_signal): return ListMonad(
             list(map(self._decompose_signal, multidim_signal)))
@@ -2,7 +2,6 @@ import tensorly as tl
 from fedot.core.data.data import InputData, OutputData
 from fedot.core.operations.operation_parameters import OperationParameters
 from fedot.core.repository.dataset_types import DataTypesEnum
-from joblib import delayed, Parallel
 from pymonad.either import Either
 from pymonad.list import ListMonad
 from tensorly.decomposition import parafac
@@ -13,8 +12,8 @@ from fedot_ind.core.architecture.settings.computational import backend_methods a
 from fedot_ind.core.operation.decomposition.matrix_decomposition.power_iteration_decomposition import RSVDDecomposition
 from fedot_ind.core.operation.transformation.basis.abstract_basis import BasisDecompositionImplementation
 from fedot_ind.core.operation.transformation.data.hankel import HankelMatrix
-from fedot_ind.core.operation.transformation.regularization.spectrum import reconstruct_basis, \
-    singular_value_hard_threshold
+from fedot_ind.core.operation.transformation.regularization.spectrum import diagonal_averaging, \
+    reconstruct_basis, singular_value_hard_threshold
 
 class_type = TypeVar("T", bound="DataDrivenBasis")
 
@@ -54,16 +53,12 @@ class EigenBasisImplementation(BasisDecompositionImplementation):
             self.logging_params.update({'SV_thr': self.SV_threshold})
 
         if len(number_of_dim) == 1:
-            predict = [self._transform_one_sample(
-                signal) for signal in features[:, 0, :]]
-            predict = [[np.array(v) if len(v) > 1 else v[0] for v in predict]]
+            predict = [[np.array(v) if len(v) > 1 else v[0]
+                        for v in self._transform_batch(features[:, 0, :])]]
         else:
             for dimension in number_of_dim:
-                parallel = Parallel(n_jobs=self.n_processes,
-                                    verbose=0, pre_dispatch="2*n_jobs")
-                v = parallel(delayed(self._transform_one_sample)(sample)
-                             for sample in features[:, dimension, :])
-                predict.append(np.array(v) if len(v) > 1 else v[0])
+                v = self._transform_batch(features[:, dimension, :])
+                predict.append(v if len(v) > 1 else v[0])
         return predict
 
     def _convert_basis_to_predict(self, basis, input_data):
@@ -158,19 +153,60 @@ class EigenBasisImplementation(BasisDecompositionImplementation):
 
         number_of_dim = list(range(data.shape[1]))
         if len(number_of_dim) == 1:
-            svd_numbers = [self._transform_one_sample(
-                signal, svd_flag=True) for signal in data[:, 0, :]]
+            svd_numbers = self._transform_batch(data[:, 0, :], svd_flag=True)
             if len(svd_numbers) == 0:
                 raise ValueError('Error in spectrum calculation')
         else:
             for dimension in number_of_dim:
-                dimension_rank = []
-                for signal in data[:, dimension, :]:
-                    dimension_rank.append(
-                        self._transform_one_sample(signal, svd_flag=True))
+                dimension_rank = self._transform_batch(data[:, dimension, :], svd_flag=True)
             svd_numbers.append(mode_func(dimension_rank))
         return mode_func(svd_numbers)
 
+    def _get_trajectory_matrices(self, series: np.array) -> np.array:
+        """Builds trajectory matrices of all series as one stack of shape ``(n_series, window, n_windows)``.
+        Matrices are the same as ``HankelMatrix(...).trajectory_matrix`` of every series.
+        """
+        trajectory_transformer = HankelMatrix(
+            time_series=series[0], window_size=self.window_size)
+        self.ts_length = trajectory_transformer.ts_length
+        n_windows = self.ts_length - trajectory_transformer.window_length
+        return np.lib.stride_tricks.sliding_window_view(series, n_windows, axis=1)
+
+    def _transform_batch(self, series: np.array, svd_flag: bool = False):
+        """Batched version of ``_transform_one_sample`` for all series of one channel.
+
+        Args:
+            series: array of shape ``(n_series, series_length)``
+            svd_flag: if True, estimated ranks of trajectory matrices are returned instead of basis
+
+        Returns:
+            list of ranks or array of basis with shape ``(n_series, SV_threshold, series_length)``
+
+        """
+        data = self._get_trajectory_matrices(series)
+        if svd_flag:
+            return self.estimate_singular_values_batch(data)
+        U, S, VT = self.svd_estimator.rsvd_batch(tensor=data,
+                                                 approximation=self.low_rank_approximation,
+                                                 regularized_rank=self.SV_threshold)
+        rank = min(self.SV_threshold, S.shape[1])
+        basis = diagonal_averaging(U[:, :, :rank], VT[:, :rank, :], S[:, :rank])
+        return np.swapaxes(basis, 2, 1)
+
+    def estimate_singular_values_batch(self, data) -> list:
+        reg_type = self.rank_regularization if hasattr(self, 'rank_regularization') else \
+            'hard_thresholding'
+        _, spectrums, _ = self.svd_estimator.rsvd_batch(tensor=data,
+                                                        approximation=self.low_rank_approximation,
+                                                        reg_type=reg_type)
+        ranks = []
+        for spectrum in spectrums:
+            spectrum = [s_val for s_val in spectrum if s_val > 0.001]
+            ranks.append(len(spectrum))
+            self.explained_dispersion.append(
+                [round(x / sum(spectrum) * 100) for x in spectrum])
+        return ranks
+
     def _transform_one_sample(self, series: np.array, svd_flag: bool = False):
         trajectory_transformer = HankelMatrix(
             time_series=series, window_size=self.window_size)
@@ -1,8 +1,17 @@
-from scipy.spatial.distance import pdist, squareform
+from scipy import sparse
+from scipy.spatial import cKDTree
+from scipy.spatial.distance import cdist, pdist, squareform
 
 from fedot_ind.core.architecture.preprocessing.data_convertor import DataConverter
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
 
+# number of pairwise similarities computed at once by the recurrence matrix builder
+SIMILARITY_BLOCK_SIZE = 2 ** 22
+# number of pairs of points used to choose the binarization threshold
+THRESHOLD_SAMPLE_SIZE = 2 ** 16
+# metrics for which recurrent pairs are found with a KD-tree and the corresponding Minkowski norms
+KDTREE_METRICS = {'euclidean': 2, 'cityblock': 1, 'chebyshev': np.inf}
+
 
 class TSTransformer:
     def __init__(self, time_series, rec_metric):
@@ -16,15 +25,113 @@ class TSTransformer:
         self.rec_metric = rec_metric
 
     def ts_to_recurrence_matrix(self,
-                                threshold=None):
-        distance_matrix = pdist(metric=self.rec_metric, X=self.time_series.T)
-        distance_matrix = np.ones(
-            shape=distance_matrix.shape[0]) - distance_matrix
-        distance_matrix = self.binarization(
-            distance_matrix, threshold=threshold)
-        self.recurrence_matrix = squareform(distance_matrix)
+                                threshold=None,
+                                output: str = 'dense'):
+        """Builds the recurrence matrix of the time series points (columns of the time series).
+
+        Only pairs of points whose similarity ``1 - distance`` reaches the threshold are kept, so the full
+        distance matrix is never allocated: similarities are computed by blocks of rows or, for Minkowski
+        metrics, recurrent pairs are queried from a KD-tree.
+
+        Args:
+            threshold: similarity threshold. If None, it is chosen by :meth:`select_threshold` on a sample
+                of pairwise similarities.
+            output: format of the recurrence matrix. ``'dense'`` for a boolean array, ``'packed'`` for rows
+                packed into bits with ``np.packbits`` and ``'sparse'`` for a ``scipy.sparse.csr_matrix``.
+
+        Returns:
+            recurrence matrix of shape ``(n_points, n_points)`` with zero main diagonal.
+        """
+        points = self.time_series.T
+        if threshold is None:
+            threshold = self.select_threshold(self._sample_similarities(points))
+
+        if self.rec_metric not in KDTREE_METRICS:
+            row_blocks = self._similarity_row_blocks(points, threshold)
+            self.recurrence_matrix = self._assemble_recurrence_matrix(row_blocks, len(points), output)
+        else:
+            self.recurrence_matrix = self._neighbour_recurrence_matrix(points, threshold)
+            if output != 'sparse':
+                row_blocks = self._sparse_row_blocks(self.recurrence_matrix)
+                self.recurrence_matrix = self._assemble_recurrence_matrix(row_blocks, len(points), output)
         return self.recurrence_matrix
 
+    def _block_rows(self, n_points):
+        return max(1, SIMILARITY_BLOCK_SIZE // max(n_points, 1))
+
+    def _similarity_row_blocks(self, points, threshold):
+        block_rows = self._block_rows(len(points))
+        for start in range(0, len(points), block_rows):
+            stop = min(start + block_rows, len(points))
+            similarity = 1 - cdist(points[start:stop], points, metric=self.rec_metric)
+            block = similarity >= threshold
+            block[np.arange(stop - start), np.arange(start, stop)] = False
+            yield block
+
+    def _neighbour_recurrence_matrix(self, points, threshold):
+        n_points = len(points)
+        radius = 1 - threshold
+        if radius < 0:
+            return sparse.csr_matrix((n_points, n_points), dtype=bool)
+        pairs = cKDTree(points).query_pairs(r=radius,
+                                            p=KDTREE_METRICS[self.rec_metric],
+                                            output_type='ndarray')
+        rows = np.concatenate([pairs[:, 0], pairs[:, 1]])
+        columns = np.concatenate([pairs[:, 1], pairs[:, 0]])
+        return sparse.csr_matrix((np.ones(len(rows), dtype=bool), (rows, columns)),
+                                 shape=(n_points, n_points))
+
+    def _sparse_row_blocks(self, recurrence_matrix):
+        block_rows = self._block_rows(recurrence_matrix.shape[0])
+        for start in range(0, recurrence_matrix.shape[0], block_rows):
+            yield recurrence_matrix[start:start + block_rows].toarray()
+
+    @staticmethod
+    def _assemble_recurrence_matrix(row_blocks, n_points, output):
+        if output == 'dense':
+            recurrence_matrix = np.empty((n_points, n_points), dtype=bool)
+            start = 0
+            for block in row_blocks:
+                recurrence_matrix[start:start + len(block)] = block
+                start += len(block)
+            return recurrence_matrix
+        elif output == 'packed':
+            return np.concatenate([np.packbits(block, axis=1) for block in row_blocks])
+        elif output == 'sparse':
+            return sparse.vstack([sparse.csr_matrix(block) for block in row_blocks], format='csr')
+        raise ValueError(f'Unknown recurrence matrix output {output}')
+
+    def _sample_similarities(self, points):
+        """Returns similarities of all pairs of points or, if there are more than ``THRESHOLD_SAMPLE_SIZE``
+        pairs, similarities of a fixed random sample of points to all other points.
+        """
+        n_points = len(points)
+        if n_points * (n_points - 1) // 2 <= THRESHOLD_SAMPLE_SIZE:
+            return 1 - pdist(points, metric=self.rec_metric)
+        sample_size = max(1, THRESHOLD_SAMPLE_SIZE // n_points)
+        sample = np.random.RandomState(0).choice(n_points, sample_size, replace=False)
+        similarities = 1 - cdist(points[sample], points, metric=self.rec_metric)
+        not_self = np.arange(n_points) != sample[:, None]
+        return similarities[not_self]
+
+    def select_threshold(self, similarities):
+        """Chooses the binarization threshold among ``threshold_baseline`` candidates. The last candidate
+        for which the share of non-recurrent pairs lies between ``min_signal_ratio`` and ``max_signal_ratio``
+        is chosen, otherwise the first candidate is used.
+
+        Args:
+            similarities: condensed array of pairwise similarities or a sample of them.
+
+        Returns:
+            similarity threshold.
+        """
+        threshold = self.threshold_baseline[0]
+        for threshold_baseline in self.threshold_baseline:
+            signal_ratio = np.count_nonzero(similarities < threshold_baseline) / similarities.shape[0]
+            if self.min_signal_ratio < signal_ratio < self.max_signal_ratio:
+                threshold = threshold_baseline
+        return threshold
+
     def ts_to_3d_recurrence_matrix(self):
         cosine_matrix = pdist(metric='cosine', X=self.time_series.T)
         euclidean_matrix = pdist(metric='euclidean', X=self.time_series.T)
@@ -46,36 +153,9 @@ class TSTransformer:
         return np.round(distance_matrix).astype('uint8')
 
     def binarization(self, distance_matrix, threshold):
-        best_threshold_flag = False
-        signal_ratio_list = []
-        recurrence_matrix = None
         if threshold is None:
-            for threshold_baseline in self.threshold_baseline:
-                threshold = threshold_baseline
-                tmp_array = np.copy(distance_matrix)
-                tmp_array[tmp_array < threshold_baseline] = 0.0
-                tmp_array[tmp_array >= threshold_baseline] = 1.0
-                signal_ratio = np.where(tmp_array == 0)[
-                    0].shape[0] / tmp_array.shape[0]
-
-                if self.min_signal_ratio < signal_ratio < self.max_signal_ratio:
-                    best_ratio = signal_ratio
-                    recurrence_matrix = tmp_array
-                    best_threshold_flag = True
-                    if signal_ratio > best_ratio:
-                        recurrence_matrix = tmp_array
-                else:
-                    signal_ratio_list.append(
-                        abs(self.max_signal_ratio - signal_ratio))
-
-                del tmp_array
-
-        if not best_threshold_flag:
-            distance_matrix[distance_matrix < self.threshold_baseline[0]] = 0.0
-            distance_matrix[distance_matrix >=
-                            self.threshold_baseline[0]] = 1.0
-            recurrence_matrix = distance_matrix
-        return recurrence_matrix
+            threshold = self.select_threshold(distance_matrix)
+        return (distance_matrix >= threshold).astype(float)
 
     def get_recurrence_metrics(self):
         if self.recurrence_matrix is None:
@@ -97,6 +97,61 @@ class TopologicalTransformation:
                                               strides=self.stride)
         return trajectory_transformer.trajectory_matrix
 
+    def time_series_to_point_clouds(self, time_series: np.ndarray, dimension_embed=2) -> np.ndarray:
+        """Converts a batch of time series of equal length into point clouds at once. Each point cloud is the same
+        as :meth:`time_series_to_point_cloud` returns for the series.
+
+        Args:
+            time_series: array of shape ``(n_series, length)``.
+            dimension_embed: window length used if it was not set on initialization.
+
+        Returns:
+            array of point clouds of shape ``(n_series, n_points, dimension)``.
+
+        """
+        if self.__window_length is None:
+            self.__window_length = dimension_embed
+        # window length of the first series is valid for all series of the same length
+        window_length = HankelMatrix(time_series=time_series[0],
+                                     window_size=self.__window_length,
+                                     strides=self.stride).window_length
+        if self.stride > 1:
+            windows = np.lib.stride_tricks.sliding_window_view(time_series, window_length, axis=1)
+            return windows[:, ::self.stride].transpose(0, 2, 1)
+        return np.lib.stride_tricks.sliding_window_view(time_series, time_series.shape[1] - window_length, axis=1)
+
+    @staticmethod
+    def select_landmarks(point_clouds: np.ndarray, n_landmarks: int = None) -> np.ndarray:
+        """Selects landmark points of each point cloud by max-min (farthest point) sampling, starting from the
+        first point. Persistence of landmarks approximates persistence of the whole cloud, while its cost does not
+        depend on the number of points.
+
+        Args:
+            point_clouds: array of point clouds of shape ``(n_clouds, n_points, dimension)``.
+            n_landmarks: number of landmarks, all points are kept if None or not less than ``n_points``.
+
+        Returns:
+            array of landmarks of shape ``(n_clouds, n_landmarks, dimension)`` in the original order of points.
+
+        """
+        n_clouds, n_points = point_clouds.shape[:2]
+        if n_landmarks is None or n_landmarks >= n_points:
+            return point_clouds
+        clouds_range = np.arange(n_clouds)
+        landmarks = np.zeros((n_clouds, n_landmarks), dtype=int)
+        squared_norms = np.einsum('npd,npd->np', point_clouds, point_clouds)
+
+        def squared_distances_to(points: np.ndarray) -> np.ndarray:
+            # distances from every point of each cloud to the given point of the cloud
+            return squared_norms - 2 * np.einsum('npd,nd->np', point_clouds, points) + \
+                np.einsum('nd,nd->n', points, points)[:, None]
+
+        distances = squared_distances_to(point_clouds[:, 0])
+        for index in range(1, n_landmarks):
+            landmarks[:, index] = np.argmax(distances, axis=1)
+            distances = np.minimum(distances, squared_distances_to(point_clouds[clouds_range, landmarks[:, index]]))
+        return point_clouds[clouds_range[:, None], np.sort(landmarks, axis=1)]
+
     def point_cloud_to_persistent_cohomology_ripser(self,
                                                     point_cloud: np.array = None,
                                                     max_simplex_dim: int = 1):
@@ -1,3 +1,5 @@
+import math
+
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
 from fedot_ind.core.repository.constanst_repository import SINGULAR_VALUE_BETA_THR, SINGULAR_VALUE_MEDIAN_THR
 
@@ -59,6 +61,33 @@ def singular_value_hard_threshold(singular_values,
         return singular_values[:adjusted_rank]
 
 
+def diagonal_averaging(U, VT, Sigma=None):
+    """Diagonal averaging (hankelization) of rank-one components ``Sigma[i] * outer(U[:, i], VT[i, :])``.
+    Anti-diagonal sums of an outer product are the full convolution of its vectors, so components are computed
+    with FFT without materializing the outer products. Leading axes of the arguments are treated as a batch.
+
+    Args:
+        U: left singular vectors with shape ``(..., L, rank)``
+        VT: right singular vectors with shape ``(..., rank, K)``
+        Sigma: singular values with shape ``(..., rank)``. If None, components are not scaled
+
+    Returns:
+        component series with shape ``(..., L + K - 1, rank)``
+
+    """
+    left = np.swapaxes(U, -1, -2)
+    if Sigma is not None:
+        left = left * Sigma[..., None]
+    window_length, n_windows = left.shape[-1], VT.shape[-1]
+    ts_length = window_length + n_windows - 1
+    n_fft = 2 ** math.ceil(math.log2(ts_length))
+    anti_diagonal_sums = np.fft.irfft(np.fft.rfft(left, n_fft) * np.fft.rfft(VT, n_fft), n_fft)[..., :ts_length]
+    position = np.arange(ts_length)
+    anti_diagonal_length = np.minimum.reduce([position + 1, ts_length - position,
+                                              np.full(ts_length, min(window_length, n_windows))])
+    return np.swapaxes(anti_diagonal_sums / anti_diagonal_length, -1, -2)
+
+
 def reconstruct_basis(U, Sigma, VT, ts_length):
     if len(Sigma.shape) > 1:
         def multi_reconstruction(x):
@@ -68,10 +97,5 @@ def reconstruct_basis(U, Sigma, VT, ts_length):
     else:
         rank = Sigma.shape[0]
         TS_comps = np.zeros((ts_length, rank))
-        for i in range(rank):
-            X_elem = Sigma[i] * np.outer(U[:, i], VT[i, :])
-            X_rev = X_elem[::-1]
-            eigenvector = [X_rev.diagonal(
-                j).mean() for j in range(-X_rev.shape[0] + 1, X_rev.shape[1])]
-            TS_comps[:, i] = eigenvector
+        TS_comps[:] = diagonal_averaging(U[:, :rank], VT[:rank, :], Sigma)
     return TS_comps
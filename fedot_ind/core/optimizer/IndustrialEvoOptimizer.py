@@ -28,5 +28,6 @@ class IndustrialEvoOptimizer(EvoGraphOptimizer):
         self.operators.remove(self.crossover)
         self.eval_dispatcher = IndustrialDispatcher(adapter=graph_generation_params.adapter,
                                                     n_jobs=requirements.n_jobs,
+                                                    individual_timeout=requirements.max_graph_fit_time,
                                                     graph_cleanup_fn=_try_unfit_graph,
                                                     delegate_evaluator=graph_generation_params.remote_evaluator)
@@ -1,13 +1,24 @@
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+
 from golem.core.optimisers.genetic.evaluation import MultiprocessingDispatcher
 
-from fedot_ind.core.architecture.abstraction.decorators import DaskServer
+from fedot_ind.core.architecture.settings.parallel_backend import get_worker_pool, sequential_execution, \
+    SHARED_MEMORY_FOLDER
+from fedot_ind.core.repository.constanst_repository import NEURAL_OPERATION_EVALUATION_COST, \
+    OPERATION_EVALUATION_COST
 from fedot_ind.core.repository.initializer_industrial_models import IndustrialModels
+from fedot_ind.core.repository.model_repository import NEURAL_MODEL
 
 import logging
 import pathlib
 import timeit
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional, Tuple
+from golem.core.adapter import BaseOptimizationAdapter
 from golem.core.log import Log
 from golem.core.optimisers.genetic.operators.operator import EvaluationOperator, PopulationT
 from golem.core.optimisers.graph import OptGraph
@@ -16,10 +27,61 @@ from golem.core.optimisers.opt_history_objects.individual import GraphEvalResult
 from golem.core.optimisers.timer import Timer
 from golem.utilities.memory import MemoryAnalytics
 from golem.utilities.utilities import determine_n_jobs
-from joblib import wrap_non_picklable_objects, Parallel, delayed, parallel_backend
+from joblib.externals.loky import get_reusable_executor
+
+# period of checking evaluation timeouts in seconds
+EVALUATION_POLL_INTERVAL = 0.5
+
+
+def _report_start(start_marker: str):
+    # the marker is written atomically, so a partially written time is never read
+    with open(start_marker + '.tmp', 'w') as marker_file:
+        marker_file.write(repr(time.time()))
+    os.replace(start_marker + '.tmp', start_marker)
+
+
+def _reported_start(start_marker: str) -> Optional[float]:
+    try:
+        with open(start_marker) as marker_file:
+            return float(marker_file.read())
+    except FileNotFoundError:
+        return None
+
+
+def estimate_evaluation_cost(graph: OptGraph) -> float:
+    """Estimates relative cost of evaluation of the graph by costs of its operations."""
+    cost = 0
+    for node in graph.nodes:
+        operation = str(node.name)
+        if operation in NEURAL_MODEL:
+            cost += NEURAL_OPERATION_EVALUATION_COST
+        else:
+            cost += OPERATION_EVALUATION_COST.get(operation, 1)
+    return cost
 
 
 class IndustrialDispatcher(MultiprocessingDispatcher):
+    """Evaluates population of pipelines concurrently in a reusable pool of worker processes.
+
+    Individuals are submitted in order of decreasing estimated cost, so pipelines with neural and other heavy
+    operations start first. Workers of the active :class:`WorkerPool` are used if there is one. An evaluation
+    which runs longer than ``individual_timeout`` since its worker started it is dropped and the workers are
+    restarted to stop it. If no individual was evaluated successfully, individuals are evaluated
+    once again sequentially without time limits until the first success.
+
+    Args:
+        adapter: adapter for graphs.
+        n_jobs: number of workers or 1 for evaluation in the main process.
+        individual_timeout: time limit for evaluation of one individual. Not enforced if ``n_jobs`` is 1.
+    """
+
+    def __init__(self,
+                 adapter: BaseOptimizationAdapter,
+                 n_jobs: int = 1,
+                 individual_timeout: Optional[timedelta] = None,
+                 **kwargs):
+        super().__init__(adapter, n_jobs, **kwargs)
+        self.individual_timeout = individual_timeout.total_seconds() if individual_timeout else None
 
     def dispatch(self, objective: ObjectiveFunction, timer: Optional[Timer] = None) -> EvaluationOperator:
         """Return handler to this object that hides all details
@@ -30,55 +92,100 @@ class IndustrialDispatcher(MultiprocessingDispatcher):
     def evaluate_population(self, individuals: PopulationT) -> PopulationT:
         individuals_to_evaluate, individuals_to_skip = self.split_individuals_to_evaluate(
             individuals)
+        individuals_to_evaluate = sorted(individuals_to_evaluate,
+                                         key=lambda ind: estimate_evaluation_cost(ind.graph), reverse=True)
 
-        # Evaluate individuals without valid fitness in parallel.
         n_jobs = determine_n_jobs(self._n_jobs, self.logger)
-        parallel = Parallel(n_jobs=n_jobs, verbose=0,
-                            pre_dispatch='2 * n_jobs')
-
-        with parallel_backend(backend='dask',
-                              n_jobs=n_jobs
-                              # ,scatter=[individuals_to_evaluate]
-                              ):
-            evaluation_results = []
-            for ind in individuals_to_evaluate:
-                y = self.industrial_evaluate_single(self, graph=ind.graph, uid_of_individual=ind.uid,
-                                                    logs_initializer=Log().get_parameters())
-                evaluation_results.append(y)
-            individuals_evaluated = self.apply_evaluation_results(
-                individuals_to_evaluate, evaluation_results)
-            # If there were no successful evals then try once again getting at least one,
-            # even if time limit was reached
-            successful_evals = individuals_evaluated + individuals_to_skip
-            self.population_evaluation_info(evaluated_pop_size=len(successful_evals),
-                                            pop_size=len(individuals))
-            if not successful_evals:
-                for single_ind in individuals:
-                    try:
-                        evaluation_result = self.industrial_evaluate_single(self, graph=ind.graph,
-                                                                            uid_of_individual=ind.uid,
-                                                                            with_time_limit=False)
-                        successful_evals = self.apply_evaluation_results(
-                            [single_ind], [evaluation_result])
-                        if successful_evals:
-                            break
-                    except Exception:
-                        _ = 1
-            MemoryAnalytics.log(self.logger,
-                                additional_info='parallel evaluation of population',
-                                logging_level=logging.INFO)
+        if n_jobs == 1 or len(individuals_to_evaluate) < 2:
+            evaluation_results = [self._safe_evaluate_single(ind) for ind in individuals_to_evaluate]
+        else:
+            evaluation_results = self._evaluate_in_workers(individuals_to_evaluate, n_jobs)
+        individuals_evaluated = self.apply_evaluation_results(
+            individuals_to_evaluate, evaluation_results)
+        # If there were no successful evals then try once again getting at least one,
+        # even if time limit was reached
+        successful_evals = individuals_evaluated + individuals_to_skip
+        self.population_evaluation_info(evaluated_pop_size=len(successful_evals),
+                                        pop_size=len(individuals))
+        if not successful_evals:
+            for single_ind in individuals:
+                evaluation_result = self._safe_evaluate_single(single_ind, with_time_limit=False)
+                successful_evals = self.apply_evaluation_results(
+                    [single_ind], [evaluation_result])
+                if successful_evals:
+                    break
+        MemoryAnalytics.log(self.logger,
+                            additional_info='parallel evaluation of population',
+                            logging_level=logging.INFO)
         return successful_evals
 
-    # @delayed
-    @wrap_non_picklable_objects
+    def _safe_evaluate_single(self, individual, with_time_limit: bool = True) -> Optional[GraphEvalResult]:
+        try:
+            return self.industrial_evaluate_single(graph=individual.graph,
+                                                   uid_of_individual=individual.uid,
+                                                   with_time_limit=with_time_limit)
+        except Exception as ex:
+            self.logger.warning(f'Evaluation of individual {individual.uid} failed: {ex}')
+            return None
+
+    def _evaluate_in_workers(self, individuals: PopulationT, n_jobs: int) -> list:
+        worker_pool = get_worker_pool()
+        executor = worker_pool.executor if worker_pool is not None else get_reusable_executor(max_workers=n_jobs)
+        logs_initializer = Log().get_parameters()
+        # workers report when they start evaluations, since tasks may wait in the call queue of the pool
+        markers_folder = tempfile.mkdtemp(dir=SHARED_MEMORY_FOLDER)
+        futures = {executor.submit(self.industrial_evaluate_single,
+                                   graph=ind.graph,
+                                   uid_of_individual=ind.uid,
+                                   logs_initializer=logs_initializer,
+                                   in_worker=True,
+                                   start_marker=os.path.join(markers_folder, str(index))): ind
+                   for index, ind in enumerate(individuals)}
+        start_markers = {future: os.path.join(markers_folder, str(index)) for index, future in enumerate(futures)}
+
+        evaluation_results = []
+        pending = set(futures)
+        timed_out = False
+        try:
+            while pending:
+                done, pending = wait(pending, timeout=EVALUATION_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        evaluation_results.append(future.result())
+                    except Exception as ex:
+                        self.logger.warning(f'Evaluation of individual {futures[future].uid} failed: {ex}')
+                if self.individual_timeout is None:
+                    continue
+                for future in list(pending):
+                    start_time = _reported_start(start_markers[future])
+                    if start_time is not None and time.time() - start_time > self.individual_timeout:
+                        self.logger.warning(f'Evaluation of individual {futures[future].uid} '
+                                            f'exceeded {self.individual_timeout} sec and was dropped')
+                        pending.discard(future)
+                        timed_out = True
+        finally:
+            shutil.rmtree(markers_folder, ignore_errors=True)
+        if timed_out:
+            # the only way to stop evaluations running in workers
+            if worker_pool is not None:
+                worker_pool.restart()
+            else:
+                # the reusable pool is recreated on the next call
+                executor.shutdown(wait=False, kill_workers=True)
+        return evaluation_results
+
     def industrial_evaluate_single(self,
                                    graph: OptGraph,
                                    uid_of_individual: str,
                                    with_time_limit: bool = True,
                                    cache_key: Optional[str] = None,
-                                   logs_initializer: Optional[Tuple[int, pathlib.Path]] = None) -> GraphEvalResult:
-        if self._n_jobs != 1:
-            OperationTypesRepository = IndustrialModels().setup_repository()
+                                   logs_initializer: Optional[Tuple[int, pathlib.Path]] = None,
+                                   in_worker: bool = False,
+                                   start_marker: Optional[str] = None) -> GraphEvalResult:
+        if start_marker is not None:
+            _report_start(start_marker)
+        if in_worker:
+            IndustrialModels().setup_repository()
 
         graph = self.evaluation_cache.get(cache_key, graph)
 
@@ -90,7 +197,12 @@ class IndustrialDispatcher(MultiprocessingDispatcher):
 
         adapted_evaluate = self._adapter.adapt_func(self._evaluate_graph)
         start_time = timeit.default_timer()
-        fitness, graph = adapted_evaluate(graph)
+        # workers are already run in parallel, so operations inside them are evaluated sequentially
+        if in_worker:
+            with sequential_execution():
+                fitness, graph = adapted_evaluate(graph)
+        else:
+            fitness, graph = adapted_evaluate(graph)
         end_time = timeit.default_timer()
         eval_time_iso = datetime.now().isoformat()
 
@@ -10,6 +10,7 @@ from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.repository.metrics_repository import ClassificationMetricsEnum, RegressionMetricsEnum
 from fedot.core.repository.tasks import Task, TaskTypesEnum, TsForecastingParams
 from golem.core.tuning.optuna_tuner import OptunaTuner
+from sklearn.kernel_approximation import Nystroem, RBFSampler
 from scipy.spatial.distance import euclidean, cosine, cityblock, correlation, chebyshev, \
     minkowski
 from torch import nn
@@ -18,6 +19,7 @@ from fedot_ind.core.metrics.metrics_implementation import calculate_classificati
     calculate_forecasting_metric
 from fedot_ind.core.models.nn.network_modules.losses import CenterLoss, CenterPlusLoss, ExpWeightedLoss, FocalLoss, \
     HuberLoss, LogCoshLoss, MaskedLossWrapper, RMSELoss, SMAPELoss, TweedieLoss
+from fedot_ind.core.models.quantile import batch_stat_features
 from fedot_ind.core.models.quantile.stat_features import autocorrelation, ben_corr, crest_factor, energy, \
     hjorth_complexity, hjorth_mobility, hurst_exponent, interquartile_range, kurtosis, mean_ema, mean_moving_median, \
     mean_ptp_distance, n_peaks, pfd, ptp_amp, q25, q5, q75, q95, shannon_entropy, skewness, slope, zero_crossing_rate
@@ -46,6 +48,19 @@ class ComputationalConstant(Enum):
     FEDOT_WORKER_NUM = 5
     FEDOT_WORKER_TIMEOUT_PARTITION = 4
     PATIENCE_FOR_EARLY_STOP = 15
+    # relative costs of operations used to schedule evaluation of pipelines, other operations cost 1
+    OPERATION_EVALUATION_COST = {'topological_extractor': 5,
+                                 'minirocket_extractor': 4,
+                                 'recurrence_extractor': 3,
+                                 'riemann_extractor': 2,
+                                 'eigen_basis': 2}
+    NEURAL_OPERATION_EVALUATION_COST = 10
+    # bounds of batch size of neural models chosen by available memory
+    NN_AUTO_BATCH_SIZE_BOUNDS = (16, 512)
+    # share of available memory given to a training batch
+    NN_BATCH_MEMORY_SHARE = 0.1
+    # approximate ratio of memory of activations and gradients to memory of input samples
+    NN_ACTIVATION_MEMORY_RATIO = 64
 
 
 class KernelsConstant(Enum):
@@ -56,6 +71,12 @@ class KernelsConstant(Enum):
         'one_step_cka': CKA,
         'one_step_pwmk': PWMK,
     }
+    KERNEL_APPROXIMATION = {
+        'nystroem': Nystroem,
+        'random_features': RBFSampler
+    }
+    # number of columns of low-rank factors of approximated kernels
+    KERNEL_APPROXIMATION_RANK = 100
     KERNEL_BASELINE_FEATURE_GENERATORS = {
         # 'minirocket_extractor': PipelineBuilder().add_node('minirocket_extractor'),
         'quantile_extractor': PipelineBuilder().add_node('quantile_extractor'),
@@ -114,6 +135,40 @@ class FeatureConstant(Enum):
         'petrosian_fractal_dimension_': pfd
     }
 
+    BATCH_STAT_METHODS = {
+        'mean_': batch_stat_features.mean,
+        'median_': batch_stat_features.median,
+        'std_': batch_stat_features.std,
+        'max_': batch_stat_features.maximum,
+        'min_': batch_stat_features.minimum,
+        'q5_': batch_stat_features.q5,
+        'q25_': batch_stat_features.q25,
+        'q75_': batch_stat_features.q75,
+        'q95_': batch_stat_features.q95
+    }
+
+    BATCH_STAT_METHODS_GLOBAL = {
+        'skewness_': batch_stat_features.skewness,
+        'kurtosis_': batch_stat_features.kurtosis,
+        'n_peaks_': batch_stat_features.n_peaks,
+        'slope_': batch_stat_features.slope,
+        'ben_corr_': batch_stat_features.ben_corr,
+        'interquartile_range_': batch_stat_features.interquartile_range,
+        'energy_': batch_stat_features.energy,
+        'cross_rate_': batch_stat_features.zero_crossing_rate,
+        'autocorrelation_': batch_stat_features.autocorrelation,
+        'shannon_entropy_': batch_stat_features.shannon_entropy,
+        'ptp_amplitude_': batch_stat_features.ptp_amp,
+        'mean_ptp_distance_': batch_stat_features.mean_ptp_distance,
+        'crest_factor_': batch_stat_features.crest_factor,
+        'mean_ema_': batch_stat_features.mean_ema,
+        'mean_moving_median_': batch_stat_features.mean_moving_median,
+        'hjorth_mobility_': batch_stat_features.hjorth_mobility,
+        'hjorth_complexity_': batch_stat_features.hjorth_complexity,
+        'hurst_exponent_': batch_stat_features.hurst_exponent,
+        'petrosian_fractal_dimension_': batch_stat_features.pfd
+    }
+
     METRICS_DICT = {'euclidean': euclidean,
                     'cosine': cosine,
                     'cityblock': cityblock,
@@ -611,6 +666,8 @@ class BenchmarkDatasets(Enum):
 
 STAT_METHODS = FeatureConstant.STAT_METHODS.value
 STAT_METHODS_GLOBAL = FeatureConstant.STAT_METHODS_GLOBAL.value
+BATCH_STAT_METHODS = FeatureConstant.BATCH_STAT_METHODS.value
+BATCH_STAT_METHODS_GLOBAL = FeatureConstant.BATCH_STAT_METHODS_GLOBAL.value
 PERSISTENCE_DIAGRAM_FEATURES = FeatureConstant.PERSISTENCE_DIAGRAM_FEATURES.value
 PERSISTENCE_DIAGRAM_EXTRACTOR = FeatureConstant.PERSISTENCE_DIAGRAM_EXTRACTOR.value
 DISCRETE_WAVELETS = FeatureConstant.DISCRETE_WAVELETS.value
@@ -621,6 +678,8 @@ SINGULAR_VALUE_BETA_THR = FeatureConstant.SINGULAR_VALUE_BETA_THR
 DISTANCE_METRICS = FeatureConstant.METRICS_DICT.value
 
 KERNEL_ALGO = KernelsConstant.KERNEL_ALGO.value
+KERNEL_APPROXIMATION = KernelsConstant.KERNEL_APPROXIMATION.value
+KERNEL_APPROXIMATION_RANK = KernelsConstant.KERNEL_APPROXIMATION_RANK.value
 KERNEL_BASELINE_FEATURE_GENERATORS = KernelsConstant.KERNEL_BASELINE_FEATURE_GENERATORS.value
 KERNEL_BASELINE_NODE_LIST = KernelsConstant.KERNEL_BASELINE_NODE_LIST.value
 
@@ -640,10 +699,15 @@ FEDOT_TUNER_STRATEGY = FedotOperationConstant.FEDOT_TUNER_STRATEGY.value
 FEDOT_TS_FORECASTING_ASSUMPTIONS = FedotOperationConstant.FEDOT_TS_FORECASTING_ASSUMPTIONS.value
 
 CPU_NUMBERS = ComputationalConstant.CPU_NUMBERS.value
+OPERATION_EVALUATION_COST = ComputationalConstant.OPERATION_EVALUATION_COST.value
+NEURAL_OPERATION_EVALUATION_COST = ComputationalConstant.NEURAL_OPERATION_EVALUATION_COST.value
 BATCH_SIZE_FOR_FEDOT_WORKER = ComputationalConstant.BATCH_SIZE_FOR_FEDOT_WORKER.value
 FEDOT_WORKER_NUM = ComputationalConstant.FEDOT_WORKER_NUM.value
 FEDOT_WORKER_TIMEOUT_PARTITION = ComputationalConstant.FEDOT_WORKER_TIMEOUT_PARTITION.value
 PATIENCE_FOR_EARLY_STOP = ComputationalConstant.PATIENCE_FOR_EARLY_STOP.value
+NN_AUTO_BATCH_SIZE_BOUNDS = ComputationalConstant.NN_AUTO_BATCH_SIZE_BOUNDS.value
+NN_BATCH_MEMORY_SHARE = ComputationalConstant.NN_BATCH_MEMORY_SHARE.value
+NN_ACTIVATION_MEMORY_RATIO = ComputationalConstant.NN_ACTIVATION_MEMORY_RATIO.value
 
 MULTI_ARRAY = DataTypeConstant.MULTI_ARRAY.value
 MATRIX = DataTypeConstant.MATRIX.value
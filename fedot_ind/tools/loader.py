@@ -1,3 +1,5 @@
+import glob
+import json
 import logging
 import os
 import shutil
@@ -19,11 +21,21 @@ from fedot_ind.api.utils.path_lib import PROJECT_PATH
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
 from fedot_ind.core.repository.constanst_repository import M4_PREFIX
 
+# number of series in batches yielded by the streaming reader of .ts files
+TS_BATCH_SIZE = 1024
+# folder inside the dataset folder with binary copies of parsed data
+BINARY_CACHE_FOLDER = 'binary_cache'
+BINARY_CACHE_VERSION = 2
+
 
 class DataLoader:
     """Class for reading data files and downloading from UCR archive if not found locally.
     At the moment supports ``.ts``, ``.txt``, ``.tsv``, and ``.arff`` formats.
 
+    Parsed data is saved once to the binary cache in the dataset folder as ``.npy`` arrays with metadata, later
+    loads open the arrays as memory maps without parsing text files. The cache is rebuilt when the data files
+    change.
+
     Args:
         dataset_name: name of dataset
         folder: path to folder with data
@@ -72,11 +84,21 @@ class DataLoader:
         data_path = os.path.join(
             PROJECT_PATH, 'fedot_ind', 'data') if self.folder is None else self.folder
 
+        cached_data = self.load_from_binary_cache(data_path)
+        if cached_data is not None:
+            self.logger.info('Data read successfully from binary cache')
+            train_data, test_data = cached_data
+            if shuffle:
+                train_data = shuffle_samples(*train_data)
+            return train_data, test_data
+
         _, train_data, test_data = self.read_train_test_files(dataset_name=dataset_name,
                                                               data_path=data_path,
-                                                              shuffle=shuffle)
+                                                              shuffle=False)
+        is_downloaded = train_data is None
+        source_path = data_path
 
-        if train_data is None:
+        if is_downloaded:
             self.logger.info('Downloading...')
 
             # Create temporary folder for downloaded data
@@ -99,6 +121,8 @@ class DataLoader:
             self.logger.info(f'{dataset_name} data downloaded. Unpacking...')
             train_data, test_data = self.extract_data(
                 dataset_name, temp_data_path)
+            # extracted files are saved to the default data folder, the cache is validated by them
+            source_path = os.path.join(PROJECT_PATH, 'fedot_ind', 'data')
 
             shutil.rmtree(cache_path)
 
@@ -107,7 +131,7 @@ class DataLoader:
             # return train_data, test_data
         self.logger.info('Data read successfully from local folder')
 
-        if isinstance(train_data[0].iloc[0, 0], pd.Series):
+        if isinstance(train_data[0], pd.DataFrame) and isinstance(train_data[0].iloc[0, 0], pd.Series):
             def convert(arr):
                 """Transform pd.Series values to np.ndarray"""
                 return np.array([d.values for d in arr])
@@ -117,8 +141,84 @@ class DataLoader:
             test_data = (np.apply_along_axis(
                 convert, 1, test_data[0]), test_data[1])
 
+        self.save_to_binary_cache(data_path, train_data, test_data, source_path)
+        # downloaded data is already shuffled on extraction
+        if shuffle and not is_downloaded:
+            train_data = shuffle_samples(*train_data)
         return train_data, test_data
 
+    def _source_files_signature(self, data_path: str) -> list:
+        dataset_path = os.path.join(data_path, self.dataset_name)
+        signature = []
+        for subset in ('TRAIN', 'TEST'):
+            for file_path in sorted(glob.glob(os.path.join(dataset_path, f'{self.dataset_name}_{subset}.*'))):
+                file_stat = os.stat(file_path)
+                signature.append([os.path.basename(file_path), file_stat.st_size, file_stat.st_mtime_ns])
+        return signature
+
+    def load_from_binary_cache(self, data_path: str):
+        """Opens train and test data saved by :meth:`save_to_binary_cache` as copy-on-write memory maps.
+
+        Args:
+            data_path: path to folder with datasets.
+
+        Returns:
+            tuple: train and test data or None if there is no valid cache.
+        """
+        cache_path = os.path.join(data_path, self.dataset_name, BINARY_CACHE_FOLDER)
+        try:
+            with open(os.path.join(cache_path, 'meta.json')) as meta_file:
+                meta = json.load(meta_file)
+        except (FileNotFoundError, ValueError):
+            return None
+        if meta.get('version') != BINARY_CACHE_VERSION or \
+                meta['sources'] != self._source_files_signature(meta['source_path']):
+            return None
+
+        subsets = []
+        for subset in ('train', 'test'):
+            features = np.load(os.path.join(cache_path, f'{subset}_features.npy'), mmap_mode='c')
+            target = np.load(os.path.join(cache_path, f'{subset}_target.npy'))
+            if meta['columns'] is not None:
+                features = pd.DataFrame(features, columns=meta['columns'])
+            subsets.append((features, target))
+        return tuple(subsets)
+
+    def save_to_binary_cache(self, data_path: str, train_data: tuple, test_data: tuple, source_path: str = None):
+        """Saves parsed train and test data as contiguous ``.npy`` arrays with metadata. Data which can not be
+        represented as numeric arrays (e.g. series of unequal length) is not cached.
+
+        Args:
+            data_path: path to folder with datasets.
+            train_data: tuple of train features and target.
+            test_data: tuple of test features and target.
+            source_path: path to folder with data files the cache is built from, ``data_path`` by default.
+        """
+        columns = train_data[0].columns.tolist() if isinstance(train_data[0], pd.DataFrame) else None
+        arrays = {}
+        for subset, (features, target) in zip(('train', 'test'), (train_data, test_data)):
+            arrays[f'{subset}_features'] = np.ascontiguousarray(features)
+            arrays[f'{subset}_target'] = np.asarray(target)
+        if any(array.dtype.hasobject for array in arrays.values()):
+            self.logger.info('Data is not numeric and is not saved to binary cache')
+            return
+
+        cache_path = os.path.join(data_path, self.dataset_name, BINARY_CACHE_FOLDER)
+        source_path = data_path if source_path is None else source_path
+        meta = {'version': BINARY_CACHE_VERSION,
+                'source_path': os.path.abspath(source_path),
+                'sources': self._source_files_signature(source_path),
+                'columns': columns}
+        try:
+            os.makedirs(cache_path, exist_ok=True)
+            for name, array in arrays.items():
+                np.save(os.path.join(cache_path, f'{name}.npy'), array)
+            # metadata is written last, so interrupted saving leaves the cache invalid
+            with open(os.path.join(cache_path, 'meta.json'), 'w') as meta_file:
+                json.dump(meta, meta_file)
+        except OSError as ex:
+            self.logger.warning(f'Data was not saved to binary cache due to error {ex}')
+
     def read_train_test_files(self, data_path, dataset_name, shuffle=True):
 
         file_path = data_path + '/' + dataset_name + f'/{dataset_name}_TRAIN'
@@ -167,13 +267,7 @@ class DataLoader:
         y_train, y_test = convert_type(y_train, y_test)
 
         if shuffle:
-            shuffled_idx = np.arange(x_train.shape[0])
-            np.random.shuffle(shuffled_idx)
-            if isinstance(x_train, pd.DataFrame):
-                x_train = x_train.iloc[shuffled_idx, :]
-            else:
-                x_train = x_train[shuffled_idx, :]
-            y_train = y_train[shuffled_idx]
+            x_train, y_train = shuffle_samples(x_train, y_train)
         return is_multi, (x_train, y_train), (x_test, y_test)
 
     def predict_encoding(self, file_path: Path, n_lines: int = 20) -> str:
@@ -815,21 +909,39 @@ class DataLoader:
         return x_train, y_train, x_test, y_test
 
     def read_ts_files(self, dataset_name, data_path):
+        x_train, y_train = self.read_ts_file(data_path + '/' + dataset_name + f'/{dataset_name}_TRAIN.ts')
+        x_test, y_test = self.read_ts_file(data_path + '/' + dataset_name + f'/{dataset_name}_TEST.ts')
+        return x_train, y_train, x_test, y_test
+
+    def read_ts_file(self, file_path: str) -> tuple:
+        """Reads ``.ts`` file. Series of equal length are parsed in bulk into array of shape
+        ``(n_samples, n_channels, series_length)``. Series of unequal length are read in batches into DataFrame
+        with ``pd.Series`` in cells. Files with timestamps are read by the full-featured parsers.
+
+        Args:
+            file_path: path to ``.ts`` file.
+
+        Returns:
+            tuple: features and target
+        """
+        encoding = self.predict_encoding(file_path)
+        try:
+            data = load_ts_file(file_path, encoding)
+            if data is not None:
+                return data
+            features, target = [], []
+            for samples, labels in iter_ts_file(file_path, encoding=encoding):
+                features.append(pd.DataFrame([[pd.Series(channel) for channel in sample] for sample in samples]))
+                target.append(labels)
+            features = pd.concat(features, ignore_index=True)
+            features.columns = [f'dim_{i}' for i in range(features.shape[1])]
+            return features, np.concatenate(target) if target[0] is not None else None
+        except Exception as ex:
+            self.logger.warning(f'Fast parsing of {file_path} failed: {ex}')
         try:
-            x_test, y_test = load_from_tsfile_to_dataframe(data_path + '/' + dataset_name + f'/{dataset_name}_TEST.ts',
-                                                           return_separate_X_and_y=True)
-            x_train, y_train = load_from_tsfile_to_dataframe(
-                data_path + '/' + dataset_name + f'/{dataset_name}_TRAIN.ts',
-                return_separate_X_and_y=True)
-            return x_train, y_train, x_test, y_test
+            return load_from_tsfile_to_dataframe(file_path, return_separate_X_and_y=True)
         except Exception:
-            x_test, y_test = self._load_from_tsfile_to_dataframe(
-                data_path + '/' + dataset_name + f'/{dataset_name}_TEST.ts',
-                return_separate_X_and_y=True)
-            x_train, y_train = self._load_from_tsfile_to_dataframe(
-                data_path + '/' + dataset_name + f'/{dataset_name}_TRAIN.ts',
-                return_separate_X_and_y=True)
-            return x_train, y_train, x_test, y_test
+            return self._load_from_tsfile_to_dataframe(file_path, return_separate_X_and_y=True)
 
     def read_arff_files(self, dataset_name, temp_data_path):
         """Reads data from ``.arff`` file.
@@ -896,6 +1008,114 @@ class DataLoader:
             return (pd.DataFrame(x_train), y_train), (pd.DataFrame(x_test), y_test)
 
 
+def read_ts_header(file) -> dict:
+    """Reads metadata of ``.ts`` file up to the ``@data`` tag.
+
+    Args:
+        file: opened ``.ts`` file.
+
+    Returns:
+        dict: values of tags by lowercase tag names without ``@``.
+    """
+    header = {}
+    for line in file:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        tokens = line.split()
+        tag = tokens[0].lower()
+        if tag == '@data':
+            return header
+        header[tag[1:]] = [token.lower() for token in tokens[1:2]] + tokens[2:]
+    raise ValueError('data tag is not found')
+
+
+def _is_true_tag(header: dict, tag: str) -> bool:
+    return header.get(tag, ['false'])[0] == 'true'
+
+
+def _split_ts_lines(lines: list, header: dict) -> tuple:
+    if not (_is_true_tag(header, 'classlabel') or _is_true_tag(header, 'targetlabel')):
+        return lines, None
+    values, labels = [], []
+    for line in lines:
+        line_values, _, label = line.rpartition(':')
+        values.append(line_values)
+        labels.append(label.strip())
+    return values, np.array(labels)
+
+
+def _read_ts_data_lines(file):
+    for line in file:
+        line = line.strip()
+        if line and not line.startswith('#'):
+            yield line
+
+
+def load_ts_file(file_path: str, encoding: str = 'utf-8'):
+    """Parses ``.ts`` file with series of equal length. The data section is converted to numbers in one call
+    and reshaped into preallocated array instead of building a ``pd.Series`` per cell.
+
+    Args:
+        file_path: path to ``.ts`` file.
+        encoding: encoding of the file.
+
+    Returns:
+        tuple: features of shape ``(n_samples, n_channels, series_length)`` and target or None if series have
+        unequal length.
+    """
+    with open(file_path, encoding=encoding) as file:
+        header = read_ts_header(file)
+        if _is_true_tag(header, 'timestamps'):
+            raise ValueError('series with timestamps are not supported')
+        if header.get('equallength', ['true'])[0] == 'false':
+            return None
+        values, labels = _split_ts_lines(list(_read_ts_data_lines(file)), header)
+    n_channels, n_commas = values[0].count(':') + 1, values[0].split(':')[0].count(',')
+    # every channel is checked, since channels of unequal length may have the same total length
+    if any(line.count(':') != n_channels - 1 or
+           any(channel.count(',') != n_commas for channel in line.split(':')) for line in values):
+        return None
+    series_length = n_commas + 1
+    text = ','.join(values).replace(':', ',').replace('?', 'nan')
+    features = np.fromstring(text, sep=',')
+    if features.size != len(values) * n_channels * series_length:
+        raise ValueError('data section contains values which are not numbers')
+    return features.reshape(len(values), n_channels, series_length), labels
+
+
+def iter_ts_file(file_path: str, batch_size: int = TS_BATCH_SIZE, encoding: str = 'utf-8'):
+    """Streams ``.ts`` file with series of any length in batches.
+
+    Args:
+        file_path: path to ``.ts`` file.
+        batch_size: number of series in a batch.
+        encoding: encoding of the file.
+
+    Yields:
+        tuple: list of samples, where sample is a list of arrays of channels, and array of target or None.
+    """
+    with open(file_path, encoding=encoding) as file:
+        header = read_ts_header(file)
+        if _is_true_tag(header, 'timestamps'):
+            raise ValueError('series with timestamps are not supported')
+        batch = []
+        for line in _read_ts_data_lines(file):
+            batch.append(line)
+            if len(batch) == batch_size:
+                yield _parse_ts_batch(batch, header)
+                batch = []
+        if batch:
+            yield _parse_ts_batch(batch, header)
+
+
+def _parse_ts_batch(lines: list, header: dict) -> tuple:
+    values, labels = _split_ts_lines(lines, header)
+    samples = [[np.array(channel.replace('?', 'nan').split(','), dtype=float) for channel in line.split(':')]
+               for line in values]
+    return samples, labels
+
+
 def convert_type(y_train, y_test):
     # Conversion of target values to int or str
     try:
@@ -905,3 +1125,13 @@ def convert_type(y_train, y_test):
         y_train = y_train.astype(str)
         y_test = y_test.astype(str)
     return y_train, y_test
+
+
+def shuffle_samples(features, target) -> tuple:
+    shuffled_idx = np.arange(features.shape[0])
+    np.random.shuffle(shuffled_idx)
+    if isinstance(features, pd.DataFrame):
+        features = features.iloc[shuffled_idx, :]
+    else:
+        features = features[shuffled_idx, :]
+    return features, target[shuffled_idx]
@@ -31,3 +31,22 @@ def test_DataCheck(input_data):
         features, target), task='classification')
     clean_data = data_check.check_input_data()
     assert clean_data is not None
+
+
+def test_DataCheck_shares_clean_features():
+    features, target = np.random.rand(10, 2, 20), np.random.randint(0, 2, 10)
+    clean_data = DataCheck(input_data=(features, target), task='classification').check_input_data()
+    assert np.shares_memory(clean_data.features, features)
+    assert not clean_data.features.flags.writeable
+    assert features.flags.writeable
+
+    clean_data.target[:] = -1
+    assert (target != -1).all()
+
+
+def test_DataCheck_copies_features_with_nans():
+    features, target = input_data_with_nans()
+    source = features.copy()
+    clean_data = DataCheck(input_data=(features, target), task='regression').check_input_data()
+    assert np.array_equal(features, source, equal_nan=True)
+    assert np.isfinite(clean_data.features).all()
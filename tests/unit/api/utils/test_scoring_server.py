@@ -0,0 +1,55 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fedot_ind.api.utils.scoring_server import MicroBatchingServer
+from fedot_ind.core.architecture.settings.computational import backend_methods as np
+
+
+class SumModel:
+    def __init__(self):
+        self.batch_sizes = []
+
+    def predict(self, features):
+        self.batch_sizes.append(len(features))
+        return features.sum(axis=(1, 2))
+
+    def predict_proba(self, features):
+        return np.stack([features.min(axis=(1, 2)), features.max(axis=(1, 2))], axis=1)
+
+
+def test_micro_batching_server():
+    model = SumModel()
+    series = np.random.rand(64, 1, 20)
+    with MicroBatchingServer(model, max_batch_size=16, max_wait=0.05) as server:
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            labels = list(executor.map(server.predict, series))
+            probs = list(executor.map(server.predict_proba, series))
+        metrics = server.metrics()
+
+    assert max(model.batch_sizes) <= 16
+    assert np.allclose(labels, model.predict(series))
+    assert np.allclose(probs, model.predict_proba(series))
+    assert metrics['requests'] == 128
+    assert metrics['batches'] < 128
+    assert metrics['latency_p50'] <= metrics['latency_p99']
+
+
+def test_micro_batching_server_propagates_errors():
+    with MicroBatchingServer(SumModel()) as server:
+        with pytest.raises(ValueError):
+            # series of one dimension can not be summed over three axes
+            server.predict(np.random.rand(20))
+
+
+class TruncatingModel(SumModel):
+    def predict_proba(self, features):
+        return super().predict_proba(features)[:-1]
+
+
+def test_micro_batching_server_survives_wrong_number_of_predictions():
+    with MicroBatchingServer(TruncatingModel()) as server:
+        with pytest.raises(ValueError):
+            server.predict_proba(np.random.rand(1, 20))
+        series = np.random.rand(1, 20)
+        assert np.isclose(server.predict(series), series.sum())
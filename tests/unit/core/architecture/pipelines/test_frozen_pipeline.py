@@ -0,0 +1,43 @@
+import pytest
+from fedot.core.pipelines.pipeline_builder import PipelineBuilder
+
+from fedot_ind.api.utils.checkers_collections import DataCheck
+from fedot_ind.core.architecture.pipelines.frozen_pipeline import FrozenPipeline
+from fedot_ind.core.architecture.settings.computational import backend_methods as np
+from fedot_ind.core.repository.initializer_industrial_models import IndustrialModels
+from fedot_ind.tools.synthetic.ts_datasets_generator import TimeSeriesDatasetsGenerator
+
+
+@pytest.fixture
+def train_test_data():
+    IndustrialModels().setup_repository()
+    (X_train, y_train), (X_test, y_test) = TimeSeriesDatasetsGenerator(num_samples=30,
+                                                                       max_ts_len=50,
+                                                                       binary=True,
+                                                                       test_size=0.5).generate_data()
+    train_data = DataCheck(input_data=(X_train, y_train), task='classification').check_input_data()
+    test_data = DataCheck(input_data=(X_test, y_test), task='classification').check_input_data()
+    return train_data, test_data
+
+
+@pytest.mark.parametrize('builder', [
+    PipelineBuilder().add_sequence('quantile_extractor', 'logit'),
+    PipelineBuilder().add_sequence('quantile_extractor', 'scaling', 'rf'),
+    # branches of different depth are joined by the root node
+    PipelineBuilder().add_node('quantile_extractor').add_branch('scaling', 'normalization')
+    .add_node('simple_imputation', branch_idx=0).join_branches('logit')
+])
+def test_frozen_pipeline_equals_pipeline(train_test_data, builder):
+    train_data, test_data = train_test_data
+    pipeline = builder.build()
+    pipeline.fit(train_data)
+    frozen = FrozenPipeline(pipeline, input_shape=train_data.features.shape[1:])
+
+    assert np.array_equal(frozen.predict(test_data.features),
+                          pipeline.predict(test_data, output_mode='labels').predict)
+    assert np.allclose(frozen.predict_proba(test_data.features),
+                       pipeline.predict(test_data, output_mode='probs').predict)
+    # one series is scored as a batch of one series
+    assert np.array_equal(frozen.predict(test_data.features[0]), frozen.predict(test_data.features[:1]))
+    with pytest.raises(ValueError):
+        frozen.predict(np.random.rand(2, 1, 7))
@@ -1,7 +1,11 @@
 import pytest
+import torch
 from fedot.core.data.data import InputData
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
 
-from fedot_ind.core.architecture.preprocessing.data_convertor import FedotConverter
+from fedot_ind.core.architecture.preprocessing.data_convertor import CustomDatasetCLF, FedotConverter, LazyDatasetCLF
+from fedot_ind.core.architecture.settings.computational import backend_methods as np
 from fedot_ind.tools.synthetic.ts_datasets_generator import TimeSeriesDatasetsGenerator
 
 
@@ -17,3 +21,25 @@ def test_fedot_converter(data):
     converter = FedotConverter(data=train_data)
 
     assert isinstance(converter.input_data, InputData)
+
+
+def test_lazy_dataset_reads_samples_of_memmap(tmp_path):
+    features = np.lib.format.open_memmap(str(tmp_path / 'features.npy'), mode='w+', dtype=np.float64, shape=(20, 2, 30))
+    features[:] = np.random.rand(20, 2, 30)
+
+    def input_data():
+        # datasets encode the target of input data in place
+        return InputData(idx=np.arange(20), features=features, target=np.array(['a', 'b'] * 10).reshape(-1, 1),
+                         task=Task(TaskTypesEnum.classification), data_type=DataTypesEnum.image)
+
+    dataset = LazyDatasetCLF(input_data()).subset(np.array([7, 3, 12]))
+    eager_dataset = CustomDatasetCLF(input_data())
+
+    assert len(dataset) == 3
+    samples = dataset.__getitems__([0, 1, 2])
+    for (x, y), index in zip(samples, [7, 3, 12]):
+        assert x.dtype == torch.float32
+        assert torch.equal(x, torch.from_numpy(features[index]).float())
+        assert torch.equal(y, eager_dataset.y[index].cpu())
+    x, y = dataset[1]
+    assert torch.equal(x, samples[1][0]) and torch.equal(y, samples[1][1])
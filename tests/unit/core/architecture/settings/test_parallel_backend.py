@@ -0,0 +1,46 @@
+import pytest
+
+from fedot_ind.core.architecture.settings.computational import backend_methods as np
+from fedot_ind.core.architecture.settings.parallel_backend import get_parallel_backend, get_worker_pool, \
+    resolve_n_jobs, WorkerPool
+
+
+def chunk_sum(samples):
+    return samples.sum(axis=1)
+
+
+@pytest.mark.parametrize('backend', ['sequential', 'threading', 'loky'])
+def test_map_chunks(backend):
+    samples = np.random.rand(11, 5)
+    chunk_results = get_parallel_backend(backend, n_jobs=2).map_chunks(chunk_sum, samples)
+    assert np.allclose(np.concatenate(chunk_results), samples.sum(axis=1))
+
+
+@pytest.mark.parametrize('backend', ['sequential', 'threading', 'loky'])
+def test_map_tasks(backend):
+    tasks = [np.random.rand(4, 3) for _ in range(3)]
+    task_results = get_parallel_backend(backend, n_jobs=2).map_tasks(chunk_sum, tasks)
+    assert all(np.allclose(result, task.sum(axis=1)) for result, task in zip(task_results, tasks))
+
+
+def test_resolve_n_jobs():
+    assert resolve_n_jobs(3) == 3
+    assert resolve_n_jobs(None) >= 1
+    assert resolve_n_jobs(-1) >= 1
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        get_parallel_backend('dask')
+
+
+def test_worker_pool():
+    samples = np.random.rand(6, 5)
+    with WorkerPool(n_jobs=2, warm_start_modules=()) as pool:
+        assert get_worker_pool() is pool
+        executor = pool.executor
+        chunk_results = get_parallel_backend('loky', n_jobs=2).map_chunks(chunk_sum, samples)
+        assert np.allclose(np.concatenate(chunk_results), samples.sum(axis=1))
+        assert pool.executor is executor
+    assert get_worker_pool() is None
+    assert pool.executor is None
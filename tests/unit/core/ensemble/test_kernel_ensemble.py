@@ -1,5 +1,16 @@
+import logging
+
+import pytest
+import torch
+from MKLpy.algorithms import CKA
+
 from fedot_ind.api.main import FedotIndustrial
+from fedot_ind.api.utils.data import init_input_data
+from fedot_ind.core.architecture.settings.computational import backend_methods as np
+from fedot_ind.core.ensemble.kernel_approximation import centered_alignment_weights, kernel_factors
+from fedot_ind.core.ensemble.kernel_ensemble import KernelEnsembler
 from fedot_ind.tools.loader import DataLoader
+from fedot_ind.tools.synthetic.ts_datasets_generator import TimeSeriesDatasetsGenerator
 
 
 def test_kernel_ensemble():
@@ -19,3 +30,41 @@ def test_kernel_ensemble():
     # predict = industrial.predict(test_data)
     #
     # assert predict is not None
+
+
+@pytest.mark.parametrize('n_classes', [2, 3])
+def test_factor_alignment_equals_kernel_alignment(n_classes):
+    features = [np.random.rand(30, 6), np.random.rand(30, 4), np.random.rand(30, 8)]
+    target = np.arange(30) % n_classes
+    factors = [kernel_factors(feature, 'nystroem') for feature in features]
+    mkl = CKA(multiclass_strategy='ova').fit([torch.tensor(f @ f.T) for f in factors], target)
+    solutions = [mkl.solution] if n_classes == 2 else [mkl.solution[label] for label in range(n_classes)]
+    expected_weights = np.abs(np.stack([solution.weights.numpy() for solution in solutions]))
+    assert np.allclose(centered_alignment_weights(factors, target).values, expected_weights)
+
+
+@pytest.mark.parametrize('kernel_approximation', ['nystroem', 'random_features'])
+def test_approximated_kernel_ensemble(kernel_approximation):
+    (X_train, y_train), (X_test, y_test) = TimeSeriesDatasetsGenerator(num_samples=40,
+                                                                       max_ts_len=50,
+                                                                       binary=False,
+                                                                       test_size=0.5).generate_data()
+    train_data, test_data = init_input_data(X_train, y_train), init_input_data(X_test, y_test)
+    ensembler = KernelEnsembler({'feature_extractor': ['quantile_extractor', 'fourier_extractor'],
+                                 'kernel_approximation': kernel_approximation,
+                                 'n_components': 10})
+    kernel_ensemble, kernel_data = ensembler.transform(train_data).predict
+    for generator, model in kernel_ensemble.items():
+        assert kernel_data[generator].features.shape[0] == len(y_train)
+        model.fit(kernel_data[generator])
+        predict = model.predict(ensembler.generate_features(test_data, generator)).predict
+        assert len(predict) == len(y_test)
+
+
+def test_dense_strategy_with_approximation_warns(monkeypatch):
+    # warnings are collected from the logger of the ensembler, since other tests may change handlers of the root logger
+    warnings = []
+    monkeypatch.setattr(logging.getLogger(KernelEnsembler.__name__), 'warning',
+                        lambda message, *args, **kwargs: warnings.append(message))
+    KernelEnsembler({'kernel_approximation': 'nystroem', 'kernel_strategy': 'two_step_rmkl'})
+    assert any('requires dense kernels' in message for message in warnings)
@@ -1,9 +1,16 @@
 import numpy as np
 import pandas as pd
 import pytest
+import torch
+from fedot.core.data.data import InputData
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
 
 from fedot_ind.api.utils.data import init_input_data
-from fedot_ind.core.models.nn.network_impl.inception import InceptionTimeModel
+from fedot_ind.core.architecture.preprocessing.data_convertor import LazyDatasetCLF
+from fedot_ind.core.architecture.settings.parallel_backend import resolve_intra_op_threads, sequential_execution
+from fedot_ind.core.models.nn.network_impl.inception import InceptionTime, InceptionTimeModel
+from fedot_ind.core.models.nn.network_modules.layers.special import ModelCheckpoint
 
 
 @pytest.fixture
@@ -18,3 +25,81 @@ def test_inception_time_model(ts):
     loss_fn, optimizer = inception._init_model(ts=ts)
     assert loss_fn is not None
     assert optimizer is not None
+
+
+def test_inception_time_model_fits_on_memmap(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    features = np.lib.format.open_memmap(str(tmp_path / 'features.npy'), mode='w+', dtype=np.float64, shape=(20, 1, 32))
+    features[:] = np.random.rand(20, 1, 32)
+    features.flush()
+    features = np.load(str(tmp_path / 'features.npy'), mmap_mode='r')
+    target = np.array([0, 1] * 10).reshape(-1, 1)
+    ts = InputData(idx=np.arange(20), features=features, target=target,
+                   task=Task(TaskTypesEnum.classification), data_type=DataTypesEnum.image)
+    inception = InceptionTimeModel({'epochs': 1, 'batch_size': 8, 'num_classes': 2})
+    train_loader, val_loader = inception._prepare_data(ts, split_data=True)
+    assert isinstance(train_loader.dataset, LazyDatasetCLF)
+    assert len(train_loader.dataset) == 14 and len(val_loader.dataset) == 6
+    assert not set(train_loader.dataset.indices) & set(val_loader.dataset.indices)
+
+    inception.fit(ts)
+    # checkpoints are kept in memory
+    assert [path.name for path in tmp_path.iterdir()] == ['features.npy']
+
+    predicted_batches = []
+    predict_model = InceptionTimeModel._predict_model
+
+    def predict_batch(self, samples, output_mode):
+        assert not isinstance(samples, np.memmap)
+        predicted_batches.append(len(samples))
+        return predict_model(self, samples, output_mode)
+
+    monkeypatch.setattr(InceptionTimeModel, '_predict_model', predict_batch)
+    labels = inception.predict(ts, 'labels').predict
+    probabilities = inception.predict(ts, 'probs').predict
+    # the model gets batches of samples read from the memory map instead of the whole array
+    assert predicted_batches == [8, 8, 4] * 2
+    assert labels.shape == (20,)
+    monkeypatch.setattr(InceptionTimeModel, '_predict_model', predict_model)
+    in_memory_ts = InputData(idx=np.arange(20), features=np.array(features), target=target,
+                             task=Task(TaskTypesEnum.classification), data_type=DataTypesEnum.image)
+    assert np.allclose(probabilities, inception.predict(in_memory_ts, 'probs').predict, atol=1e-5)
+    assert np.array_equal(labels, np.argmax(probabilities, axis=1))
+
+
+def test_model_checkpoint_restores_best_weights_from_memory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    model = InceptionTime(input_dim=1, output_dim=2)
+    checkpoint = ModelCheckpoint()
+    assert not checkpoint.restore(model)
+
+    checkpoint.snapshot(model)
+    buffers = {name: tensor.data_ptr() for name, tensor in checkpoint.state.items()}
+    best_state = {name: tensor.clone() for name, tensor in model.state_dict().items()}
+    with torch.no_grad():
+        for parameter in model.parameters():
+            parameter.add_(1)
+    assert checkpoint.restore(model)
+    for name, tensor in model.state_dict().items():
+        assert torch.equal(tensor, best_state[name])
+
+    checkpoint.snapshot(model)
+    assert buffers == {name: tensor.data_ptr() for name, tensor in checkpoint.state.items()}
+    assert not list(tmp_path.iterdir())
+
+
+def test_inception_time_model_performance_mode():
+    features = np.random.rand(40, 1, 32)
+    ts = InputData(idx=np.arange(40), features=features, target=np.array([0, 1] * 20).reshape(-1, 1),
+                   task=Task(TaskTypesEnum.classification), data_type=DataTypesEnum.image)
+    inception = InceptionTimeModel({'epochs': 1, 'num_classes': 2, 'performance_mode': True,
+                                    'batch_size': 'auto', 'n_jobs': 1})
+    num_threads = torch.get_num_threads()
+    inception.fit(ts)
+
+    assert inception.use_amp and inception.batch_size == 16
+    assert torch.get_num_threads() == num_threads
+    prediction = inception.predict(ts, 'probs').predict
+    assert prediction.dtype == np.float32 and np.isfinite(prediction).all()
+    with sequential_execution():
+        assert resolve_intra_op_threads(4) == 1
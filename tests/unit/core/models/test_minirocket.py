@@ -0,0 +1,74 @@
+import pytest
+import torch
+from fedot.core.operations.operation_parameters import OperationParameters
+
+from fedot_ind.api.utils.data import init_input_data
+from fedot_ind.core.operation import IndustrialCachableOperation
+from fedot_ind.core.architecture.settings.computational import backend_methods as np
+from fedot_ind.core.models.nn.network_impl.mini_rocket import get_minirocket_features, MiniRocketExtractor, \
+    MiniRocketFeatures
+
+
+@pytest.fixture
+def train_test_data():
+    train_data = init_input_data(np.random.rand(20, 2, 50), np.random.randint(0, 2, 20))
+    test_data = init_input_data(np.random.rand(7, 2, 50), np.random.randint(0, 2, 7))
+    return train_data, test_data
+
+
+@pytest.mark.parametrize('mode', ['multivariate', 'chanel_independent'])
+def test_minirocket_fit_once_transform_many(train_test_data, mode):
+    train_data, test_data = train_test_data
+    extractor = MiniRocketExtractor(OperationParameters(num_features=168, chunk_size=3, mode=mode))
+    extractor.fit(train_data)
+    fitted_models = extractor.feature_models
+
+    test_features = extractor.transform(test_data).predict
+    assert extractor.feature_models is fitted_models
+    assert test_features.dtype == np.float32
+    assert test_features.shape == (7, len(fitted_models), 168)
+
+    # test features are computed with biases fitted on train data
+    channels = [test_data.features] if mode == 'multivariate' else \
+        [test_data.features[:, [i], :] for i in range(2)]
+    for index, (model, data) in enumerate(zip(fitted_models, channels)):
+        expected = get_minirocket_features(data, model)[..., 0]
+        assert np.allclose(test_features[:, index, :], expected)
+
+
+@pytest.mark.parametrize('seq_len', [9, 50, 301])
+def test_ppv_equals_broadcast_comparison(seq_len):
+    model = MiniRocketFeatures(input_dim=1, seq_len=seq_len, num_features=84, random_state=0)
+    C = torch.randn(4, 84, seq_len)
+    bias = torch.randn(84, 3)
+    expected = (C.unsqueeze(-1) > bias.view(1, 84, 1, 3)).float().mean(2).flatten(1)
+    assert torch.equal(model._get_PPVs(C, bias), expected)
+
+
+def test_cached_features_depend_on_fitted_models(train_test_data):
+    train_data, test_data = train_test_data
+    extractor = MiniRocketExtractor(OperationParameters(num_features=168, use_cache=True))
+    extractor.fit(train_data)
+    first_features = np.array(extractor.transform(test_data).predict)
+
+    # refit on other data changes biases, so features are not taken from the previous cache entry
+    extractor.fit(init_input_data(np.random.rand(20, 2, 50) * 10, np.random.randint(0, 2, 20)))
+    refitted_features = np.array(extractor.transform(test_data).predict)
+    expected = get_minirocket_features(test_data.features, extractor.feature_models[0])[..., 0]
+    assert not np.allclose(first_features, refitted_features)
+    assert np.allclose(refitted_features[:, 0, :], expected)
+
+
+def test_fitted_state_is_digested_once_per_fit(train_test_data, monkeypatch):
+    train_data, test_data = train_test_data
+    digests = []
+    digest = IndustrialCachableOperation.state_digest
+    monkeypatch.setattr(IndustrialCachableOperation, 'state_digest', lambda value: digests.append(1) or digest(value))
+    extractor = MiniRocketExtractor(OperationParameters(num_features=168, use_cache=True))
+    extractor.fit(train_data)
+    extractor.transform(test_data)
+    extractor.transform(test_data)
+    assert len(digests) == 1
+    extractor.fit(test_data)
+    extractor.transform(test_data)
+    assert len(digests) == 2
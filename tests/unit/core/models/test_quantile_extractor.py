@@ -4,8 +4,10 @@ from fedot.core.data.data import OutputData
 
 from fedot_ind.api.utils.data import init_input_data
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
+from fedot_ind.core.models.quantile.batch_stat_features import get_batch_statistical_features
 from fedot_ind.core.models.quantile.quantile_extractor import QuantileExtractor
-from fedot_ind.core.repository.constanst_repository import STAT_METHODS, STAT_METHODS_GLOBAL
+from fedot_ind.core.repository.constanst_repository import BATCH_STAT_METHODS_GLOBAL, STAT_METHODS, \
+    STAT_METHODS_GLOBAL
 from fedot_ind.tools.synthetic.ts_datasets_generator import TimeSeriesDatasetsGenerator
 
 FEATURES = list(STAT_METHODS.keys()) + list(STAT_METHODS_GLOBAL.keys())
@@ -61,3 +63,38 @@ def test_extract_features(quantile_extractor):
     assert train_features is not None
     assert isinstance(train_features, pd.DataFrame)
     assert len(FEATURES) == train_features.shape[1]
+
+
+@pytest.mark.parametrize('shape', [(10, 50), (6, 3, 40)])
+def test_batch_mode_equals_per_sample(shape):
+    features = np.random.normal(size=shape)
+    features[0] = np.round(features[0], 1)
+    input_data = init_input_data(features, np.array([0, 1] * (shape[0] // 2)))
+    per_sample_extractor = QuantileExtractor({'window_size': 0, 'batch_mode': False})
+    batch_extractor = QuantileExtractor({'window_size': 0, 'batch_mode': True})
+    per_sample_features = per_sample_extractor.transform(input_data).predict
+    batch_features = batch_extractor.transform(input_data).predict
+
+    assert per_sample_features.shape == batch_features.shape
+    assert per_sample_extractor.relevant_features == batch_extractor.relevant_features
+    assert np.allclose(per_sample_features, batch_features)
+
+
+@pytest.mark.parametrize('params', [{'window_size': 10, 'stride': 1}, {'window_size': 20, 'stride': 3}])
+def test_batch_window_mode_equals_per_sample(params, input_data):
+    per_sample_extractor = QuantileExtractor({**params, 'batch_mode': False})
+    batch_extractor = QuantileExtractor({**params, 'batch_mode': True})
+    per_sample_features = per_sample_extractor.transform(input_data).predict
+    batch_features = batch_extractor.transform(input_data).predict
+
+    assert per_sample_features.shape == batch_features.shape
+    assert per_sample_extractor.relevant_features == batch_extractor.relevant_features
+    assert np.allclose(per_sample_features, batch_features)
+
+
+def test_batch_features_non_contiguous_input():
+    series = np.random.normal(size=(40, 8)).T
+    assert not series.flags.c_contiguous
+    assert np.allclose(get_batch_statistical_features(series, BATCH_STAT_METHODS_GLOBAL),
+                       get_batch_statistical_features(np.ascontiguousarray(series), BATCH_STAT_METHODS_GLOBAL),
+                       equal_nan=True)
@@ -5,6 +5,8 @@ from fedot.core.data.data import InputData, OutputData
 from fedot_ind.api.utils.data import init_input_data
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
 from fedot_ind.core.models.recurrence.reccurence_extractor import RecurrenceExtractor
+from fedot_ind.core.models.recurrence.sequences import RecurrenceFeatureExtractor, line_length_histograms, \
+    pack_recurrence_matrix
 from fedot_ind.tools.synthetic.ts_datasets_generator import TimeSeriesDatasetsGenerator
 
 
@@ -61,3 +63,28 @@ def test_extract_features(recurrence_extractor):
     train_features = recurrence_extractor.extract_features(X, y)
     assert train_features is not None
     assert isinstance(train_features, pd.DataFrame)
+
+
+def test_line_length_histograms():
+    recurrence_matrix = np.array([[1, 1, 0, 0],
+                                  [1, 1, 1, 0],
+                                  [0, 1, 1, 0],
+                                  [0, 0, 0, 1]], dtype=float)
+    diagonal, vertical, white_vertical = line_length_histograms(recurrence_matrix)
+    assert np.array_equal(diagonal, [0, 0, 2, 0, 1])
+    assert np.array_equal(vertical, [0, 1, 2, 1, 0])
+    assert np.array_equal(white_vertical, [0, 3, 1, 1, 0])
+
+    packed_histograms = line_length_histograms(pack_recurrence_matrix(recurrence_matrix),
+                                               n_vectors=4, packed=True)
+    assert all(np.array_equal(packed, unpacked) for packed, unpacked
+               in zip(packed_histograms, (diagonal, vertical, white_vertical)))
+
+
+def test_quantification_analysis_packed():
+    recurrence_matrix = (np.random.rand(40, 40) > 0.5).astype(float)
+    features = RecurrenceFeatureExtractor(recurrence_matrix).quantification_analysis()
+    packed_features = RecurrenceFeatureExtractor(pack_recurrence_matrix(recurrence_matrix),
+                                                 packed=True).quantification_analysis()
+    for name, value in features.items():
+        assert np.isclose(value, packed_features[name], equal_nan=True)
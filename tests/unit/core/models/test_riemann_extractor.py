@@ -0,0 +1,60 @@
+import pytest
+from fedot.core.data.data import InputData
+from fedot.core.operations.operation_parameters import OperationParameters
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+from pyriemann.estimation import Covariances, Shrinkage
+from pyriemann.tangentspace import TangentSpace
+from pyriemann.utils import mean_covariance
+from pyriemann.utils.distance import distance
+
+from fedot_ind.core.architecture.settings.computational import backend_methods as np
+from fedot_ind.core.models.manifold.riemann_embeding import RiemannExtractor
+from fedot_ind.core.models.manifold.riemann_engine import RiemannFeatureEngine
+
+
+def multichannel_data(n_samples=20, target=True):
+    rng = np.random.default_rng(0)
+    features = rng.normal(size=(n_samples, 4, 50))
+    features[::2, 0] += features[::2, 1]
+    return InputData(idx=np.arange(n_samples),
+                     features=features,
+                     target=np.arange(n_samples).reshape(-1, 1) % 2 if target else None,
+                     task=Task(TaskTypesEnum.classification),
+                     data_type=DataTypesEnum.image)
+
+
+@pytest.mark.parametrize('metric', ['riemann', 'logeuclid', 'euclid'])
+def test_engine_features_equal_pyriemann_features(metric):
+    data = multichannel_data()
+    engine = RiemannFeatureEngine(mean_metric=metric, tangent_metric=metric)
+    covmats = engine.covariances(data.features)
+    engine.fit(covmats, data.target)
+
+    expected_covmats = Shrinkage().fit_transform(Covariances(estimator='scm').fit_transform(data.features))
+    target = data.target.flatten()
+    centroids = [mean_covariance(expected_covmats[target == label], metric=metric) for label in (0, 1)]
+    expected_distances = np.concatenate([distance(expected_covmats, centroid, metric) for centroid in centroids],
+                                        axis=1)
+    assert np.allclose(covmats, expected_covmats)
+    assert np.allclose(engine.tangent_features(covmats),
+                       TangentSpace(metric=metric).fit_transform(expected_covmats))
+    assert np.allclose(engine.centroid_distances(covmats), expected_distances)
+
+
+def test_engine_partial_fit_updates_means():
+    covmats = RiemannFeatureEngine().covariances(multichannel_data().features)
+    target = np.arange(len(covmats)) % 2
+    engine = RiemannFeatureEngine(mean_metric='euclid', tangent_metric='euclid').fit(covmats[:10], target[:10])
+    engine.partial_fit(covmats[10:], target[10:])
+    fitted_engine = RiemannFeatureEngine(mean_metric='euclid', tangent_metric='euclid').fit(covmats, target)
+    assert np.allclose(engine.reference_, fitted_engine.reference_)
+    assert np.allclose(engine.centroids_, fitted_engine.centroids_)
+
+
+def test_riemann_extractor_predicts_by_fitted_means():
+    extractor = RiemannExtractor(OperationParameters())
+    train_features = extractor.transform(multichannel_data()).predict
+    test_features = extractor.transform(multichannel_data(target=False)).predict
+    assert train_features.shape == (20, 12)
+    assert np.allclose(train_features, test_features)
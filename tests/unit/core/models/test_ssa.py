@@ -1,10 +1,14 @@
 from fedot.core.data.data import InputData
 from fedot.core.data.data_split import train_test_data_setup
+from fedot.core.operations.operation_parameters import OperationParameters
 from fedot.core.pipelines.pipeline_builder import PipelineBuilder
 from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.repository.tasks import Task, TaskTypesEnum, TsForecastingParams
+from golem.core.tuning.simultaneous import SimultaneousTuner
 
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
+from fedot_ind.core.models.ts_forecasting.ssa_forecaster import SSAForecasterImplementation
+from fedot_ind.core.operation.transformation.data.hankel import HankelMatrix
 from fedot_ind.core.repository.initializer_industrial_models import IndustrialModels
 
 
@@ -24,3 +28,63 @@ def test_ssa():
     #     pipeline = PipelineBuilder().add_node('ssa_forecaster').build()
     #     pipeline.fit(train_data)
     # assert pipeline is not None
+
+
+def ssa_input_data(time_series, forecast_length=5):
+    task = Task(TaskTypesEnum.ts_forecasting,
+                TsForecastingParams(forecast_length=forecast_length))
+    return InputData(idx=np.arange(time_series.shape[0]),
+                     features=time_series,
+                     target=time_series,
+                     task=task,
+                     data_type=DataTypesEnum.ts)
+
+
+def test_incremental_ssa_updates_subspace_without_refit():
+    time_series = np.sin(np.arange(200) / 8) + 0.01 * np.arange(200)
+    tuning_params = {'tuning_iterations': 2, 'tuning_timeout': 0.1, 'tuning_early_stop': 2,
+                     'tuner': SimultaneousTuner}
+    with IndustrialModels():
+        model = SSAForecasterImplementation(OperationParameters(component_model='ar',
+                                                                tuning_params=tuning_params,
+                                                                incremental=True))
+        model.fit(ssa_input_data(time_series[:150]))
+        component_models = dict(model.model_by_channel)
+        forecast = model.predict(ssa_input_data(time_series[:170]))
+
+    _, singular_values, VT = model._subspace
+    # the subspace slides over the last 100 points as on fit
+    hankel_matrix = HankelMatrix(time_series=time_series[70:170],
+                                 window_size=model._decomposer.window_size).trajectory_matrix
+    expected_singular_values = np.linalg.svd(hankel_matrix, compute_uv=False)[:singular_values.shape[0]]
+    assert forecast.predict.shape == (5,)
+    assert model.model_by_channel == component_models
+    assert VT.shape[1] == hankel_matrix.shape[1]
+    assert np.allclose(singular_values, expected_singular_values, rtol=1e-3)
+
+
+def test_incremental_ssa_refits_after_predict_for_fit_on_short_series():
+    time_series = np.sin(np.arange(80) / 8)
+    tuning_params = {'tuning_iterations': 2, 'tuning_timeout': 0.1, 'tuning_early_stop': 2,
+                     'tuner': SimultaneousTuner}
+    with IndustrialModels():
+        model = SSAForecasterImplementation(OperationParameters(component_model='ar',
+                                                                tuning_params=tuning_params,
+                                                                incremental=True))
+        model.fit(ssa_input_data(time_series))
+        model.predict_for_fit(ssa_input_data(time_series))
+        model.fit(ssa_input_data(time_series))
+
+    assert model._fit_length == time_series.shape[0]
+
+
+def test_incremental_ssa_keeps_order_of_components():
+    model = SSAForecasterImplementation(OperationParameters(component_model='ar', incremental=True))
+    VT = np.array([[0.5, 0.5, 0.5, 0.5], [0.5, -0.5, 0.5, -0.5]])
+    model._subspace = np.eye(3)[:, :2], np.array([1.0, 0.9]), VT
+    # the new column makes the second component the largest one
+    model._update_subspace(np.array([0.0, 2.0, 0.0]))
+    U, singular_values, _ = model._subspace
+    assert singular_values[1] > singular_values[0]
+    # each component keeps its direction and orientation
+    assert np.all(np.diag(U) > 0.9)
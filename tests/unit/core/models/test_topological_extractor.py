@@ -4,7 +4,13 @@ from fedot.core.data.data import InputData, OutputData
 from fedot_ind.api.utils.data import init_input_data
 
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
+from fedot_ind.core.models.base_extractor import BaseExtractor
+from fedot_ind.core.models.topological.topofeatures import HolesNumberFeature, PersistenceDiagramsBatch, \
+    TopologicalFeaturesExtractor
 from fedot_ind.core.models.topological.topological_extractor import TopologicalExtractor
+from fedot_ind.core.operation.transformation.data.point_cloud import TopologicalTransformation
+from fedot_ind.core.repository.constanst_repository import PERSISTENCE_DIAGRAM_EXTRACTOR, \
+    PERSISTENCE_DIAGRAM_FEATURES
 from fedot_ind.tools.synthetic.ts_datasets_generator import TimeSeriesDatasetsGenerator
 
 
@@ -42,3 +48,48 @@ def test_generate_topological_features(topological_extractor, input_data):
     assert train_features is not None
     assert isinstance(train_features, InputData)
     assert train_features.features.shape[0] == 1
+
+
+@pytest.mark.parametrize('samples', [np.random.rand(5, 40), np.random.rand(4, 2, 40)])
+def test_batched_features_equal_per_sample_features(samples):
+    batched_features, (batched_names, _) = TopologicalExtractor({'window_size': 20})._extract_chunk_features(samples)
+    features, (names, _) = BaseExtractor._extract_chunk_features(TopologicalExtractor({'window_size': 20}), samples)
+    assert np.array_equal(batched_features, features)
+    assert list(batched_names) == list(names)
+
+
+def test_landmark_features():
+    extractor = TopologicalExtractor({'window_size': 50, 'n_landmarks': 8})
+    features, _ = extractor._extract_chunk_features(np.random.rand(3, 1, 60))
+    assert features.shape == (3, 1, 20)
+    point_clouds = extractor.data_transformer.time_series_to_point_clouds(np.random.rand(3, 60))
+    landmarks = extractor.data_transformer.select_landmarks(point_clouds, 8)
+    assert landmarks.shape == (3, 8, point_clouds.shape[2])
+
+
+def test_vectorized_diagram_features_equal_diagram_features():
+    series = np.vstack([np.random.rand(5, 60), np.tile(np.arange(60.), (2, 1))])
+    point_clouds = TopologicalTransformation(window_length=10).time_series_to_point_clouds(series)
+    diagrams = PERSISTENCE_DIAGRAM_EXTRACTOR.transform_batch(np.ascontiguousarray(point_clouds))
+    diagrams_batch = PersistenceDiagramsBatch(diagrams)
+    for feature_name, feature_model in PERSISTENCE_DIAGRAM_FEATURES.items():
+        # landscapes of installed gtda have no layer axis, so the feature is filled with zeros by the extractor
+        if feature_name == 'AveragePersistenceLandscapeFeature':
+            continue
+        features = np.stack([feature_model.fit_transform(diagram) for diagram in diagrams])
+        assert np.array_equal(feature_model.fit_transform_batch(diagrams_batch), features)
+
+
+def test_failed_first_feature_is_filled_with_zeros():
+    class FailingFeature(HolesNumberFeature):
+        def extract_batch_feature_(self, diagrams_batch):
+            raise ValueError
+
+    point_clouds = TopologicalTransformation(window_length=10).time_series_to_point_clouds(np.random.rand(3, 60))
+    features_extractor = TopologicalFeaturesExtractor(PERSISTENCE_DIAGRAM_EXTRACTOR,
+                                                      {'FailingFeature': FailingFeature(),
+                                                       'HolesNumberFeature': HolesNumberFeature()})
+    features = features_extractor.transform_batch(np.ascontiguousarray(point_clouds))
+    assert list(features.columns) == ['FailingFeature_0', 'FailingFeature_1',
+                                      'HolesNumberFeature_0', 'HolesNumberFeature_1']
+    assert not features.iloc[:, :2].values.any()
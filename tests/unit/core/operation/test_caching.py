@@ -1,4 +1,5 @@
 import os
+import tempfile
 import unittest
 
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
@@ -38,3 +39,37 @@ class TestDataCacher(unittest.TestCase):
 
         self.assertIsInstance(loaded_data, np.ndarray)
         self.assertTrue((self.data.values == loaded_data).all())
+
+    def test_hash_uses_whole_array(self):
+        data = np.zeros(10000)
+        changed_data = data.copy()
+        changed_data[5000] = 1
+        self.assertNotEqual(self.data_cacher.hash_info(data=data, name='data'),
+                            self.data_cacher.hash_info(data=changed_data, name='data'))
+
+    def test_load_data_as_memory_map(self):
+        data = np.random.rand(10, 5)
+        hashed_info = self.data_cacher.hash_info(data=data, name='mmap')
+        self.data_cacher.cache_data(hashed_info, data)
+        loaded_data = self.data_cacher.load_data_from_cache(hashed_info)
+
+        self.assertIsInstance(loaded_data, np.memmap)
+        self.assertTrue(np.array_equal(data, loaded_data))
+        self.assertEqual(self.data_cacher.stats['hits'], 1)
+        with self.assertRaises(FileNotFoundError):
+            self.data_cacher.load_data_from_cache('missing_entry')
+        self.assertEqual(self.data_cacher.stats['misses'], 1)
+
+    def test_lru_eviction(self):
+        with tempfile.TemporaryDirectory() as cache_folder:
+            data = np.random.rand(100)
+            data_cacher = DataCacher(cache_folder=cache_folder, max_size_bytes=int(2.5 * data.nbytes))
+            hashes = [data_cacher.hash_info(data=data, name=str(i)) for i in range(3)]
+            for i, hashed_info in enumerate(hashes):
+                data_cacher.cache_data(hashed_info, data)
+                os.utime(os.path.join(cache_folder, hashed_info + '.npy'), (i, i))
+
+            self.assertEqual(data_cacher.stats['evictions'], 1)
+            self.assertLessEqual(data_cacher.cache_size(), data_cacher.max_size_bytes)
+            with self.assertRaises(FileNotFoundError):
+                data_cacher.load_data_from_cache(hashes[0])
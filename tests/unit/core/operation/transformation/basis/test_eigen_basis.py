@@ -46,3 +46,15 @@ def test_transform_one_sample():
     assert isinstance(transformed_sample, np.ndarray)
     assert transformed_sample.shape[0] == basis.SV_threshold
     assert transformed_sample.shape[1] == len(sample)
+
+
+def test_transform_batch():
+    X_train, y_train, X_test, y_test = dataset_uni()
+    input_train_data = init_input_data(X_test, y_test)
+    basis = EigenBasisImplementation({'window_size': 30, 'low_rank_approximation': False})
+    basis.SV_threshold = 3
+    samples = input_train_data.features
+    transformed_batch = basis._transform_batch(samples)
+    transformed_samples = np.array([basis._transform_one_sample(sample) for sample in samples])
+    assert transformed_batch.shape == (samples.shape[0], basis.SV_threshold, samples.shape[1])
+    assert np.allclose(transformed_batch, transformed_samples)
@@ -2,7 +2,7 @@ import json
 
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
 import pytest
-from scipy.spatial.distance import pdist
+from scipy.spatial.distance import pdist, squareform
 
 from fedot_ind.api.utils.path_lib import PATH_TO_DEFAULT_PARAMS
 from fedot_ind.core.operation.transformation.data.kernel_matrix import TSTransformer
@@ -60,3 +60,22 @@ def test_get_recurrence_metrics(ts_transformer, params):
     matrix = ts_transformer.get_recurrence_metrics()
     assert matrix.shape[0] == matrix.shape[1]
     assert matrix.shape[0] == params['time_series'].shape[0]
+
+
+@pytest.mark.parametrize('rec_metric', ['cosine', 'euclidean'])
+def test_ts_to_recurrence_matrix_outputs(rec_metric):
+    points = np.random.rand(3, 200)
+    transformer = TSTransformer(time_series=points, rec_metric=rec_metric)
+    dense = transformer.ts_to_recurrence_matrix()
+    expected = squareform(transformer.binarization(1 - pdist(points.T, metric=rec_metric), threshold=None))
+
+    assert dense.dtype == bool
+    assert np.array_equal(dense, expected == 1)
+    assert np.array_equal(transformer.ts_to_recurrence_matrix(output='sparse').toarray(), dense)
+    assert np.array_equal(np.unpackbits(transformer.ts_to_recurrence_matrix(output='packed'),
+                                        axis=1, count=200).astype(bool), dense)
+
+
+def test_select_threshold(ts_transformer):
+    assert ts_transformer.select_threshold(np.linspace(0, 1, 100)) == 0.7
+    assert ts_transformer.select_threshold(np.ones(100)) == 0.95
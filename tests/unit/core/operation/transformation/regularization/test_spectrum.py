@@ -1,7 +1,7 @@
 import numpy as np
 import pytest
 
-from fedot_ind.core.operation.transformation.regularization.spectrum import reconstruct_basis, \
+from fedot_ind.core.operation.transformation.regularization.spectrum import diagonal_averaging, reconstruct_basis, \
     singular_value_hard_threshold, sv_to_explained_variance_ratio
 from fedot_ind.tools.synthetic.ts_generator import TimeSeriesGenerator
 
@@ -49,3 +49,16 @@ def test_reconstruct_basis(matrix_from_ts):
                                             ts_length=299)
     assert isinstance(reconstructed_basis, np.ndarray)
     assert reconstructed_basis.shape == (299, 30)
+
+
+def test_diagonal_averaging(matrix_from_ts):
+    U, S, VT = np.linalg.svd(matrix_from_ts, full_matrices=False)
+    components = diagonal_averaging(U, VT, S)
+    for i in range(S.shape[0]):
+        X_rev = (S[i] * np.outer(U[:, i], VT[i, :]))[::-1]
+        expected = [X_rev.diagonal(j).mean() for j in range(-X_rev.shape[0] + 1, X_rev.shape[1])]
+        assert np.allclose(components[:, i], expected)
+
+    batch_components = diagonal_averaging(np.stack([U, 2 * U]), np.stack([VT, VT]), np.stack([S, S]))
+    assert batch_components.shape == (2,) + components.shape
+    assert np.allclose(batch_components[1], 2 * components)
@@ -0,0 +1,76 @@
+import time
+from datetime import timedelta
+
+import pytest
+from golem.core.adapter import DirectAdapter
+from golem.core.optimisers.fitness import SingleObjFitness
+from golem.core.optimisers.graph import OptGraph, OptNode
+from golem.core.optimisers.opt_history_objects.individual import Individual
+
+from fedot_ind.core.architecture.settings.parallel_backend import WorkerPool
+from fedot_ind.core.repository.IndustrialDispatcher import estimate_evaluation_cost, IndustrialDispatcher
+
+
+def nodes_number_objective(graph):
+    if graph.root_node.name == 'slow':
+        time.sleep(30)
+    elif graph.root_node.name == 'moderate':
+        time.sleep(1.5)
+    return SingleObjFitness(len(graph.nodes))
+
+
+def failing_objective(graph):
+    raise ValueError('Evaluation failed')
+
+
+@pytest.fixture(autouse=True)
+def exact_n_jobs(monkeypatch):
+    # evaluate in workers even on machines with one CPU
+    monkeypatch.setattr('fedot_ind.core.repository.IndustrialDispatcher.determine_n_jobs',
+                        lambda n_jobs, logger: n_jobs)
+
+
+def population(*operations):
+    return [Individual(OptGraph(OptNode(name))) for name in operations]
+
+
+def test_estimate_evaluation_cost():
+    assert estimate_evaluation_cost(OptGraph(OptNode('inception_model'))) > \
+        estimate_evaluation_cost(OptGraph(OptNode('quantile_extractor')))
+
+
+@pytest.mark.parametrize('n_jobs', [1, 2])
+def test_evaluate_population(n_jobs):
+    dispatcher = IndustrialDispatcher(adapter=DirectAdapter(), n_jobs=n_jobs)
+    evaluate = dispatcher.dispatch(nodes_number_objective)
+    evaluated = evaluate(population('rf', 'logit', 'inception_model'))
+    assert len(evaluated) == 3
+    assert all(ind.fitness.value == 1 for ind in evaluated)
+
+
+def test_evaluate_population_timeout():
+    dispatcher = IndustrialDispatcher(adapter=DirectAdapter(), n_jobs=2,
+                                      individual_timeout=timedelta(seconds=3))
+    evaluate = dispatcher.dispatch(nodes_number_objective)
+    start_time = time.time()
+    evaluated = evaluate(population('slow', 'rf'))
+    assert time.time() - start_time < 30
+    assert [ind.graph.root_node.name for ind in evaluated] == ['rf']
+
+
+def test_evaluate_population_all_failed():
+    dispatcher = IndustrialDispatcher(adapter=DirectAdapter(), n_jobs=1)
+    evaluate = dispatcher.dispatch(failing_objective)
+    assert evaluate(population('rf', 'logit')) == []
+
+
+def test_evaluate_population_in_worker_pool():
+    # one worker for two jobs, so evaluations wait in the queue of the pool longer than the time limit
+    with WorkerPool(n_jobs=1, warm_start_modules=()) as pool:
+        executor = pool.executor
+        dispatcher = IndustrialDispatcher(adapter=DirectAdapter(), n_jobs=2,
+                                          individual_timeout=timedelta(seconds=4))
+        evaluate = dispatcher.dispatch(nodes_number_objective)
+        evaluated = evaluate(population('moderate', 'moderate', 'moderate', 'moderate'))
+        assert len(evaluated) == 4
+        assert pool.executor is executor
@@ -1,11 +1,12 @@
 import os
+import shutil
 
 import numpy as np
 import pandas as pd
 import pytest
 
 from fedot_ind.api.utils.path_lib import PROJECT_PATH
-from fedot_ind.tools.loader import DataLoader
+from fedot_ind.tools.loader import BINARY_CACHE_FOLDER, DataLoader, iter_ts_file
 
 ds_path = os.path.join(PROJECT_PATH, 'examples',
                        'data', 'ItalyPowerDemand_fake')
@@ -137,3 +138,69 @@ def test_read_train_test_files():
 
     for i in [x_train, y_train, x_test, y_test, is_multi]:
         assert i is not None
+
+
+def test_load_data_from_binary_cache(tmp_path, monkeypatch):
+    ds_name = 'ItalyPowerDemand_tsv'
+    shutil.copytree(os.path.join(PROJECT_PATH, 'tests', 'data', 'datasets', ds_name), tmp_path / ds_name)
+    loader = DataLoader(dataset_name=ds_name, folder=str(tmp_path))
+    (x_train, y_train), (x_test, y_test) = loader.load_data(shuffle=False)
+    assert os.path.isfile(tmp_path / ds_name / BINARY_CACHE_FOLDER / 'meta.json')
+
+    # text files are not parsed on the second load
+    monkeypatch.setattr(DataLoader, 'read_train_test_files', None)
+    (cached_x_train, cached_y_train), (cached_x_test, cached_y_test) = loader.load_data(shuffle=False)
+    pd.testing.assert_frame_equal(cached_x_train, x_train)
+    pd.testing.assert_frame_equal(cached_x_test, x_test)
+    assert np.array_equal(cached_y_train, y_train)
+    assert np.array_equal(cached_y_test, y_test)
+
+    # cache is rebuilt when data files change
+    os.utime(tmp_path / ds_name / f'{ds_name}_TEST.tsv', ns=(0, 0))
+    assert loader.load_from_binary_cache(str(tmp_path)) is None
+
+
+def test_binary_cache_is_validated_by_source_files(tmp_path):
+    ds_name = 'ItalyPowerDemand_tsv'
+    source_path, cache_path = tmp_path / 'source', tmp_path / 'cache'
+    shutil.copytree(os.path.join(PROJECT_PATH, 'tests', 'data', 'datasets', ds_name), source_path / ds_name)
+    loader = DataLoader(dataset_name=ds_name, folder=str(cache_path))
+    _, train_data, test_data = loader.read_train_test_files(str(source_path), ds_name, shuffle=False)
+    # downloaded data is cached in the folder of the loader, while its files are extracted elsewhere
+    loader.save_to_binary_cache(str(cache_path), train_data, test_data, source_path=str(source_path))
+    assert loader.load_from_binary_cache(str(cache_path)) is not None
+
+    os.utime(source_path / ds_name / f'{ds_name}_TEST.tsv', ns=(0, 0))
+    assert loader.load_from_binary_cache(str(cache_path)) is None
+
+
+def test_read_ts_file_equal_and_unequal_length(tmp_path):
+    header = '@problemName test\n@timestamps false\n@univariate false\n@classLabel true a b\n@data\n'
+    equal_path, unequal_path = tmp_path / 'equal.ts', tmp_path / 'unequal.ts'
+    equal_path.write_text(header + '1,2,3:4,5,6:a\n7,?,9:10,11,12:b\n')
+    unequal_path.write_text(header + '1,2,3:4,5:a\n6:7,8,9,10:b\n11,12:13:a\n')
+    loader = DataLoader(dataset_name='test')
+
+    features, target = loader.read_ts_file(str(equal_path))
+    assert features.shape == (2, 2, 3)
+    assert np.array_equal(features[1, 0], [7, np.nan, 9], equal_nan=True)
+    assert list(target) == ['a', 'b']
+
+    features, target = loader.read_ts_file(str(unequal_path))
+    assert isinstance(features, pd.DataFrame)
+    assert features.shape == (3, 2)
+    assert list(features.iloc[1, 1]) == [7, 8, 9, 10]
+    assert list(target) == ['a', 'b', 'a']
+    assert [len(samples) for samples, _ in iter_ts_file(str(unequal_path), batch_size=2)] == [2, 1]
+
+    # channels of unequal length with the same total length as channels of equal length
+    equal_total_path = tmp_path / 'equal_total.ts'
+    equal_total_path.write_text(header + '1,2,3:4,5,6,7,8:a\n1,2,3,4,5:6,7,8:b\n')
+    features, _ = loader.read_ts_file(str(equal_total_path))
+    assert isinstance(features, pd.DataFrame)
+    assert [[len(channel) for channel in sample] for sample in features.values] == [[3, 5], [5, 3]]
+
+    # equal length is not assumed when the header says otherwise
+    unequal_tag_path = tmp_path / 'unequal_tag.ts'
+    unequal_tag_path.write_text(header.replace('@data', '@equalLength false\n@data') + '1,2:3,4:a\n')
+    assert isinstance(loader.read_ts_file(str(unequal_tag_path))[0], pd.DataFrame)